@@ -18,6 +18,9 @@ from app.database import Base
 from app.models.user import User
 from app.models.api_key import ApiKey
 from app.models.api_call_log import ApiCallLog
+from app.models.api_usage_hourly import ApiUsageHourly
+from app.models.simulation_job import SimulationJob
+from app.models.cached_simulation_result import CachedSimulationResult
 
 # Alembic Config object (provides access to alembic.ini)
 config = context.config
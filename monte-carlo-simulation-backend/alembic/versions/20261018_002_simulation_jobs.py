@@ -0,0 +1,82 @@
+"""
+Simulation jobs table
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-18 00:00:00.000000
+
+Creates tables:
+- simulation_jobs: Asynchronous simulation jobs and their results
+
+Indexes:
+- Simulation job user_id
+- Simulation job status
+- Simulation job expires_at (retention purge)
+
+Constraints:
+- Simulation job status: CHECK (pending, running, completed, failed)
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# Revision identifiers
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Create simulation_jobs table
+    """
+
+    # ============================================================================
+    # CREATE TABLE: simulation_jobs
+    # ============================================================================
+    op.create_table(
+        'simulation_jobs',
+        sa.Column('id', sa.String(length=32), nullable=False),
+        sa.Column('user_id', sa.BigInteger(), nullable=False),
+        sa.Column('api_key', sa.String(length=255), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False, server_default='pending'),
+        sa.Column('request_payload', postgresql.JSONB(), nullable=False),
+        sa.Column('results', postgresql.JSONB(), nullable=True),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.Column('execution_time_seconds', sa.Float(), nullable=True),
+        sa.Column('created_at', sa.TIMESTAMP(timezone=True), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP')),
+        sa.Column('started_at', sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column('completed_at', sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column('expires_at', sa.TIMESTAMP(timezone=True), nullable=False),
+
+        # Primary Key
+        sa.PrimaryKeyConstraint('id', name='pk_simulation_jobs'),
+
+        # Foreign Keys
+        sa.ForeignKeyConstraint(
+            ['user_id'],
+            ['users.id'],
+            name='fk_simulation_jobs_user_id',
+            ondelete='CASCADE'  # Delete jobs when user is deleted
+        ),
+
+        # Check Constraints
+        sa.CheckConstraint(
+            "status IN ('pending', 'running', 'completed', 'failed')",
+            name='ck_simulation_jobs_status'
+        )
+    )
+
+    # Indexes for simulation_jobs table
+    op.create_index('ix_simulation_jobs_user_id', 'simulation_jobs', ['user_id'], unique=False)
+    op.create_index('ix_simulation_jobs_status', 'simulation_jobs', ['status'], unique=False)
+    op.create_index('ix_simulation_jobs_expires_at', 'simulation_jobs', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """
+    Drop simulation_jobs table
+    """
+    op.drop_table('simulation_jobs')
@@ -0,0 +1,67 @@
+"""
+Simulation result cache table
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-18 00:00:00.000000
+
+Creates tables:
+- simulation_result_cache: Shared tier of the simulation result cache
+
+Changes tables:
+- api_call_logs: Adds request_payload_hash (canonical request hash, also
+  the result cache key)
+
+Indexes:
+- Cache entry expires_at (purge)
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# Revision identifiers
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Create simulation_result_cache table, add api_call_logs.request_payload_hash
+    """
+
+    # ============================================================================
+    # CREATE TABLE: simulation_result_cache
+    # ============================================================================
+    op.create_table(
+        'simulation_result_cache',
+        sa.Column('cache_key', sa.String(length=64), nullable=False),
+        sa.Column('engine_version', sa.Integer(), nullable=False),
+        sa.Column('results', postgresql.JSONB(), nullable=False),
+        sa.Column('created_at', sa.TIMESTAMP(timezone=True), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP')),
+        sa.Column('expires_at', sa.TIMESTAMP(timezone=True), nullable=False),
+
+        # Primary Key
+        sa.PrimaryKeyConstraint('cache_key', name='pk_simulation_result_cache')
+    )
+
+    # Indexes for simulation_result_cache table
+    op.create_index('ix_simulation_result_cache_expires_at', 'simulation_result_cache', ['expires_at'], unique=False)
+
+    # ============================================================================
+    # ALTER TABLE: api_call_logs
+    # ============================================================================
+    op.add_column(
+        'api_call_logs',
+        sa.Column('request_payload_hash', sa.String(length=64), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    """
+    Drop simulation_result_cache table and api_call_logs.request_payload_hash
+    """
+    op.drop_column('api_call_logs', 'request_payload_hash')
+    op.drop_table('simulation_result_cache')
@@ -0,0 +1,246 @@
+"""
+Partition api_call_logs by month, add hourly usage rollup
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-18 00:00:00.000000
+
+Changes tables:
+- api_call_logs: Recreated as a monthly RANGE partitioned table on
+  created_at (partitions api_call_logs_yYYYYmMM plus api_call_logs_default),
+  existing rows copied
+
+Creates tables:
+- api_usage_hourly: Hourly per-user, per-API-key counts and latency
+  histograms, backfilled from the existing logs
+
+Indexes:
+- API call log user_id + created_at (composite); the single-column
+  user_id, created_at, status_code and endpoint indexes are dropped
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# Revision identifiers
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+# Latency histogram bucket upper bounds (ms) at the time of this migration
+# (ApiUsageService.LATENCY_BUCKETS_MS)
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000, 120000)
+
+# Monthly partitions created in advance of the current month
+PARTITION_MONTHS_AHEAD = 3
+
+LOG_COLUMNS = (
+    "id, user_id, api_key, endpoint, method, status_code, "
+    "execution_time_ms, error_message, request_payload_hash, created_at"
+)
+
+
+def _histogram_sql() -> str:
+    """ARRAY of per-bucket counts of timed calls, matching LATENCY_BUCKETS_MS"""
+    counts = []
+    lower = None
+    for upper in LATENCY_BUCKETS_MS + (None,):
+        conditions = ["execution_time_ms IS NOT NULL"]
+        if lower is not None:
+            conditions.append(f"execution_time_ms > {lower}")
+        if upper is not None:
+            conditions.append(f"execution_time_ms <= {upper}")
+        counts.append(f"count(*) FILTER (WHERE {' AND '.join(conditions)})")
+        lower = upper
+    return "ARRAY[" + ", ".join(counts) + "]::bigint[]"
+
+
+def upgrade() -> None:
+    """
+    Partition api_call_logs by month and create api_usage_hourly
+    """
+
+    # ============================================================================
+    # SET ASIDE: unpartitioned api_call_logs
+    # ============================================================================
+    op.drop_index('ix_api_call_logs_user_created', table_name='api_call_logs')
+    op.drop_index('ix_api_call_logs_endpoint', table_name='api_call_logs')
+    op.drop_index('ix_api_call_logs_status_code', table_name='api_call_logs')
+    op.drop_index('ix_api_call_logs_created_at', table_name='api_call_logs')
+    op.drop_index('ix_api_call_logs_user_id', table_name='api_call_logs')
+    op.rename_table('api_call_logs', 'api_call_logs_unpartitioned')
+    op.execute(
+        "ALTER TABLE api_call_logs_unpartitioned "
+        "RENAME CONSTRAINT pk_api_call_logs TO pk_api_call_logs_unpartitioned"
+    )
+
+    # ============================================================================
+    # CREATE TABLE: api_call_logs (partitioned)
+    # ============================================================================
+    op.create_table(
+        'api_call_logs',
+        # Keeps the existing id sequence
+        sa.Column('id', sa.BigInteger(), nullable=False, server_default=sa.text("nextval('api_call_logs_id_seq')")),
+        sa.Column('user_id', sa.BigInteger(), nullable=False),
+        sa.Column('api_key', sa.String(length=255), nullable=False),
+        sa.Column('endpoint', sa.String(length=255), nullable=False),
+        sa.Column('method', sa.String(length=10), nullable=False),
+        sa.Column('status_code', sa.Integer(), nullable=False),
+        sa.Column('execution_time_ms', sa.Float(), nullable=True),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.Column('request_payload_hash', sa.String(length=64), nullable=True),
+        sa.Column('created_at', sa.TIMESTAMP(timezone=True), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP')),
+
+        # Primary Key (must include the partition column)
+        sa.PrimaryKeyConstraint('id', 'created_at', name='pk_api_call_logs'),
+
+        # Foreign Keys
+        sa.ForeignKeyConstraint(
+            ['user_id'],
+            ['users.id'],
+            name='fk_api_call_logs_user_id',
+            ondelete='CASCADE'  # Delete logs when user is deleted
+        ),
+
+        postgresql_partition_by='RANGE (created_at)'
+    )
+    op.execute("ALTER SEQUENCE api_call_logs_id_seq OWNED BY api_call_logs.id")
+
+    # Composite index for analytics queries: user + date range (created on every partition)
+    op.create_index(
+        'ix_api_call_logs_user_created',
+        'api_call_logs',
+        ['user_id', 'created_at'],
+        unique=False
+    )
+
+    # Monthly partitions from the oldest existing row through PARTITION_MONTHS_AHEAD
+    op.execute(f"""
+        DO $$
+        DECLARE
+            month date := date_trunc('month', coalesce(
+                (SELECT min(created_at) FROM api_call_logs_unpartitioned), now()
+            ) AT TIME ZONE 'UTC')::date;
+            last_month date := (date_trunc('month', now() AT TIME ZONE 'UTC')
+                + interval '{PARTITION_MONTHS_AHEAD} months')::date;
+        BEGIN
+            WHILE month <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF api_call_logs FOR VALUES FROM (%L) TO (%L)',
+                    'api_call_logs_y' || to_char(month, 'YYYY') || 'm' || to_char(month, 'MM'),
+                    month::text || ' 00:00:00+00',
+                    (month + interval '1 month')::date::text || ' 00:00:00+00'
+                );
+                month := (month + interval '1 month')::date;
+            END LOOP;
+        END $$
+    """)
+    op.execute("CREATE TABLE api_call_logs_default PARTITION OF api_call_logs DEFAULT")
+
+    op.execute(
+        f"INSERT INTO api_call_logs ({LOG_COLUMNS}) "
+        f"SELECT {LOG_COLUMNS} FROM api_call_logs_unpartitioned"
+    )
+
+
+    # ============================================================================
+    # CREATE TABLE: api_usage_hourly
+    # ============================================================================
+    op.create_table(
+        'api_usage_hourly',
+        sa.Column('bucket_start', sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.Column('user_id', sa.BigInteger(), nullable=False),
+        sa.Column('api_key', sa.String(length=255), nullable=False),
+        sa.Column('call_count', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('success_count', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('client_error_count', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('server_error_count', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('total_execution_time_ms', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('max_execution_time_ms', sa.Float(), nullable=True),
+        sa.Column('latency_histogram', sa.ARRAY(sa.BigInteger()), nullable=False),
+
+        # Primary Key (also serves user + hour range queries)
+        sa.PrimaryKeyConstraint('user_id', 'bucket_start', 'api_key', name='pk_api_usage_hourly'),
+
+        # Foreign Keys
+        sa.ForeignKeyConstraint(
+            ['user_id'],
+            ['users.id'],
+            name='fk_api_usage_hourly_user_id',
+            ondelete='CASCADE'
+        )
+    )
+
+    # Backfill from the existing logs
+    op.execute(f"""
+        INSERT INTO api_usage_hourly (
+            bucket_start, user_id, api_key, call_count, success_count,
+            client_error_count, server_error_count, total_execution_time_ms,
+            max_execution_time_ms, latency_histogram
+        )
+        SELECT
+            date_trunc('hour', created_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC', user_id, api_key, count(*),
+            count(*) FILTER (WHERE status_code BETWEEN 200 AND 299),
+            count(*) FILTER (WHERE status_code BETWEEN 400 AND 499),
+            count(*) FILTER (WHERE status_code >= 500),
+            coalesce(sum(execution_time_ms), 0),
+            max(execution_time_ms),
+            {_histogram_sql()}
+        FROM api_call_logs_unpartitioned
+        GROUP BY 1, 2, 3
+    """)
+
+    op.drop_table('api_call_logs_unpartitioned')
+
+
+def downgrade() -> None:
+    """
+    Drop api_usage_hourly and restore the unpartitioned api_call_logs
+    """
+    op.drop_table('api_usage_hourly')
+
+    op.rename_table('api_call_logs', 'api_call_logs_partitioned')
+    op.execute(
+        "ALTER TABLE api_call_logs_partitioned "
+        "RENAME CONSTRAINT pk_api_call_logs TO pk_api_call_logs_partitioned"
+    )
+    op.drop_index('ix_api_call_logs_user_created', table_name='api_call_logs_partitioned')
+
+    op.create_table(
+        'api_call_logs',
+        sa.Column('id', sa.BigInteger(), nullable=False, server_default=sa.text("nextval('api_call_logs_id_seq')")),
+        sa.Column('user_id', sa.BigInteger(), nullable=False),
+        sa.Column('api_key', sa.String(length=255), nullable=False),
+        sa.Column('endpoint', sa.String(length=255), nullable=False),
+        sa.Column('method', sa.String(length=10), nullable=False),
+        sa.Column('status_code', sa.Integer(), nullable=False),
+        sa.Column('execution_time_ms', sa.Float(), nullable=True),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.Column('request_payload_hash', sa.String(length=64), nullable=True),
+        sa.Column('created_at', sa.TIMESTAMP(timezone=True), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP')),
+        sa.PrimaryKeyConstraint('id', name='pk_api_call_logs'),
+        sa.ForeignKeyConstraint(
+            ['user_id'],
+            ['users.id'],
+            name='fk_api_call_logs_user_id',
+            ondelete='CASCADE'
+        )
+    )
+    op.execute("ALTER SEQUENCE api_call_logs_id_seq OWNED BY api_call_logs.id")
+    op.execute(
+        f"INSERT INTO api_call_logs ({LOG_COLUMNS}) "
+        f"SELECT {LOG_COLUMNS} FROM api_call_logs_partitioned"
+    )
+    op.drop_table('api_call_logs_partitioned')
+
+    op.create_index('ix_api_call_logs_user_id', 'api_call_logs', ['user_id'], unique=False)
+    op.create_index('ix_api_call_logs_created_at', 'api_call_logs', ['created_at'], unique=False)
+    op.create_index('ix_api_call_logs_status_code', 'api_call_logs', ['status_code'], unique=False)
+    op.create_index('ix_api_call_logs_endpoint', 'api_call_logs', ['endpoint'], unique=False)
+    op.create_index(
+        'ix_api_call_logs_user_created',
+        'api_call_logs',
+        ['user_id', 'created_at'],
+        unique=False
+    )
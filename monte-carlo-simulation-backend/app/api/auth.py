@@ -10,6 +10,8 @@ from app.database import get_db
 from app.schemas.user import UserRegister, UserLogin, UserResponse
 from app.schemas.auth import Token
 from app.services.auth_service import AuthService
+from app.middleware.auth_middleware import get_current_user
+from app.models.user import User
 
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
@@ -107,12 +109,13 @@ async def login(
 
     **Errors:**
     - 401: Invalid or expired token
+    - 403: User account is inactive or suspended
     - 404: User not found
     """
 )
 async def get_current_user_info(
-    db: AsyncSession = Depends(get_db),
-    current_user = Depends(AuthService.get_user_by_id)
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ) -> UserResponse:
     """
     Get current authenticated user details
@@ -120,4 +123,6 @@ async def get_current_user_info(
     This endpoint can be used to verify token validity
     and retrieve user information
     """
-    return UserResponse.model_validate(current_user)
+    # With JWT_TRUST_CLAIMS the current user only carries the token claims
+    user = await AuthService.get_cached_user(current_user.id, db)
+    return UserResponse.model_validate(user)
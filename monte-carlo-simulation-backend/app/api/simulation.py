@@ -3,17 +3,31 @@ Monte Carlo Simulation API Endpoint
 Main simulation endpoint for portfolio analysis
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timezone
 import uuid
 
 from app.database import get_db
-from app.schemas.simulation import SimulationRequest, SimulationResponse
+from app.schemas.simulation import (
+    SimulationRequest,
+    SimulationBatchRequest,
+    SimulationSweepRequest,
+    SimulationResponse,
+    SimulationJobResponse,
+    SimulationBatchItem,
+    SimulationStreamEvent,
+    SimulationSweepResponse
+)
 from app.services.monte_carlo import MonteCarloService
+from app.services.simulation_job_service import SimulationJobService
+from app.services.simulation_batch_service import SimulationBatchService
+from app.services.result_cache import simulation_result_cache
 from app.middleware.auth_middleware import get_current_api_key
 from app.models.api_key import ApiKey
-from app.models.api_call_log import ApiCallLog
+from app.services.api_call_logger import api_call_logger
+from app.utils.serialization import MSGPACK_MEDIA_TYPE, accepts_msgpack, packb, to_jsonable
 import time
 
 
@@ -45,7 +59,45 @@ router = APIRouter(prefix="/api/v1", tags=["Simulation"])
     - Final portfolio value statistics (mean, median, percentiles)
     - Risk metrics (VaR, CVaR, Sharpe Ratio)
     - Probabilities (loss, positive return, doubling)
-    - Sample paths for visualization
+    - Standard errors of the estimates (Monte Carlo precision)
+    - Sample paths for visualization (one point per `time_step`: daily,
+      weekly, monthly or annual; coarser steps are faster and give the same
+      terminal distribution)
+
+    **Contributions:** `monthly_contribution` is deposited at each month end
+    and compounds along each simulated path (stepped engine; `auto` steps
+    monthly when no sample paths are requested).
+
+    **Engines:** `auto` (default), `exact`, `stepped`, or `qmc` (scrambled
+    Sobol quasi-Monte Carlo: error falls ~10x per 10x paths instead of ~3x)
+
+    **Variance Reduction (optional):**
+    - `antithetic`: mirrored path pairs
+    - `control_variate`: adjustment by the analytic GBM terminal mean
+    Both lower the reported standard errors at the same path count.
+
+    **Adaptive Path Count (optional):**
+    With `target_relative_error` set, paths are simulated in batches until the
+    standard error of every metric in `target_metrics` (default `var_95`) is
+    below that fraction of its estimate. `num_simulations` is then the
+    maximum; `paths_used` and `adaptive.converged` report the outcome.
+
+    **Caching:**
+    Requests with an explicit `seed` are deterministic; identical requests are
+    served from the result cache (response header `X-Cache: HIT`). Unseeded
+    requests are never cached (`X-Cache: BYPASS`).
+
+    **Response Formats** (from the `Accept` header):
+    - `application/json` (default): `sample_paths` as nested lists
+    - `application/x-msgpack`: same fields in MessagePack, with `sample_paths`
+      and `terminal_distribution` as binary buffers
+      (`{"dtype": "<f8", "shape": [paths, points], "data": <bytes>}`), written
+      straight from the simulation arrays
+
+    **Terminal Distribution (optional):**
+    With `return_distribution` set, `terminal_distribution` holds every
+    terminal value as a little-endian float32 buffer (base64 `data` in JSON),
+    so clients can compute their own metrics without another call.
 
     **Example Request:**
     ```json
@@ -71,11 +123,15 @@ router = APIRouter(prefix="/api/v1", tags=["Simulation"])
     **Errors:**
     - 400: Invalid portfolio (weights don't sum to 1.0) or parameters
     - 401: Invalid, expired, or revoked API key
+    - 429: Simulation workers busy (retry after the `Retry-After` delay)
     - 500: Simulation error or server error
+    - 504: Simulation exceeded the time limit
     """
 )
 async def run_simulation(
     request: SimulationRequest,
+    http_request: Request,
+    response: Response,
     api_key: ApiKey = Depends(get_current_api_key),
     db: AsyncSession = Depends(get_db)
 ) -> SimulationResponse:
@@ -84,41 +140,69 @@ async def run_simulation(
 
     Steps:
         1. Validate API key (done by dependency)
-        2. Run Monte Carlo simulation
-        3. Log API call
-        4. Return results
+        2. Look up result cache (seeded requests only)
+        3. Run Monte Carlo simulation on cache miss
+        4. Log API call (buffered, written in batches)
+        5. Return results
 
     Args:
         request: Simulation request with portfolio and parameters
+        http_request: Raw HTTP request (Accept header, client disconnects)
+        response: Outgoing response (used to set the X-Cache header)
         api_key: Validated API key (from dependency)
         db: Database session
 
     Returns:
-        SimulationResponse with comprehensive results
+        SimulationResponse with comprehensive results (MessagePack Response
+        when the client accepts application/x-msgpack)
     """
     start_time = time.time()
     simulation_id = f"sim_{uuid.uuid4().hex[:12]}"
+    request_hash = simulation_result_cache.hash_request(request)
+    cache_key = simulation_result_cache.cache_key(request)
 
     try:
-        # Run Monte Carlo simulation
-        results = await MonteCarloService.run_simulation(request)
+        results = await simulation_result_cache.get(cache_key, db)
+
+        if results is None:
+            # Run Monte Carlo simulation (in the worker pool, off the event loop)
+            results = await MonteCarloService.run_simulation(
+                request,
+                is_disconnected=http_request.is_disconnected
+            )
+            await simulation_result_cache.put(cache_key, results, db)
+            response.headers["X-Cache"] = "MISS" if cache_key else "BYPASS"
+        else:
+            response.headers["X-Cache"] = "HIT"
 
         # Calculate execution time
         execution_time = time.time() - start_time
 
         # Log API call (successful)
-        log_entry = ApiCallLog(
+        api_call_logger.log(
             user_id=api_key.user_id,
             api_key=api_key.key,
             endpoint="/api/v1/simulate",
             method="POST",
+            request_payload_hash=request_hash,
             status_code=200,
             execution_time_ms=execution_time * 1000,  # Convert to milliseconds
-            error_message=None,
-            created_at=datetime.now(timezone.utc)
+            error_message=None
         )
-        db.add(log_entry)
-        await db.commit()
+
+        if accepts_msgpack(http_request.headers.get("accept")):
+            # Binary response: array fields go out as raw buffers
+            return Response(
+                content=packb({
+                    "simulation_id": simulation_id,
+                    "status": "completed",
+                    "created_at": datetime.now(timezone.utc).isoformat(),
+                    "execution_time_seconds": execution_time,
+                    "results": results
+                }),
+                media_type=MSGPACK_MEDIA_TYPE,
+                headers={"X-Cache": response.headers["X-Cache"]}
+            )
 
         # Return simulation results
         return SimulationResponse(
@@ -126,7 +210,7 @@ async def run_simulation(
             status="completed",
             created_at=datetime.now(timezone.utc),
             execution_time_seconds=execution_time,
-            results=results
+            results=to_jsonable(results)
         )
 
     except HTTPException:
@@ -137,18 +221,16 @@ async def run_simulation(
         # Log failed API call
         execution_time = time.time() - start_time
 
-        log_entry = ApiCallLog(
+        api_call_logger.log(
             user_id=api_key.user_id,
             api_key=api_key.key,
             endpoint="/api/v1/simulate",
             method="POST",
+            request_payload_hash=request_hash,
             status_code=500,
             execution_time_ms=execution_time * 1000,
-            error_message=str(e),
-            created_at=datetime.now(timezone.utc)
+            error_message=str(e)
         )
-        db.add(log_entry)
-        await db.commit()
 
         # Return error response
         raise HTTPException(
@@ -157,6 +239,480 @@ async def run_simulation(
         )
 
 
+@router.post(
+    "/simulate/stream",
+    response_class=StreamingResponse,
+    summary="Run Monte Carlo Simulation (progressive results)",
+    description="""
+    Run a `/api/v1/simulate` request and stream interim statistics while it
+    runs, so charts can be drawn from the first batch of paths and refined
+    as more arrive.
+
+    **Authentication Required:** API Key in `X-API-Key` header
+
+    **How It Works:**
+    1. Paths are simulated in batches (1,000 paths, then doubling up to
+       `num_simulations`; adaptive requests follow their own batches)
+    2. After each batch, a `progress` event reports the statistics of the
+       paths so far (`paths_completed`, `results` without sample paths)
+    3. The last event is the `result`, identical to `/api/v1/simulate` for
+       the same request and seed
+    4. Cached results (seeded requests) are sent as the `result` right away
+
+    **Response format** (from the `Accept` header):
+    - `text/event-stream`: server-sent events (`event: progress`,
+      `event: result` or `event: error`, JSON in `data`)
+    - otherwise `application/x-ndjson`: one JSON object per line, with `type`
+
+    A failure after the stream has started (workers busy, time limit) is
+    sent as an `error` event with its `status_code`.
+
+    **Errors:**
+    - 401: Invalid, expired, or revoked API key
+    - 422: Invalid portfolio or parameters
+    """
+)
+async def run_simulation_stream(
+    request: SimulationRequest,
+    http_request: Request,
+    api_key: ApiKey = Depends(get_current_api_key),
+    db: AsyncSession = Depends(get_db)
+) -> StreamingResponse:
+    """
+    Run Monte Carlo simulation, streaming interim statistics and the final result
+
+    Args:
+        request: Simulation request with portfolio and parameters
+        http_request: Raw HTTP request (Accept header, client disconnects)
+        api_key: Validated API key (from dependency)
+        db: Database session
+
+    Returns:
+        StreamingResponse of SimulationStreamEvent (NDJSON lines or server-sent events)
+    """
+    start_time = time.time()
+    simulation_id = f"sim_{uuid.uuid4().hex[:12]}"
+    request_hash = simulation_result_cache.hash_request(request)
+    cache_key = simulation_result_cache.cache_key(request)
+    num_simulations = request.parameters.num_simulations
+    server_sent_events = "text/event-stream" in http_request.headers.get("accept", "")
+
+    def format_event(event: SimulationStreamEvent) -> str:
+        payload = event.model_dump_json(exclude_none=True)
+        if server_sent_events:
+            return f"event: {event.type}\ndata: {payload}\n\n"
+        return payload + "\n"
+
+    cached_results = await simulation_result_cache.get(cache_key, db)
+    cache = "HIT" if cached_results is not None else ("MISS" if cache_key else "BYPASS")
+
+    async def cached_events():
+        yield 'result', cached_results
+
+    async def stream_events():
+        status_code = 200
+        error_message = None
+
+        if cached_results is not None:
+            events = cached_events()
+        else:
+            events = MonteCarloService.stream_simulation(
+                request, is_disconnected=http_request.is_disconnected
+            )
+
+        try:
+            async for kind, results in events:
+                if kind == 'result' and cached_results is None:
+                    await simulation_result_cache.put(cache_key, results, db)
+                yield format_event(SimulationStreamEvent(
+                    type=kind,
+                    simulation_id=simulation_id,
+                    status="running" if kind == 'progress' else "completed",
+                    paths_completed=results['paths_used'],
+                    num_simulations=num_simulations,
+                    cache=cache if kind == 'result' else None,
+                    results=to_jsonable(results),
+                    execution_time_seconds=time.time() - start_time
+                ))
+        except Exception as e:
+            if isinstance(e, HTTPException):
+                status_code = e.status_code
+                error_message = str(e.detail)
+            else:
+                status_code = 500
+                error_message = f"Simulation failed: {str(e)}"
+            yield format_event(SimulationStreamEvent(
+                type="error",
+                simulation_id=simulation_id,
+                status="failed",
+                num_simulations=num_simulations,
+                error_message=error_message,
+                status_code=status_code,
+                execution_time_seconds=time.time() - start_time
+            ))
+
+        # Log API call (one entry per stream)
+        execution_time = time.time() - start_time
+        api_call_logger.log(
+            user_id=api_key.user_id,
+            api_key=api_key.key,
+            endpoint="/api/v1/simulate/stream",
+            method="POST",
+            request_payload_hash=request_hash,
+            status_code=status_code,
+            execution_time_ms=execution_time * 1000,
+            error_message=error_message
+        )
+
+    return StreamingResponse(
+        stream_events(),
+        media_type="text/event-stream" if server_sent_events else "application/x-ndjson",
+        headers={"X-Cache": cache, "Cache-Control": "no-cache"}
+    )
+
+
+@router.post(
+    "/simulate/batch",
+    response_class=StreamingResponse,
+    summary="Run a batch of Monte Carlo simulations",
+    description="""
+    Run several simulations (portfolios or parameter sets) in one call and
+    stream the results back as they finish.
+
+    **Authentication Required:** API Key in `X-API-Key` header (checked once per batch)
+
+    **How It Works:**
+    1. Each request in `requests` is a `/api/v1/simulate` request body (1-100)
+    2. Seeded requests are served from the result cache when possible
+    3. The rest run in parallel on the simulation workers; requests with the
+       same seed and path layout (engine, horizon, `time_step`, paths) share
+       their random draws, so each extra portfolio costs little more than
+       its statistics (results are identical to separate calls)
+    4. Requests without a `seed` share one seed drawn for the batch (common
+       random numbers: differences between portfolios are not noise)
+    5. One API call log entry is written for the whole batch
+
+    **Response:** `application/x-ndjson`, one JSON object per line:
+    - `type: "result"` lines in completion order, with `index` (position in
+      `requests`), `status` (`completed`/`failed`), `cache`, and `results`
+      or `error_message`
+    - a final `type: "summary"` line with `completed`, `failed` and
+      `execution_time_seconds`
+
+    A request that fails (e.g. workers busy or time limit) is reported on its
+    own line; the other results are unaffected.
+
+    **Errors:**
+    - 401: Invalid, expired, or revoked API key
+    - 422: Invalid portfolio or parameters in any request
+    """
+)
+async def run_simulation_batch(
+    batch: SimulationBatchRequest,
+    http_request: Request,
+    api_key: ApiKey = Depends(get_current_api_key),
+    db: AsyncSession = Depends(get_db)
+) -> StreamingResponse:
+    """
+    Run a batch of Monte Carlo simulations, streaming results as they finish
+
+    Args:
+        batch: Batch of simulation requests
+        http_request: Raw HTTP request (used to detect client disconnects)
+        api_key: Validated API key (from dependency)
+        db: Database session
+
+    Returns:
+        StreamingResponse of SimulationBatchItem lines (NDJSON)
+    """
+    start_time = time.time()
+    batch_id = f"batch_{uuid.uuid4().hex[:12]}"
+    request_hash = SimulationBatchService.hash_batch(batch.requests)
+
+    async def stream_results():
+        completed = 0
+        failed = 0
+        status_code = 200
+        error_message = None
+
+        try:
+            async for item in SimulationBatchService.run_batch(
+                batch.requests, db, is_disconnected=http_request.is_disconnected
+            ):
+                if item.status == "completed":
+                    completed += 1
+                else:
+                    failed += 1
+                    error_message = error_message or item.error_message
+                yield item.model_dump_json(exclude_none=True) + "\n"
+        except Exception as e:
+            status_code = 500
+            error_message = f"Batch failed: {str(e)}"
+
+        if status_code == 200 and failed:
+            error_message = f"{failed} of {len(batch.requests)} simulations failed: {error_message}"
+
+        # Log API call (one entry per batch)
+        execution_time = time.time() - start_time
+        api_call_logger.log(
+            user_id=api_key.user_id,
+            api_key=api_key.key,
+            endpoint="/api/v1/simulate/batch",
+            method="POST",
+            request_payload_hash=request_hash,
+            status_code=status_code,
+            execution_time_ms=execution_time * 1000,
+            error_message=error_message
+        )
+
+        summary = SimulationBatchItem(
+            type="summary",
+            simulation_id=batch_id,
+            status="completed" if status_code == 200 else "failed",
+            error_message=error_message if status_code != 200 else None,
+            completed=completed,
+            failed=failed,
+            execution_time_seconds=execution_time
+        )
+        yield summary.model_dump_json(exclude_none=True) + "\n"
+
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
+
+@router.post(
+    "/simulate/sweep",
+    response_model=SimulationSweepResponse,
+    summary="Run a parameter sweep",
+    description="""
+    Evaluate a base simulation request over a grid of parameter values.
+
+    **Authentication Required:** API Key in `X-API-Key` header
+
+    **Axes** (the grid is their cartesian product, at most 200 points):
+    - `time_horizon_years`: list of horizons
+    - `monthly_contribution`: list of contribution amounts
+    - `allocation`: `ticker` and a list of `weights` for that asset; the other
+      assets are rescaled proportionally to fill the rest
+
+    **Common Random Numbers:**
+    Every point uses the same seed (the base `seed`, or one drawn for the
+    sweep) and the same engine, so differences between points reflect the
+    parameters rather than sampling noise. The random shocks are generated
+    once for the whole grid (one pass to the longest horizon) and re-weighted
+    per allocation and re-aggregated per contribution amount. Each point's
+    results equal a `/api/v1/simulate` call with the same seed.
+
+    **Example Request:**
+    ```json
+    {
+      "base": {
+        "portfolio": {
+          "assets": [
+            {"ticker": "NSEI Index", "weight": 0.6, "asset_class": "equity"},
+            {"ticker": "GIND10YR Index", "weight": 0.4, "asset_class": "bonds"}
+          ]
+        },
+        "parameters": {
+          "initial_investment": 1000000,
+          "time_horizon_years": 10,
+          "num_simulations": 10000
+        }
+      },
+      "axes": {
+        "time_horizon_years": [5, 10, 20],
+        "monthly_contribution": [0, 25000, 50000],
+        "allocation": {"ticker": "NSEI Index", "weights": [0.4, 0.6, 0.8]}
+      }
+    }
+    ```
+
+    **Errors:**
+    - 401: Invalid, expired, or revoked API key
+    - 422: Invalid base request, axes, or grid point
+    - 429: Simulation workers busy (retry after the `Retry-After` delay)
+    - 500: Simulation error or server error
+    - 504: Sweep exceeded the time limit
+    """
+)
+async def run_simulation_sweep(
+    sweep: SimulationSweepRequest,
+    http_request: Request,
+    api_key: ApiKey = Depends(get_current_api_key),
+    db: AsyncSession = Depends(get_db)
+) -> SimulationSweepResponse:
+    """
+    Run a parameter sweep with common random numbers
+
+    Args:
+        sweep: Base request and axes to vary
+        http_request: Raw HTTP request (used to detect client disconnects)
+        api_key: Validated API key (from dependency)
+        db: Database session
+
+    Returns:
+        SimulationSweepResponse with results per grid point
+    """
+    start_time = time.time()
+    sweep_id = f"sweep_{uuid.uuid4().hex[:12]}"
+    request_hash = SimulationBatchService.hash_sweep(sweep)
+
+    try:
+        seed, points = await SimulationBatchService.run_sweep(
+            sweep,
+            is_disconnected=http_request.is_disconnected
+        )
+        execution_time = time.time() - start_time
+
+        failed = [point for point in points if point.status == "failed"]
+        error_message = None
+        if failed:
+            error_message = f"{len(failed)} of {len(points)} sweep points failed: {failed[0].error_message}"
+
+        # Log API call (one entry per sweep)
+        api_call_logger.log(
+            user_id=api_key.user_id,
+            api_key=api_key.key,
+            endpoint="/api/v1/simulate/sweep",
+            method="POST",
+            request_payload_hash=request_hash,
+            status_code=200,
+            execution_time_ms=execution_time * 1000,
+            error_message=error_message
+        )
+
+        return SimulationSweepResponse(
+            sweep_id=sweep_id,
+            status="failed" if len(failed) == len(points) else "completed",
+            created_at=datetime.now(timezone.utc),
+            execution_time_seconds=execution_time,
+            seed=seed,
+            points=points
+        )
+
+    except HTTPException:
+        # Re-raise HTTP exceptions
+        raise
+
+    except Exception as e:
+        # Log failed API call
+        execution_time = time.time() - start_time
+
+        api_call_logger.log(
+            user_id=api_key.user_id,
+            api_key=api_key.key,
+            endpoint="/api/v1/simulate/sweep",
+            method="POST",
+            request_payload_hash=request_hash,
+            status_code=500,
+            execution_time_ms=execution_time * 1000,
+            error_message=str(e)
+        )
+
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Sweep failed: {str(e)}"
+        )
+
+
+@router.post(
+    "/simulations",
+    response_model=SimulationJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Submit asynchronous simulation job",
+    description="""
+    Submit a Monte Carlo simulation to run in the background.
+
+    **Authentication Required:** API Key in `X-API-Key` header
+
+    Use this for long simulations (e.g. 100,000 paths over 30+ years) that
+    would exceed HTTP timeouts on `/api/v1/simulate`. The request body is the
+    same as `/api/v1/simulate`.
+
+    **How It Works:**
+    1. Returns immediately with a `simulation_id` and status `pending`
+    2. Poll `GET /api/v1/simulations/{simulation_id}` until status is
+       `completed` (results included) or `failed` (error_message included)
+    3. Results are kept for 24 hours (configurable), then deleted
+
+    **Errors:**
+    - 401: Invalid, expired, or revoked API key
+    - 422: Invalid portfolio or parameters
+    - 429: Too many pending jobs (retry after the `Retry-After` delay)
+    """
+)
+async def submit_simulation_job(
+    request: SimulationRequest,
+    api_key: ApiKey = Depends(get_current_api_key),
+    db: AsyncSession = Depends(get_db)
+) -> SimulationJobResponse:
+    """
+    Submit an asynchronous simulation job
+
+    Args:
+        request: Simulation request with portfolio and parameters
+        api_key: Validated API key (from dependency)
+        db: Database session
+
+    Returns:
+        SimulationJobResponse with status 'pending'
+    """
+    start_time = time.time()
+    job = await SimulationJobService.create_job(request, api_key, db)
+
+    # Log API call (job accepted)
+    api_call_logger.log(
+        user_id=api_key.user_id,
+        api_key=api_key.key,
+        endpoint="/api/v1/simulations",
+        method="POST",
+        status_code=202,
+        execution_time_ms=(time.time() - start_time) * 1000,
+        error_message=None
+    )
+
+    return SimulationJobService.to_response(job)
+
+
+@router.get(
+    "/simulations/{simulation_id}",
+    response_model=SimulationJobResponse,
+    summary="Get simulation job status and results",
+    description="""
+    Get the status of an asynchronous simulation job, with results once completed.
+
+    **Authentication Required:** API Key in `X-API-Key` header
+
+    **Status Values:**
+    - `pending`: Waiting for a worker
+    - `running`: Simulation in progress
+    - `completed`: `results` contains the simulation results
+    - `failed`: `error_message` contains the failure reason
+
+    **Errors:**
+    - 401: Invalid, expired, or revoked API key
+    - 404: Unknown or expired simulation, or owned by another user
+    """
+)
+async def get_simulation_job(
+    simulation_id: str,
+    api_key: ApiKey = Depends(get_current_api_key),
+    db: AsyncSession = Depends(get_db)
+) -> SimulationJobResponse:
+    """
+    Get simulation job status and results
+
+    Args:
+        simulation_id: Job identifier returned on submission
+        api_key: Validated API key (from dependency)
+        db: Database session
+
+    Returns:
+        SimulationJobResponse
+    """
+    job = await SimulationJobService.get_job(simulation_id, api_key.user_id, db)
+    return SimulationJobService.to_response(job)
+
+
 @router.get(
     "/health",
     summary="Health check",
@@ -39,6 +39,7 @@ class Settings(BaseSettings):
     JWT_SECRET_KEY: str  # Required - generate with: openssl rand -hex 32
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRATION_HOURS: int = 24
+    JWT_TRUST_CLAIMS: bool = False  # Trust token claims for their lifetime (no user lookup)
 
     # ============================================
     # API Key Configuration
@@ -63,6 +64,66 @@ class Settings(BaseSettings):
     BLOOMBERG_ENABLED: bool = False
     BLOOMBERG_API_KEY: str = ""
 
+    # ============================================
+    # Simulation Worker Pool
+    # ============================================
+    SIMULATION_POOL_SIZE: int = 2  # Worker processes (0 = run in a thread, no pool)
+    SIMULATION_QUEUE_SIZE: int = 8  # Queued requests beyond busy workers before 429
+    SIMULATION_TIMEOUT_SECONDS: float = 120.0  # Per-request timeout
+    SIMULATION_RETRY_AFTER_SECONDS: int = 5  # Retry-After header on 429
+    SIMULATION_SWEEP_CHUNK_SIZE: int = 10  # Sweep grid points per worker pool task
+    NUMBA_CACHE_DIR: str = ""  # On-disk JIT cache shared by workers ("" = __pycache__)
+
+    # ============================================
+    # Asynchronous Simulation Jobs
+    # ============================================
+    SIMULATION_JOB_WORKERS: int = 2  # Concurrent jobs per application process
+    SIMULATION_JOB_QUEUE_SIZE: int = 100  # Pending jobs per process before 429
+    SIMULATION_JOB_TIMEOUT_SECONDS: float = 1800.0  # Per-job timeout
+    SIMULATION_JOB_RETENTION_HOURS: int = 24  # Results kept for this long
+
+    # ============================================
+    # Simulation Result Cache
+    # ============================================
+    RESULT_CACHE_ENABLED: bool = True  # Cache results of seeded requests
+    RESULT_CACHE_MAX_BYTES: int = 64 * 1024 * 1024  # In-process LRU size (64 MB)
+    RESULT_CACHE_SHARED_ENABLED: bool = False  # Shared tier in PostgreSQL
+    RESULT_CACHE_SHARED_TTL_HOURS: int = 168  # Shared tier entries kept for 7 days
+
+    # ============================================
+    # API Key Validation Cache
+    # ============================================
+    API_KEY_CACHE_ENABLED: bool = True  # Cache validated keys in process
+    API_KEY_CACHE_TTL_SECONDS: float = 60.0  # Revocations reach other processes within this
+    API_KEY_CACHE_MAX_ENTRIES: int = 10000  # Cached keys per process
+    API_KEY_LAST_USED_FLUSH_SECONDS: float = 30.0  # Batched last_used_at writes
+
+    # ============================================
+    # API Call Logging
+    # ============================================
+    API_CALL_LOG_QUEUE_SIZE: int = 10000  # Buffered rows per process before dropping
+    API_CALL_LOG_BATCH_SIZE: int = 500  # Rows per multi-row INSERT (flush on size)
+    API_CALL_LOG_FLUSH_SECONDS: float = 2.0  # Flush on time
+    API_CALL_LOG_DRAIN_TIMEOUT_SECONDS: float = 10.0  # Shutdown drain limit
+    API_CALL_LOG_MAX_BATCH_ATTEMPTS: int = 3  # Then rows are inserted one by one, failures dropped
+    API_CALL_LOG_PARTITION_MONTHS_AHEAD: int = 3  # Monthly partitions created in advance
+    API_CALL_LOG_RETENTION_MONTHS: int = 0  # Raw log months kept (0 = all; rollups always kept)
+    API_CALL_LOG_MAINTENANCE_HOURS: float = 6.0  # Partition maintenance interval (0 = off)
+
+    # ============================================
+    # User Status Cache
+    # ============================================
+    USER_CACHE_ENABLED: bool = True  # Cache users authenticated by JWT in process
+    USER_CACHE_TTL_SECONDS: float = 30.0  # Status changes reach other processes within this
+    USER_CACHE_MAX_ENTRIES: int = 10000  # Cached users per process
+
+    # ============================================
+    # Password Hashing
+    # ============================================
+    PASSWORD_HASH_POOL_SIZE: int = 2  # bcrypt threads per process
+    PASSWORD_HASH_QUEUE_SIZE: int = 64  # Queued hashes beyond busy threads before 429
+    PASSWORD_HASH_RETRY_AFTER_SECONDS: int = 2  # Retry-After header on 429
+
     # ============================================
     # Server Configuration
     # ============================================
@@ -90,6 +151,11 @@ class Settings(BaseSettings):
 # Global settings instance
 settings = Settings()
 
+# Numba resolves its cache directory when kernels are decorated, so export it
+# before any simulation module is imported (spawned workers inherit it)
+if settings.NUMBA_CACHE_DIR:
+    os.environ.setdefault("NUMBA_CACHE_DIR", settings.NUMBA_CACHE_DIR)
+
 
 # Validation on import
 def validate_settings():
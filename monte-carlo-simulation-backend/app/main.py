@@ -14,6 +14,11 @@ import time
 from app.config import settings
 from app.database import engine, Base
 from app.api import auth, api_keys, simulation
+from app.services.simulation_executor import simulation_executor
+from app.services.simulation_job_service import simulation_job_queue
+from app.services.api_key_cache import api_key_cache
+from app.services.api_call_logger import api_call_logger
+from app.services.password_hasher import password_hasher
 
 # Configure logging
 logging.basicConfig(
@@ -32,8 +37,14 @@ async def lifespan(app: FastAPI):
     Startup:
         - Log application start
         - Database connection is managed by SQLAlchemy pool
+        - Start simulation worker pool and compile kernels (warmup) in the
+          background; /health returns 503 until warmup has finished
+        - Start the job queue (its jobs wait in the pool during warmup)
+        - Start the batched API key last_used_at flush and API call log writer
 
     Shutdown:
+        - Stop job queue, simulation worker pool and password hashing pool
+        - Flush pending API key last_used_at updates, drain the API call log
         - Close database connections
         - Log application shutdown
     """
@@ -43,11 +54,20 @@ async def lifespan(app: FastAPI):
     logger.info(f"🔐 CORS Origins: {settings.CORS_ORIGINS}")
     logger.info(f"⏰ JWT Expiry: {settings.JWT_EXPIRATION_HOURS} hours")
     logger.info(f"🔑 API Key Expiry: {settings.API_KEY_EXPIRY_DAYS} days")
+    simulation_executor.start_warmup()
+    simulation_job_queue.start()
+    api_key_cache.start()
+    api_call_logger.start()
 
     yield
 
     # Shutdown
     logger.info("🛑 Shutting down application...")
+    await simulation_job_queue.stop()
+    simulation_executor.shutdown()
+    password_hasher.shutdown()
+    await api_key_cache.stop()
+    await api_call_logger.stop()
     await engine.dispose()
     logger.info("✅ Database connections closed")
 
@@ -266,7 +286,26 @@ async def health_check():
     - Load balancer health checks
     - Uptime monitoring services
     - CI/CD pipeline validation
+
+    Returns 503 until the simulation workers have finished JIT warmup
+    (warmup runs in the background at startup and after a worker pool restart);
+    after a failed warmup (retried in the background) the engine is reported
+    'failed' with the error.
     """
+    if not simulation_executor.ready:
+        warmup_error = simulation_executor.warmup_error
+        content = {
+            "status": "starting" if warmup_error is None else "unhealthy",
+            "service": settings.APP_NAME,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "components": {
+                "simulation_engine": "warming_up" if warmup_error is None else "failed"
+            }
+        }
+        if warmup_error is not None:
+            content["error"] = f"Simulation worker warmup failed: {warmup_error}"
+        return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content=content)
+
     try:
         # Basic health check - could add database ping here
         return {
@@ -276,8 +315,11 @@ async def health_check():
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "components": {
                 "api": "operational",
+                "simulation_engine": "operational",
                 "database": "operational"  # TODO: Add actual database health check
-            }
+            },
+            "api_call_log": api_call_logger.get_stats(),
+            "password_hashing": password_hasher.get_stats()
         }
     except Exception as e:
         logger.error(f"Health check failed: {str(e)}")
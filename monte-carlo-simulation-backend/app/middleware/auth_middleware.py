@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from jose import JWTError
 from typing import Optional
 
+from app.config import settings
 from app.database import get_db
 from app.utils.security import verify_access_token
 from app.services.auth_service import AuthService
@@ -33,12 +34,17 @@ async def get_current_user(
         async def protected_route(current_user: User = Depends(get_current_user)):
             return {"user_id": current_user.id, "email": current_user.email}
 
+    The user comes from the user status cache (database on miss, see
+    AuthService.get_cached_user). With JWT_TRUST_CLAIMS the token's claims
+    are trusted until it expires: the returned User carries only id, email
+    and status, and no lookup is made.
+
     Args:
         credentials: HTTP Authorization header with Bearer token
         db: Database session
 
     Returns:
-        User object of authenticated user
+        User object of authenticated user (detached)
 
     Raises:
         HTTPException 401: If token is invalid, expired, or user not found
@@ -67,8 +73,12 @@ async def get_current_user(
         if user_id is None or email is None:
             raise credentials_exception
 
-        # Retrieve user from database
-        user = await AuthService.get_user_by_id(user_id, db)
+        if settings.JWT_TRUST_CLAIMS:
+            # Tokens are only issued to active users
+            return User(id=user_id, email=email, status='active')
+
+        # Retrieve user (cached, database on miss)
+        user = await AuthService.get_cached_user(user_id, db)
 
         # Check if user account is active
         if user.status != 'active':
@@ -102,7 +112,7 @@ async def get_current_api_key(
             api_key: ApiKey = Depends(get_current_api_key)
         ):
             # api_key.user_id can be used to identify the user
-            # api_key.last_used_at is automatically updated
+            # api_key.last_used_at is updated (batched, see api_key_cache)
             return {"user_id": api_key.user_id}
 
     Args:
@@ -110,7 +120,7 @@ async def get_current_api_key(
         db: Database session
 
     Returns:
-        ApiKey object (with user relationship loaded)
+        ApiKey object (cached validation, see ApiKeyService.validate_api_key)
 
     Raises:
         HTTPException 401: If API key is missing, invalid, expired, or revoked
@@ -122,8 +132,8 @@ async def get_current_api_key(
             headers={"WWW-Authenticate": "ApiKey"}
         )
 
-    # Validate API key (checks existence, status, expiry)
-    # Also updates last_used_at timestamp
+    # Validate API key (checks existence, status, expiry; cached)
+    # Also records last_used_at (written in periodic batches)
     api_key = await ApiKeyService.validate_api_key(x_api_key, db)
 
     return api_key
@@ -157,8 +167,11 @@ async def get_optional_current_user(
         if not user_id:
             return None
 
-        # Get user
-        user = await AuthService.get_user_by_id(user_id, db)
+        if settings.JWT_TRUST_CLAIMS:
+            return User(id=user_id, email=payload.get("email"), status='active')
+
+        # Get user (cached, database on miss)
+        user = await AuthService.get_cached_user(user_id, db)
 
         if user.status != 'active':
             return None
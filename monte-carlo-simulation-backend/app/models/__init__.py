@@ -6,5 +6,8 @@ SQLAlchemy ORM models for PostgreSQL database
 from app.models.user import User
 from app.models.api_key import ApiKey
 from app.models.api_call_log import ApiCallLog
+from app.models.api_usage_hourly import ApiUsageHourly
+from app.models.simulation_job import SimulationJob
+from app.models.cached_simulation_result import CachedSimulationResult
 
-__all__ = ['User', 'ApiKey', 'ApiCallLog']
+__all__ = ['User', 'ApiKey', 'ApiCallLog', 'ApiUsageHourly', 'SimulationJob', 'CachedSimulationResult']
@@ -3,7 +3,7 @@ API Call Log Model
 Tracks all API calls for usage monitoring and analytics
 """
 
-from sqlalchemy import Column, BigInteger, String, Integer, Float, Text, TIMESTAMP, ForeignKey
+from sqlalchemy import Column, BigInteger, String, Integer, Float, Text, TIMESTAMP, ForeignKey, Index, DDL, event
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -20,7 +20,13 @@ class ApiCallLog(Base):
         - Logs all simulation API calls
         - Tracks execution time for performance monitoring
         - Stores request payload hash (not full payload for privacy)
-        - Used for billing and usage analytics
+        - Used for billing and usage analytics (read through the hourly
+          ApiUsageHourly rollup, maintained with every inserted batch)
+        - Range-partitioned by month on created_at (api_call_logs_yYYYYmMM),
+          so old months are dropped as whole partitions; rows outside the
+          created partitions land in api_call_logs_default
+        - Only the primary key and (user_id, created_at) are indexed, to keep
+          inserts cheap
     """
 
     __tablename__ = "api_call_logs"
@@ -28,6 +34,7 @@ class ApiCallLog(Base):
     # ============================================
     # Primary Key
     # ============================================
+    # Partitioned table: the key must include the partition column
     id = Column(BigInteger, primary_key=True, autoincrement=True)
 
     # ============================================
@@ -37,7 +44,6 @@ class ApiCallLog(Base):
         BigInteger,
         ForeignKey('users.id', ondelete='CASCADE'),
         nullable=False,
-        index=True,
         comment="User who made the API call"
     )
 
@@ -47,7 +53,6 @@ class ApiCallLog(Base):
     api_key = Column(
         String(255),
         nullable=False,
-        index=True,
         comment="API key used for this request"
     )
 
@@ -69,7 +74,6 @@ class ApiCallLog(Base):
     status_code = Column(
         Integer,
         nullable=False,
-        index=True,
         comment="HTTP status code (200, 400, 500, etc.)"
     )
 
@@ -98,11 +102,11 @@ class ApiCallLog(Base):
     # Timestamp
     # ============================================
     created_at = Column(
-        TIMESTAMP,
+        TIMESTAMP(timezone=True),
+        primary_key=True,
         nullable=False,
         server_default=func.now(),
-        index=True,
-        comment="Timestamp of the API call"
+        comment="Timestamp of the API call (partition key)"
     )
 
     # ============================================
@@ -110,6 +114,11 @@ class ApiCallLog(Base):
     # ============================================
     user = relationship("User", back_populates="api_call_logs")
 
+    __table_args__ = (
+        Index('ix_api_call_logs_user_created', 'user_id', 'created_at'),
+        {'postgresql_partition_by': 'RANGE (created_at)'},
+    )
+
     def __repr__(self):
         return (
             f"<ApiCallLog(id={self.id}, endpoint={self.endpoint}, "
@@ -130,3 +139,14 @@ class ApiCallLog(Base):
     def is_server_error(self) -> bool:
         """Check if API call resulted in server error (status code 5xx)"""
         return self.status_code >= 500
+
+
+# Tables created with Base.metadata.create_all (development) get a catch-all
+# partition; monthly partitions are created by the migrations and
+# ApiUsageService.maintain_partitions
+event.listen(
+    ApiCallLog.__table__,
+    "after_create",
+    DDL("CREATE TABLE IF NOT EXISTS api_call_logs_default PARTITION OF api_call_logs DEFAULT")
+    .execute_if(dialect="postgresql")
+)
@@ -0,0 +1,83 @@
+"""
+API Usage Hourly Rollup Model
+Hourly per-user, per-API-key call counts and latency histograms
+"""
+
+from sqlalchemy import Column, BigInteger, String, Float, TIMESTAMP, ForeignKey
+from sqlalchemy.dialects.postgresql import ARRAY
+from app.database import Base
+
+
+class ApiUsageHourly(Base):
+    """
+    Hourly rollup of api_call_logs for billing and usage queries
+
+    Business Rules:
+        - One row per (user, hour, API key), upserted with every batch of
+          API call logs in the same transaction as the raw rows
+        - Counts and latency sums add up across batches; latency percentiles
+          are derived from latency_histogram (buckets in
+          ApiUsageService.LATENCY_BUCKETS_MS), which also adds up
+        - Calls without an execution time are counted but not in the histogram
+        - Kept when raw log partitions are dropped
+    """
+
+    __tablename__ = "api_usage_hourly"
+
+    # ============================================
+    # Primary Key
+    # ============================================
+    user_id = Column(
+        BigInteger,
+        ForeignKey('users.id', ondelete='CASCADE'),
+        primary_key=True,
+        comment="User who made the API calls"
+    )
+
+    bucket_start = Column(
+        TIMESTAMP(timezone=True),
+        primary_key=True,
+        comment="Start of the hour (UTC)"
+    )
+
+    api_key = Column(
+        String(255),
+        primary_key=True,
+        comment="API key used for the calls"
+    )
+
+    # ============================================
+    # Counts
+    # ============================================
+    call_count = Column(BigInteger, nullable=False, default=0, comment="All calls")
+    success_count = Column(BigInteger, nullable=False, default=0, comment="Calls with 2xx status")
+    client_error_count = Column(BigInteger, nullable=False, default=0, comment="Calls with 4xx status")
+    server_error_count = Column(BigInteger, nullable=False, default=0, comment="Calls with 5xx status")
+
+    # ============================================
+    # Latency
+    # ============================================
+    total_execution_time_ms = Column(
+        Float,
+        nullable=False,
+        default=0.0,
+        comment="Sum of execution times of timed calls"
+    )
+
+    max_execution_time_ms = Column(
+        Float,
+        nullable=True,
+        comment="Slowest timed call"
+    )
+
+    latency_histogram = Column(
+        ARRAY(BigInteger),
+        nullable=False,
+        comment="Timed calls per latency bucket (ApiUsageService.LATENCY_BUCKETS_MS)"
+    )
+
+    def __repr__(self):
+        return (
+            f"<ApiUsageHourly(bucket_start={self.bucket_start}, user_id={self.user_id}, "
+            f"calls={self.call_count})>"
+        )
@@ -0,0 +1,73 @@
+"""
+Cached Simulation Result Model
+Shared (cross-worker) tier of the simulation result cache
+"""
+
+from sqlalchemy import Column, Integer, String, TIMESTAMP
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+from app.database import Base
+from datetime import datetime, timezone
+
+
+class CachedSimulationResult(Base):
+    """
+    Cached results of a deterministic (seeded) simulation request
+
+    Business Rules:
+        - Keyed by SHA-256 of the canonical request plus engine version
+        - Entries expire after RESULT_CACHE_SHARED_TTL_HOURS
+    """
+
+    __tablename__ = "simulation_result_cache"
+
+    # ============================================
+    # Primary Key
+    # ============================================
+    cache_key = Column(
+        String(64),
+        primary_key=True,
+        comment="SHA-256 of canonical request + engine version"
+    )
+
+    # ============================================
+    # Cached Data
+    # ============================================
+    engine_version = Column(
+        Integer,
+        nullable=False,
+        comment="Simulation engine version that produced the results"
+    )
+
+    results = Column(
+        JSONB,
+        nullable=False,
+        comment="Simulation results"
+    )
+
+    # ============================================
+    # Timestamps
+    # ============================================
+    created_at = Column(
+        TIMESTAMP,
+        nullable=False,
+        server_default=func.now(),
+        comment="Time the results were cached"
+    )
+
+    expires_at = Column(
+        TIMESTAMP,
+        nullable=False,
+        index=True,
+        comment="Time after which the entry is ignored and purged"
+    )
+
+    def __repr__(self):
+        return f"<CachedSimulationResult(cache_key={self.cache_key[:12]}..., engine_version={self.engine_version})>"
+
+    @property
+    def is_expired(self) -> bool:
+        """Check if the cache entry has expired"""
+        if not self.expires_at:
+            return False
+        return datetime.now(timezone.utc) > self.expires_at.replace(tzinfo=timezone.utc)
@@ -0,0 +1,142 @@
+"""
+Simulation Job Model
+Stores asynchronous simulation jobs and their results
+"""
+
+from sqlalchemy import Column, BigInteger, String, Float, Text, TIMESTAMP, ForeignKey, CheckConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+from app.database import Base
+from datetime import datetime, timezone
+
+
+class SimulationJob(Base):
+    """
+    Simulation Job model for long-running (asynchronous) simulations
+
+    Lifecycle:
+        pending -> running -> completed | failed
+
+    Business Rules:
+        - Jobs are owned by the user of the API key that submitted them
+        - Results are kept for a retention window (expires_at), then purged
+        - Status can be: 'pending', 'running', 'completed', 'failed'
+    """
+
+    __tablename__ = "simulation_jobs"
+
+    # ============================================
+    # Primary Key
+    # ============================================
+    id = Column(
+        String(32),
+        primary_key=True,
+        comment="Simulation identifier (sim_XXXXXXXXXXXX)"
+    )
+
+    # ============================================
+    # Foreign Key
+    # ============================================
+    user_id = Column(
+        BigInteger,
+        ForeignKey('users.id', ondelete='CASCADE'),
+        nullable=False,
+        index=True,
+        comment="User who submitted the job"
+    )
+
+    api_key = Column(
+        String(255),
+        nullable=False,
+        comment="API key used to submit the job"
+    )
+
+    # ============================================
+    # Job Data
+    # ============================================
+    status = Column(
+        String(20),
+        nullable=False,
+        default='pending',
+        server_default='pending',
+        index=True,
+        comment="Job status: pending | running | completed | failed"
+    )
+
+    request_payload = Column(
+        JSONB,
+        nullable=False,
+        comment="SimulationRequest body"
+    )
+
+    results = Column(
+        JSONB,
+        nullable=True,
+        comment="Simulation results (when completed)"
+    )
+
+    error_message = Column(
+        Text,
+        nullable=True,
+        comment="Error message (when failed)"
+    )
+
+    execution_time_seconds = Column(
+        Float,
+        nullable=True,
+        comment="Simulation execution time"
+    )
+
+    # ============================================
+    # Timestamps
+    # ============================================
+    created_at = Column(
+        TIMESTAMP,
+        nullable=False,
+        server_default=func.now(),
+        comment="Job submission timestamp"
+    )
+
+    started_at = Column(
+        TIMESTAMP,
+        nullable=True,
+        comment="Time a worker picked up the job"
+    )
+
+    completed_at = Column(
+        TIMESTAMP,
+        nullable=True,
+        comment="Time the job completed or failed"
+    )
+
+    expires_at = Column(
+        TIMESTAMP,
+        nullable=False,
+        index=True,
+        comment="Time after which the job and its results are purged"
+    )
+
+    # ============================================
+    # Constraints
+    # ============================================
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('pending', 'running', 'completed', 'failed')",
+            name='simulation_jobs_status_check'
+        ),
+    )
+
+    def __repr__(self):
+        return f"<SimulationJob(id={self.id}, status={self.status})>"
+
+    @property
+    def is_finished(self) -> bool:
+        """Check if the job has completed or failed"""
+        return self.status in ('completed', 'failed')
+
+    @property
+    def is_expired(self) -> bool:
+        """Check if the job is past its retention window"""
+        if not self.expires_at:
+            return False
+        return datetime.now(timezone.utc) > self.expires_at.replace(tzinfo=timezone.utc)
@@ -98,11 +98,14 @@ class User(Base):
         lazy="selectin"
     )
 
+    # Never loaded with the user (the log grows without bound); the database
+    # deletes a user's logs (ON DELETE CASCADE), usage is read from ApiUsageHourly
     api_call_logs = relationship(
         "ApiCallLog",
         back_populates="user",
         cascade="all, delete-orphan",
-        lazy="selectin"
+        passive_deletes=True,
+        lazy="noload"
     )
 
     # ============================================
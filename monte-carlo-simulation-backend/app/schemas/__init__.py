@@ -11,7 +11,13 @@ from app.schemas.simulation import (
     Portfolio,
     SimulationParameters,
     SimulationRequest,
-    SimulationResponse
+    SimulationBatchRequest,
+    SimulationSweepRequest,
+    SimulationResponse,
+    SimulationJobResponse,
+    SimulationBatchItem,
+    SimulationStreamEvent,
+    SimulationSweepResponse
 )
 
 __all__ = [
@@ -33,5 +39,11 @@ __all__ = [
     'Portfolio',
     'SimulationParameters',
     'SimulationRequest',
+    'SimulationBatchRequest',
+    'SimulationSweepRequest',
     'SimulationResponse',
+    'SimulationJobResponse',
+    'SimulationBatchItem',
+    'SimulationStreamEvent',
+    'SimulationSweepResponse',
 ]
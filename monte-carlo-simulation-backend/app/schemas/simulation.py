@@ -3,8 +3,8 @@ Simulation Schemas
 Pydantic models for Monte Carlo simulation requests and responses
 """
 
-from pydantic import BaseModel, Field, field_validator
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, Field, field_validator, model_validator
+from typing import List, Optional, Dict, Any, Literal
 from datetime import datetime
 
 
@@ -106,9 +106,18 @@ class SimulationParameters(BaseModel):
 
     Constraints:
         - initial_investment: Must be positive
-        - monthly_contribution: Non-negative (0 means no contributions)
+        - monthly_contribution: Non-negative (0 means no contributions);
+          compounds along each path, so needs the stepped engine
+          ('auto' or 'stepped', single_factor model)
         - time_horizon_years: 1-50 years
         - num_simulations: 1,000-100,000 (balance between accuracy and performance)
+        - num_sample_paths: 0-20 paths returned for charting
+        - engine: 'exact' cannot produce sample paths (path-dependent output)
+        - model: 'multi_asset' supports engine 'auto', 'exact' or 'qmc'
+        - antithetic: num_simulations must be even (paths come in pairs),
+          not combined with engine 'qmc'
+        - target_relative_error: adaptive mode, num_simulations is the maximum
+        - precision: 'float32' requires engine 'stepped'
     """
     initial_investment: float = Field(
         ...,
@@ -120,7 +129,10 @@ class SimulationParameters(BaseModel):
     monthly_contribution: float = Field(
         default=0,
         ge=0,
-        description="Monthly contribution amount (0 for no contributions)",
+        description=(
+            "Monthly contribution amount (0 for no contributions), deposited at "
+            "each month end and compounded along each simulated path"
+        ),
         examples=[50000, 0]
     )
 
@@ -140,6 +152,175 @@ class SimulationParameters(BaseModel):
         examples=[10000, 50000]
     )
 
+    num_sample_paths: int = Field(
+        default=5,
+        ge=0,
+        le=20,
+        description="Number of full paths returned for charting (0 to skip)",
+        examples=[5, 0]
+    )
+
+    return_distribution: bool = Field(
+        default=False,
+        description=(
+            "Also return every terminal value (terminal_distribution) as a "
+            "float32 buffer, so clients can compute their own metrics"
+        ),
+        examples=[False, True]
+    )
+
+    engine: Literal["auto", "exact", "stepped", "qmc"] = Field(
+        default="auto",
+        description=(
+            "Simulation engine: 'exact' samples terminal values in closed form "
+            "(one draw per path), 'stepped' evolves steps of time_step, 'qmc' samples "
+            "terminal values from scrambled Sobol points (quasi-Monte Carlo, "
+            "lower error for the same path count), 'auto' uses 'exact' when no "
+            "sample paths are requested"
+        ),
+        examples=["auto", "exact"]
+    )
+
+    time_step: Optional[Literal["daily", "weekly", "monthly", "annual"]] = Field(
+        default=None,
+        description=(
+            "Step of the stepped engine and resolution of sample paths "
+            "(252, 52, 12 or 1 steps per year). Steps are exact GBM transitions, "
+            "so the terminal distribution does not depend on the step. "
+            "Default 'daily'; engine 'auto' steps monthly for contributions "
+            "without sample paths"
+        ),
+        examples=["daily", "monthly"]
+    )
+
+    precision: Literal["float64", "float32"] = Field(
+        default="float64",
+        description=(
+            "Arithmetic of the stepped engine: 'float32' halves memory traffic "
+            "(compensated summation keeps percentiles within 1e-4 relative of "
+            "'float64' for the same seed); statistics are always computed in float64"
+        ),
+        examples=["float64", "float32"]
+    )
+
+    model: Literal["single_factor", "multi_asset"] = Field(
+        default="single_factor",
+        description=(
+            "Portfolio model: 'single_factor' collapses the portfolio into one "
+            "return/volatility, 'multi_asset' simulates correlated assets jointly"
+        ),
+        examples=["single_factor", "multi_asset"]
+    )
+
+    seed: Optional[int] = Field(
+        default=None,
+        ge=0,
+        le=2**32 - 1,
+        description="Random seed for reproducible results (random if omitted)",
+        examples=[42]
+    )
+
+    antithetic: bool = Field(
+        default=False,
+        description=(
+            "Antithetic variates: paths are simulated in mirrored pairs (Z, -Z), "
+            "reducing the standard error of the estimates at the same path count"
+        ),
+        examples=[True]
+    )
+
+    control_variate: bool = Field(
+        default=False,
+        description=(
+            "Control variate: adjust estimates by regression on a control with a "
+            "known mean (the log terminal value of the GBM; with contributions or "
+            "the multi-asset model, the terminal value, which leaves the mean "
+            "unadjusted), reducing their standard error"
+        ),
+        examples=[True]
+    )
+
+    target_relative_error: Optional[float] = Field(
+        default=None,
+        gt=0,
+        le=0.5,
+        description=(
+            "Adaptive mode: simulate in batches until the standard error of every "
+            "target metric is below this fraction of its estimate; num_simulations "
+            "becomes the maximum path count (paths actually used are reported)"
+        ),
+        examples=[0.01]
+    )
+
+    target_metrics: List[Literal[
+        "mean",
+        "var_95",
+        "var_99",
+        "cvar_95",
+        "cvar_99",
+        "probability_of_loss",
+        "probability_of_positive_return",
+        "probability_of_doubling"
+    ]] = Field(
+        default=["var_95"],
+        min_length=1,
+        description="Metrics checked against target_relative_error in adaptive mode",
+        examples=[["var_95", "probability_of_loss"]]
+    )
+
+    @model_validator(mode='after')
+    def validate_engine(self) -> 'SimulationParameters':
+        """
+        Validate that the selected engine can produce the requested output
+
+        Raises:
+            ValueError: If the engine cannot serve the requested output or model
+        """
+        if self.monthly_contribution > 0 and (
+            self.engine in ("exact", "qmc") or self.model == "multi_asset"
+        ):
+            raise ValueError(
+                "Monthly contributions compound along each path, which needs the "
+                "stepped engine. Use engine 'auto' or 'stepped' with the "
+                "single_factor model."
+            )
+        if (
+            self.engine == "auto"
+            and self.monthly_contribution > 0
+            and self.num_sample_paths == 0
+            and self.time_step not in (None, "monthly")
+        ):
+            raise ValueError(
+                "Engine 'auto' steps monthly for contributions without sample "
+                f"paths. Omit time_step, or use engine 'stepped' for time_step '{self.time_step}'."
+            )
+        if self.engine == "exact" and self.num_sample_paths > 0:
+            raise ValueError(
+                "The exact engine only samples terminal values. "
+                "Set num_sample_paths to 0 or use engine 'stepped'."
+            )
+        if self.model == "multi_asset" and self.engine == "stepped":
+            raise ValueError(
+                "The multi-asset model samples terminal values exactly. "
+                "Use engine 'auto', 'exact' or 'qmc'."
+            )
+        if self.precision == "float32" and self.engine != "stepped":
+            raise ValueError(
+                "Single precision applies to the time-step kernel. "
+                "Use engine 'stepped' with precision 'float32'."
+            )
+        if self.engine == "qmc" and self.antithetic:
+            raise ValueError(
+                "Antithetic variates do not apply to quasi-Monte Carlo points. "
+                "Use engine 'qmc' or antithetic, not both."
+            )
+        if self.antithetic and self.num_simulations % 2 != 0:
+            raise ValueError(
+                "Antithetic variates simulate paths in pairs. "
+                "num_simulations must be even."
+            )
+        return self
+
     model_config = {
         "json_schema_extra": {
             "examples": [{
@@ -180,6 +361,122 @@ class SimulationRequest(BaseModel):
     }
 
 
+class SimulationBatchRequest(BaseModel):
+    """
+    Batch simulation request schema
+    Several portfolios / parameter sets evaluated together
+
+    Seed Policy:
+        - Requests with an explicit seed keep it (and are cached as usual)
+        - Requests without a seed share one seed drawn for the batch, so
+          they are evaluated on common random numbers
+    """
+    requests: List[SimulationRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="Simulation requests (1-100)"
+    )
+
+
+class AllocationAxis(BaseModel):
+    """
+    Sweep axis over the weight of one asset
+
+    The other assets are rescaled proportionally to fill the remaining
+    weight (equally, if their base weights are all zero).
+    """
+    ticker: str = Field(..., description="Ticker of the asset whose weight is varied")
+    weights: List[float] = Field(
+        ...,
+        min_length=1,
+        max_length=21,
+        description="Weights of the asset (0.0 to 1.0)"
+    )
+
+    @field_validator('weights')
+    @classmethod
+    def validate_weights(cls, v: List[float]) -> List[float]:
+        """Validate that every weight is between 0 and 1"""
+        if any(not 0.0 <= weight <= 1.0 for weight in v):
+            raise ValueError("Allocation weights must be between 0.0 and 1.0")
+        return v
+
+
+class SimulationSweepAxes(BaseModel):
+    """
+    Axes of a parameter sweep (the grid is their cartesian product)
+
+    Axes left out keep the base request value.
+    """
+    time_horizon_years: Optional[List[int]] = Field(
+        None,
+        min_length=1,
+        max_length=50,
+        description="Horizons to evaluate (1-50 years each)"
+    )
+    monthly_contribution: Optional[List[float]] = Field(
+        None,
+        min_length=1,
+        max_length=50,
+        description="Monthly contributions to evaluate (non-negative)"
+    )
+    allocation: Optional[AllocationAxis] = Field(
+        None,
+        description="Weights of one asset to evaluate"
+    )
+
+    @model_validator(mode='after')
+    def validate_axes(self) -> 'SimulationSweepAxes':
+        """Validate that at least one axis is given"""
+        if (
+            self.time_horizon_years is None and self.monthly_contribution is None
+            and self.allocation is None
+        ):
+            raise ValueError("At least one sweep axis is required")
+        return self
+
+
+class SimulationSweepRequest(BaseModel):
+    """
+    Parameter sweep request schema
+    A base simulation request evaluated over a grid of parameter values
+
+    Validation Rules:
+        - Grid size (product of the axis lengths) at most 200 points
+        - The allocation ticker must be in the base portfolio
+        - Every grid point must be a valid simulation request
+    """
+    base: SimulationRequest = Field(..., description="Simulation request the grid starts from")
+    axes: SimulationSweepAxes = Field(..., description="Parameters to vary")
+
+    @model_validator(mode='after')
+    def validate_grid(self) -> 'SimulationSweepRequest':
+        """
+        Validate the grid size and the allocation axis
+
+        Raises:
+            ValueError: If the grid is too large or the ticker is unknown
+        """
+        num_points = (
+            len(self.axes.time_horizon_years or [None])
+            * len(self.axes.monthly_contribution or [None])
+            * (len(self.axes.allocation.weights) if self.axes.allocation else 1)
+        )
+        if num_points > 200:
+            raise ValueError(f"Sweep grid has {num_points} points (maximum 200)")
+
+        if self.axes.allocation is not None:
+            tickers = [asset.ticker for asset in self.base.portfolio.assets]
+            if self.axes.allocation.ticker not in tickers:
+                raise ValueError(
+                    f"Allocation ticker {self.axes.allocation.ticker} is not in the base portfolio"
+                )
+            if len(tickers) == 1 and any(weight != 1.0 for weight in self.axes.allocation.weights):
+                raise ValueError("A single-asset portfolio only allows an allocation weight of 1.0")
+        return self
+
+
 class SimulationResponse(BaseModel):
     """
     Simulation results response schema
@@ -227,3 +524,110 @@ class SimulationResponse(BaseModel):
             }]
         }
     }
+
+
+class SimulationJobResponse(BaseModel):
+    """
+    Asynchronous simulation job response schema
+
+    Contains:
+        - simulation_id: Job identifier (poll GET /api/v1/simulations/{simulation_id})
+        - status: 'pending', 'running', 'completed', or 'failed'
+        - results: Simulation results once completed
+        - error_message: Failure reason if failed
+        - expires_at: Results are deleted after this time
+    """
+    simulation_id: str = Field(..., description="Unique simulation identifier")
+    status: str = Field(..., description="Job status (pending/running/completed/failed)")
+    created_at: datetime = Field(..., description="Timestamp when the job was submitted")
+    started_at: Optional[datetime] = Field(None, description="Timestamp when a worker picked up the job")
+    completed_at: Optional[datetime] = Field(None, description="Timestamp when the job finished")
+    expires_at: datetime = Field(..., description="Timestamp after which results are deleted")
+    execution_time_seconds: Optional[float] = Field(None, description="Simulation execution time")
+    results: Optional[Dict[str, Any]] = Field(None, description="Simulation results (when completed)")
+    error_message: Optional[str] = Field(None, description="Error message (when failed)")
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [{
+                "simulation_id": "sim_abc123def456",
+                "status": "pending",
+                "created_at": "2024-01-01T12:00:00",
+                "started_at": None,
+                "completed_at": None,
+                "expires_at": "2024-01-02T12:00:00",
+                "execution_time_seconds": None,
+                "results": None,
+                "error_message": None
+            }]
+        }
+    }
+
+
+class SimulationBatchItem(BaseModel):
+    """
+    One line of the batch simulation stream (application/x-ndjson)
+
+    Result lines (type 'result') arrive in completion order, each tagged with
+    the index of its request; the last line (type 'summary') has the counts.
+    """
+    type: Literal["result", "summary"] = Field(..., description="Line type")
+    index: Optional[int] = Field(None, description="Position of the request in the batch (result lines)")
+    simulation_id: str = Field(..., description="Simulation identifier (batch identifier on the summary)")
+    status: str = Field(..., description="completed/failed")
+    cache: Optional[str] = Field(None, description="Result cache outcome: HIT/MISS/BYPASS (result lines)")
+    results: Optional[Dict[str, Any]] = Field(None, description="Simulation results (when completed)")
+    error_message: Optional[str] = Field(None, description="Error message (when failed)")
+    completed: Optional[int] = Field(None, description="Completed simulations (summary)")
+    failed: Optional[int] = Field(None, description="Failed simulations (summary)")
+    execution_time_seconds: Optional[float] = Field(None, description="Batch execution time (summary)")
+
+
+class SimulationStreamEvent(BaseModel):
+    """
+    One event of the streaming simulation (NDJSON line or server-sent event)
+
+    Progress events (type 'progress') carry the statistics of the paths
+    simulated so far; the last event is the final result (type 'result',
+    same results as /api/v1/simulate) or an error (type 'error').
+    """
+    type: Literal["progress", "result", "error"] = Field(..., description="Event type")
+    simulation_id: str = Field(..., description="Unique simulation identifier")
+    status: str = Field(..., description="running/completed/failed")
+    paths_completed: Optional[int] = Field(None, description="Paths simulated so far")
+    num_simulations: int = Field(..., description="Requested (maximum) number of paths")
+    cache: Optional[str] = Field(None, description="Result cache outcome: HIT/MISS/BYPASS (result event)")
+    results: Optional[Dict[str, Any]] = Field(None, description="Interim or final simulation results")
+    error_message: Optional[str] = Field(None, description="Error message (error event)")
+    status_code: Optional[int] = Field(None, description="HTTP status of the failure (error event)")
+    execution_time_seconds: float = Field(..., description="Time since the request was received")
+
+
+class SimulationSweepPoint(BaseModel):
+    """
+    Results of one grid point of a parameter sweep
+    """
+    time_horizon_years: int = Field(..., description="Horizon of this point")
+    monthly_contribution: float = Field(..., description="Monthly contribution of this point")
+    allocation_weight: Optional[float] = Field(None, description="Weight of the allocation axis asset")
+    status: str = Field(..., description="completed/failed")
+    results: Optional[Dict[str, Any]] = Field(None, description="Simulation results (when completed)")
+    error_message: Optional[str] = Field(None, description="Error message (when failed)")
+
+
+class SimulationSweepResponse(BaseModel):
+    """
+    Parameter sweep response schema
+
+    Contains:
+        - sweep_id: Unique identifier for this sweep
+        - seed: Seed shared by every grid point (common random numbers)
+        - points: One entry per grid point (horizons outermost, then
+          contributions, then allocation weights)
+    """
+    sweep_id: str = Field(..., description="Unique sweep identifier")
+    status: str = Field(..., description="Sweep status (completed/failed)")
+    created_at: datetime = Field(..., description="Timestamp when the sweep was run")
+    execution_time_seconds: float = Field(..., description="Sweep execution time")
+    seed: int = Field(..., description="Seed shared by all grid points")
+    points: List[SimulationSweepPoint] = Field(..., description="Results per grid point")
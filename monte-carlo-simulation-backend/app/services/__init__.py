@@ -7,10 +7,14 @@ from app.services.auth_service import AuthService
 from app.services.api_key_service import ApiKeyService
 from app.services.monte_carlo import MonteCarloService
 from app.services.bloomberg import BloombergService
+from app.services.simulation_job_service import SimulationJobService
+from app.services.simulation_batch_service import SimulationBatchService
 
 __all__ = [
     'AuthService',
     'ApiKeyService',
     'MonteCarloService',
     'BloombergService',
+    'SimulationJobService',
+    'SimulationBatchService',
 ]
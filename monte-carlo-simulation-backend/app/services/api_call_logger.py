@@ -0,0 +1,306 @@
+"""
+API Call Logger
+Buffered, batched writes of ApiCallLog rows off the request path
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Callable, Deque, Dict, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.api_call_log import ApiCallLog
+from app.services.api_usage_service import ApiUsageService
+
+logger = logging.getLogger(__name__)
+
+
+class ApiCallLogger:
+    """
+    In-process buffer of API call log rows, bulk-inserted by a background task
+
+    Business Rules:
+        - log() never touches the database: the row goes into a bounded
+          in-memory buffer and the request returns without a round trip
+        - A full buffer drops the new row (counted in 'dropped'); requests
+          are never slowed down by logging
+        - The writer task inserts a batch when batch_size rows are waiting
+          or every flush_interval_seconds, as one multi-row INSERT, and adds
+          the batch to the hourly usage rollup in the same transaction
+        - A failed batch is kept and retried first by the next flush; after
+          max_batch_attempts failures its rows are inserted one by one and
+          the rows that still fail are dropped (counted in 'dropped'), so a
+          single bad row cannot stall the pipeline
+        - On shutdown the buffer is drained (up to drain_timeout_seconds)
+        - Every maintenance_interval_seconds (0 = never) the writer creates
+          upcoming monthly partitions and drops expired ones
+
+    Methods:
+        - log: Buffer one API call log row
+        - start: Start the writer task (application startup)
+        - stop: Drain the buffer and stop the writer (application shutdown)
+        - flush: Insert buffered rows now (one batch at a time)
+        - maintain_partitions: Create/drop api_call_logs partitions now
+        - get_stats: Queued/written/dropped counters
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int,
+        batch_size: int,
+        flush_interval_seconds: float,
+        drain_timeout_seconds: float,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+        partition_months_ahead: int = 3,
+        retention_months: int = 0,
+        maintenance_interval_seconds: float = 0.0,
+        max_batch_attempts: int = 3
+    ):
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.drain_timeout_seconds = drain_timeout_seconds
+        self.session_factory = session_factory
+        self.partition_months_ahead = partition_months_ahead
+        self.retention_months = retention_months
+        self.maintenance_interval_seconds = maintenance_interval_seconds
+        self.max_batch_attempts = max_batch_attempts
+
+        self._rows: Deque[Dict] = deque()
+        # Failed batch awaiting retry, and its failed attempts so far
+        self._retry: List[Dict] = []
+        self._attempts = 0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopping: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed_batches = 0
+
+    # ============================================
+    # Request Path
+    # ============================================
+
+    def log(
+        self,
+        *,
+        user_id: int,
+        api_key: str,
+        endpoint: str,
+        method: str,
+        status_code: int,
+        execution_time_ms: Optional[float] = None,
+        error_message: Optional[str] = None,
+        request_payload_hash: Optional[str] = None
+    ) -> bool:
+        """
+        Buffer one API call log row (written by the background task)
+
+        Args:
+            user_id: User who made the call
+            api_key: API key used
+            endpoint: API endpoint path
+            method: HTTP method
+            status_code: Response status code
+            execution_time_ms: Request execution time in milliseconds
+            error_message: Error message if the request failed
+            request_payload_hash: SHA-256 hash of the request payload
+
+        Returns:
+            True if buffered, False if dropped (buffer full)
+        """
+        if len(self._rows) >= self.max_queue_size:
+            self.dropped += 1
+            logger.warning(f"API call log buffer full, dropped entry for {endpoint}")
+            return False
+
+        self._rows.append({
+            "user_id": user_id,
+            "api_key": api_key,
+            "endpoint": endpoint,
+            "method": method,
+            "status_code": status_code,
+            "execution_time_ms": execution_time_ms,
+            "error_message": error_message,
+            "request_payload_hash": request_payload_hash,
+            "created_at": datetime.now(timezone.utc)
+        })
+        self.enqueued += 1
+        if self._wakeup is not None and len(self._rows) >= self.batch_size:
+            self._wakeup.set()
+        return True
+
+    # ============================================
+    # Writer
+    # ============================================
+
+    def start(self) -> None:
+        """Start the writer task on the running event loop"""
+        if self._task is not None:
+            return
+        self._wakeup = asyncio.Event()
+        self._stopping = asyncio.Event()
+        self._task = asyncio.create_task(self._writer(), name="api-call-log-writer")
+        logger.info(
+            f"API call logger started: batches of {self.batch_size}, "
+            f"every {self.flush_interval_seconds}s"
+        )
+
+    async def stop(self) -> None:
+        """
+        Drain buffered rows, then stop the writer task
+
+        Rows the final flush could not write (insert failed, drain timed
+        out) are counted as dropped.
+        """
+        if self._task is None:
+            return
+        self._stopping.set()
+        self._wakeup.set()
+        reason = "final flush failed"
+        try:
+            await asyncio.wait_for(self._task, timeout=self.drain_timeout_seconds)
+        except asyncio.TimeoutError:
+            reason = "drain timed out"
+        lost = self.queued
+        if lost:
+            self.dropped += lost
+            self._rows.clear()
+            self._retry = []
+            logger.error(f"API call log {reason}, {lost} entries dropped")
+        self._task = None
+        self._wakeup = None
+        self._stopping = None
+        logger.info(f"API call logger stopped: {self.get_stats()}")
+
+    async def flush(self) -> int:
+        """
+        Insert all buffered rows, one batch (multi-row INSERT) at a time
+
+        Returns:
+            Number of rows written (stops at a failed batch that has retries left)
+        """
+        written = 0
+        while self._retry or self._rows:
+            if self._retry:
+                batch, self._retry = self._retry, []
+            else:
+                batch = [self._rows.popleft() for _ in range(min(self.batch_size, len(self._rows)))]
+                self._attempts = 0
+
+            if await self._try_insert(batch):
+                written += len(batch)
+                continue
+
+            self._attempts += 1
+            if self._attempts < self.max_batch_attempts:
+                # Retried by the next flush (the database may be unavailable)
+                self._retry = batch
+                break
+            written += await self._insert_rows(batch)
+        return written
+
+    async def _try_insert(self, batch: List[Dict]) -> bool:
+        """Insert a batch in its own transaction, False if it failed"""
+        try:
+            async with self.session_factory() as db:
+                await self._insert(batch, db)
+        except Exception as e:
+            logger.warning(f"API call log insert of {len(batch)} rows failed: {e}")
+            self.failed_batches += 1
+            return False
+        self.written += len(batch)
+        return True
+
+    @staticmethod
+    async def _insert(batch: List[Dict], db: AsyncSession) -> None:
+        """Insert a batch of rows (multi-row INSERT) and its usage rollup"""
+        await db.execute(insert(ApiCallLog), batch)
+        await ApiUsageService.record_batch(db, batch)
+        await db.commit()
+
+    async def _insert_rows(self, batch: List[Dict]) -> int:
+        """Insert a batch that ran out of attempts row by row, dropping failed rows"""
+        written = 0
+        for row in batch:
+            try:
+                async with self.session_factory() as db:
+                    await self._insert([row], db)
+            except Exception as e:
+                self.dropped += 1
+                logger.error(
+                    f"Dropped API call log row for {row['endpoint']} "
+                    f"after {self.max_batch_attempts} failed batch inserts: {e}"
+                )
+                continue
+            written += 1
+        self.written += written
+        return written
+
+    async def maintain_partitions(self) -> None:
+        """Create upcoming api_call_logs partitions and drop expired ones"""
+        try:
+            async with self.session_factory() as db:
+                await ApiUsageService.maintain_partitions(
+                    db, self.partition_months_ahead, self.retention_months
+                )
+        except Exception as e:
+            logger.warning(f"api_call_logs partition maintenance failed: {e}")
+
+    async def _writer(self) -> None:
+        """Insert batches on size or time until stopped, then drain"""
+        next_maintenance = time.monotonic()
+        while not self._stopping.is_set():
+            if self.maintenance_interval_seconds > 0 and time.monotonic() >= next_maintenance:
+                await self.maintain_partitions()
+                next_maintenance = time.monotonic() + self.maintenance_interval_seconds
+            await self._wait(self._wakeup)
+            self._wakeup.clear()
+            if await self.flush() == 0 and self._retry:
+                # Insert failed: retry after an interval, not on every new row
+                await self._wait(self._stopping)
+
+        await self.flush()
+
+    async def _wait(self, event: asyncio.Event) -> None:
+        """Wait for an event, at most flush_interval_seconds"""
+        try:
+            await asyncio.wait_for(event.wait(), timeout=self.flush_interval_seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    @property
+    def queued(self) -> int:
+        """Rows waiting to be written (buffer and failed batch)"""
+        return len(self._rows) + len(self._retry)
+
+    def get_stats(self) -> Dict:
+        """Buffer counters"""
+        return {
+            "queued": self.queued,
+            "max_queue_size": self.max_queue_size,
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed_batches": self.failed_batches
+        }
+
+
+# Global logger (one per application process)
+api_call_logger = ApiCallLogger(
+    max_queue_size=settings.API_CALL_LOG_QUEUE_SIZE,
+    batch_size=settings.API_CALL_LOG_BATCH_SIZE,
+    flush_interval_seconds=settings.API_CALL_LOG_FLUSH_SECONDS,
+    drain_timeout_seconds=settings.API_CALL_LOG_DRAIN_TIMEOUT_SECONDS,
+    partition_months_ahead=settings.API_CALL_LOG_PARTITION_MONTHS_AHEAD,
+    retention_months=settings.API_CALL_LOG_RETENTION_MONTHS,
+    maintenance_interval_seconds=settings.API_CALL_LOG_MAINTENANCE_HOURS * 3600,
+    max_batch_attempts=settings.API_CALL_LOG_MAX_BATCH_ATTEMPTS
+)
@@ -0,0 +1,232 @@
+"""
+API Key Validation Cache
+In-process TTL cache of validated API keys with write-behind last_used_at
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.api_key import ApiKey
+
+logger = logging.getLogger(__name__)
+
+
+class ApiKeyCache:
+    """
+    Cache of validated API keys (ApiKeyService.validate_api_key)
+
+    Business Rules:
+        - Keys that passed validation (active, not expired) are cached for
+          ttl_seconds; a hit skips the database lookup, but expiry is still
+          checked on every hit
+        - Revoked or expired keys are invalidated at once in this process;
+          other application processes stop accepting them within ttl_seconds
+        - Failed validations are never cached
+        - At most max_entries keys are kept (least recently used evicted)
+        - last_used_at is recorded in memory (latest use per key) and
+          written in one batched UPDATE every flush_interval_seconds and on
+          shutdown, instead of one UPDATE + COMMIT per request; a failed
+          flush keeps the updates for the next one
+
+    Methods:
+        - get: Cached key for a key value (None on miss or expiry)
+        - put: Cache a validated key
+        - invalidate: Drop a key (revocation, expiry)
+        - record_use: Remember the last use of a key (write-behind)
+        - flush: Write pending last_used_at updates
+        - start: Start the periodic flush task (application startup)
+        - stop: Stop the task and flush (application shutdown)
+        - get_stats: Hit/miss/flush counters
+    """
+
+    def __init__(
+        self,
+        enabled: bool,
+        ttl_seconds: float,
+        max_entries: int,
+        flush_interval_seconds: float
+    ):
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.flush_interval_seconds = flush_interval_seconds
+
+        # key value -> (detached ApiKey, monotonic time cached), least recently used first
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        # api_key id -> latest last_used_at not yet written
+        self._pending_uses: Dict[int, datetime] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.misses = 0
+        self.flushed = 0
+
+    # ============================================
+    # Validated Keys
+    # ============================================
+
+    def get(self, key_value: str) -> Optional[ApiKey]:
+        """
+        Look up a validated key
+
+        Args:
+            key_value: API key string
+
+        Returns:
+            Detached ApiKey, or None on miss (not cached, TTL elapsed, expired)
+        """
+        entry = self._entries.get(key_value)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        api_key, cached_at = entry
+        if time.monotonic() - cached_at > self.ttl_seconds or api_key.is_expired:
+            # Re-validate against the database (which also marks expiry)
+            del self._entries[key_value]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key_value)
+        self.hits += 1
+        return api_key
+
+    def put(self, api_key: ApiKey) -> ApiKey:
+        """
+        Cache a key that passed validation
+
+        Args:
+            api_key: Validated ApiKey (attached to a session)
+
+        Returns:
+            Detached copy of the key, safe to share between requests
+        """
+        snapshot = ApiKey(
+            id=api_key.id,
+            user_id=api_key.user_id,
+            key=api_key.key,
+            name=api_key.name,
+            status=api_key.status,
+            created_at=api_key.created_at,
+            expires_at=api_key.expires_at,
+            last_used_at=api_key.last_used_at
+        )
+        if not self.enabled:
+            return snapshot
+
+        self._entries[api_key.key] = (snapshot, time.monotonic())
+        self._entries.move_to_end(api_key.key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return snapshot
+
+    def invalidate(self, key_value: str) -> None:
+        """
+        Drop a key from the cache (revoked, expired)
+
+        Args:
+            key_value: API key string
+        """
+        self._entries.pop(key_value, None)
+
+    def clear(self) -> None:
+        """Drop all cached keys and pending updates"""
+        self._entries.clear()
+        self._pending_uses.clear()
+
+    # ============================================
+    # Write-behind last_used_at
+    # ============================================
+
+    def record_use(self, api_key: ApiKey) -> None:
+        """
+        Remember that a key was used now (written by the next flush)
+
+        Args:
+            api_key: Validated ApiKey
+        """
+        used_at = datetime.now(timezone.utc)
+        api_key.last_used_at = used_at
+        self._pending_uses[api_key.id] = used_at
+
+    async def flush(self, db: AsyncSession) -> int:
+        """
+        Write pending last_used_at updates in one batched UPDATE
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of keys updated (0 if nothing was pending or the write failed)
+        """
+        if not self._pending_uses:
+            return 0
+
+        pending, self._pending_uses = self._pending_uses, {}
+        try:
+            await db.execute(
+                update(ApiKey),
+                [{"id": key_id, "last_used_at": used_at} for key_id, used_at in pending.items()]
+            )
+            await db.commit()
+        except Exception as e:
+            logger.warning(f"API key last_used_at flush failed: {e}")
+            await db.rollback()
+            for key_id, used_at in pending.items():
+                # Uses recorded meanwhile are newer
+                self._pending_uses.setdefault(key_id, used_at)
+            return 0
+
+        self.flushed += len(pending)
+        return len(pending)
+
+    def start(self) -> None:
+        """Start the periodic flush task on the running event loop"""
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop(), name="api-key-last-used-flush")
+
+    async def stop(self) -> None:
+        """Stop the periodic flush task and write what is still pending"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+        async with AsyncSessionLocal() as db:
+            await self.flush(db)
+
+    async def _flush_loop(self) -> None:
+        """Flush pending last_used_at updates every flush_interval_seconds until cancelled"""
+        while True:
+            await asyncio.sleep(self.flush_interval_seconds)
+            try:
+                async with AsyncSessionLocal() as db:
+                    await self.flush(db)
+            except Exception as e:
+                logger.warning(f"API key last_used_at flush failed: {e}")
+
+    def get_stats(self) -> Dict:
+        """Cache counters"""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "pending_last_used": len(self._pending_uses),
+            "flushed_last_used": self.flushed
+        }
+
+
+# Global cache (one per application process)
+api_key_cache = ApiKeyCache(
+    enabled=settings.API_KEY_CACHE_ENABLED,
+    ttl_seconds=settings.API_KEY_CACHE_TTL_SECONDS,
+    max_entries=settings.API_KEY_CACHE_MAX_ENTRIES,
+    flush_interval_seconds=settings.API_KEY_LAST_USED_FLUSH_SECONDS
+)
@@ -9,6 +9,7 @@ from datetime import datetime, timedelta, timezone
 from fastapi import HTTPException, status
 from app.models.api_key import ApiKey
 from app.models.user import User
+from app.services.api_key_cache import api_key_cache
 from app.schemas.api_key import ApiKeyCreate, ApiKeyResponse, ApiKeyListItem
 from app.utils.security import generate_api_key
 from app.config import settings
@@ -24,6 +25,8 @@ class ApiKeyService:
         - Keys expire after 30 days (configurable)
         - Full key shown only once during creation
         - Keys can be active, expired, or revoked
+        - Validated keys are cached in process (api_key_cache); revoking a
+          key invalidates it, last_used_at is written in periodic batches
 
     Methods:
         - create_api_key: Generate new API key for user
@@ -216,6 +219,7 @@ class ApiKeyService:
             # Revoke the key
             api_key.status = 'revoked'
             await db.commit()
+            api_key_cache.invalidate(api_key.key)
 
             return {
                 "message": f"API key '{api_key.name}' has been revoked successfully",
@@ -241,17 +245,27 @@ class ApiKeyService:
             2. Status is 'active'
             3. Not expired (expires_at > now)
 
+        Keys that pass are cached for API_KEY_CACHE_TTL_SECONDS (hits skip
+        the database, expiry is still checked), and last_used_at is recorded
+        for the next batched flush instead of being committed per request.
+
         Args:
             api_key_value: API key string (mk_live_XXXXXXXX...)
             db: Database session
 
         Returns:
-            ApiKey object (with user relationship loaded)
+            ApiKey object (detached copy when the cache is enabled)
 
         Raises:
             HTTPException 401: If key is invalid, expired, or revoked
         """
         try:
+            # Validated recently: no database round trip
+            cached_key = api_key_cache.get(api_key_value)
+            if cached_key is not None:
+                api_key_cache.record_use(cached_key)
+                return cached_key
+
             # Find API key
             stmt = select(ApiKey).where(ApiKey.key == api_key_value)
             result = await db.execute(stmt)
@@ -285,10 +299,15 @@ class ApiKeyService:
                     headers={"WWW-Authenticate": "ApiKey"}
                 )
 
-            # Update last_used_at timestamp
-            api_key.last_used_at = datetime.now(timezone.utc)
-            await db.commit()
+            if not api_key_cache.enabled:
+                # Update last_used_at timestamp
+                api_key.last_used_at = datetime.now(timezone.utc)
+                await db.commit()
+                return api_key
 
+            # last_used_at is written by the periodic batched flush
+            api_key = api_key_cache.put(api_key)
+            api_key_cache.record_use(api_key)
             return api_key
 
         except HTTPException:
@@ -0,0 +1,396 @@
+"""
+API Usage Service
+Hourly usage rollups and monthly partitions of api_call_logs
+"""
+
+import logging
+import re
+from bisect import bisect_left
+from datetime import date, datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import BigInteger, func, literal_column, select, text
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.api_usage_hourly import ApiUsageHourly
+
+logger = logging.getLogger(__name__)
+
+# Partition names: api_call_logs_y2026m10 holds October 2026
+_PARTITION_NAME = re.compile(r"^api_call_logs_y(\d{4})m(\d{2})$")
+
+
+class ApiUsageService:
+    """
+    Usage analytics over the hourly rollup, and api_call_logs partition upkeep
+
+    Business Rules:
+        - Each batch of API call logs is rolled up per (hour, user, API key)
+          and upserted in the same transaction as the raw rows, so the
+          rollup always matches the log
+        - Latency percentiles come from fixed-bucket histograms
+          (LATENCY_BUCKETS_MS), interpolated within a bucket; histograms add
+          up, so any range of hours can be summarized exactly as buckets
+        - api_call_logs partitions are created months_ahead months in
+          advance; partitions entirely older than retention_months are
+          dropped (0 keeps everything). Rollups are never dropped
+
+    Methods:
+        - rollup_rows: Aggregate log rows into hourly rollup rows
+        - upsert_statement: Upsert adding rollup rows to api_usage_hourly
+        - record_batch: Upsert the rollup of a batch of log rows
+        - percentile: Latency percentile from a histogram
+        - get_hourly_usage: Hourly usage of a user (optionally one key)
+        - get_usage_summary: Totals and percentiles of a user over a range
+        - maintain_partitions: Create upcoming and drop expired partitions
+    """
+
+    # Upper bounds (ms) of the latency histogram buckets; one extra bucket
+    # counts calls slower than the last bound
+    LATENCY_BUCKETS_MS: Tuple[float, ...] = (
+        5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000, 120000
+    )
+
+    # ============================================
+    # Rollup Maintenance
+    # ============================================
+
+    @staticmethod
+    def rollup_rows(rows: Iterable[Dict]) -> List[Dict]:
+        """
+        Aggregate API call log rows into hourly rollup rows
+
+        Args:
+            rows: Log rows (ApiCallLogger row dicts)
+
+        Returns:
+            One rollup row per (hour, user_id, api_key), sorted by that key
+        """
+        bounds = ApiUsageService.LATENCY_BUCKETS_MS
+        rollups: Dict[tuple, Dict] = {}
+        for row in rows:
+            bucket_start = row["created_at"].replace(minute=0, second=0, microsecond=0)
+            key = (bucket_start, row["user_id"], row["api_key"])
+            rollup = rollups.get(key)
+            if rollup is None:
+                rollup = rollups[key] = {
+                    "bucket_start": bucket_start,
+                    "user_id": row["user_id"],
+                    "api_key": row["api_key"],
+                    "call_count": 0,
+                    "success_count": 0,
+                    "client_error_count": 0,
+                    "server_error_count": 0,
+                    "total_execution_time_ms": 0.0,
+                    "max_execution_time_ms": None,
+                    "latency_histogram": [0] * (len(bounds) + 1)
+                }
+
+            rollup["call_count"] += 1
+            status_code = row["status_code"]
+            if 200 <= status_code < 300:
+                rollup["success_count"] += 1
+            elif 400 <= status_code < 500:
+                rollup["client_error_count"] += 1
+            elif status_code >= 500:
+                rollup["server_error_count"] += 1
+
+            elapsed = row.get("execution_time_ms")
+            if elapsed is not None:
+                rollup["total_execution_time_ms"] += elapsed
+                rollup["latency_histogram"][bisect_left(bounds, elapsed)] += 1
+                if rollup["max_execution_time_ms"] is None or elapsed > rollup["max_execution_time_ms"]:
+                    rollup["max_execution_time_ms"] = elapsed
+
+        # Fixed upsert order: concurrent writers lock rows in the same order
+        return [rollups[key] for key in sorted(rollups)]
+
+    @staticmethod
+    def upsert_statement(rollups: List[Dict]):
+        """
+        Build the upsert adding rollup rows to api_usage_hourly
+
+        Args:
+            rollups: Rows from rollup_rows
+
+        Returns:
+            INSERT ... ON CONFLICT DO UPDATE statement
+        """
+        table = ApiUsageHourly.__table__
+        statement = pg_insert(table).values(rollups)
+        excluded = statement.excluded
+        return statement.on_conflict_do_update(
+            index_elements=[table.c.user_id, table.c.bucket_start, table.c.api_key],
+            set_={
+                "call_count": table.c.call_count + excluded.call_count,
+                "success_count": table.c.success_count + excluded.success_count,
+                "client_error_count": table.c.client_error_count + excluded.client_error_count,
+                "server_error_count": table.c.server_error_count + excluded.server_error_count,
+                "total_execution_time_ms": (
+                    table.c.total_execution_time_ms + excluded.total_execution_time_ms
+                ),
+                # GREATEST ignores NULLs
+                "max_execution_time_ms": func.greatest(
+                    table.c.max_execution_time_ms, excluded.max_execution_time_ms
+                ),
+                # Element-wise sum of the two histograms
+                "latency_histogram": literal_column(
+                    "ARRAY(SELECT a + b FROM unnest(api_usage_hourly.latency_histogram, "
+                    "excluded.latency_histogram) WITH ORDINALITY AS t(a, b, i) ORDER BY i)",
+                    type_=ARRAY(BigInteger)
+                )
+            }
+        )
+
+    @staticmethod
+    async def record_batch(db: AsyncSession, rows: List[Dict]) -> int:
+        """
+        Add a batch of API call log rows to the hourly rollup (no commit)
+
+        Args:
+            db: Database session (the transaction inserting the rows)
+            rows: Log rows being inserted
+
+        Returns:
+            Number of rollup rows upserted
+        """
+        rollups = ApiUsageService.rollup_rows(rows)
+        if rollups:
+            await db.execute(ApiUsageService.upsert_statement(rollups))
+        return len(rollups)
+
+    # ============================================
+    # Usage Queries
+    # ============================================
+
+    @staticmethod
+    def percentile(histogram: List[int], q: float, max_ms: Optional[float] = None) -> Optional[float]:
+        """
+        Estimate a latency percentile from a histogram
+
+        Args:
+            histogram: Calls per LATENCY_BUCKETS_MS bucket
+            q: Percentile (0-100)
+            max_ms: Slowest call, bounds the overflow bucket
+
+        Returns:
+            Latency in ms (linear within the bucket), or None without timed calls
+        """
+        bounds = ApiUsageService.LATENCY_BUCKETS_MS
+        total = sum(histogram)
+        if total == 0:
+            return None
+
+        rank = q / 100.0 * total
+        cumulative = 0
+        for index, count in enumerate(histogram):
+            if count and cumulative + count >= rank:
+                lower = bounds[index - 1] if index > 0 else 0.0
+                if index < len(bounds):
+                    upper = bounds[index] if max_ms is None else min(bounds[index], max_ms)
+                else:
+                    upper = max_ms if max_ms is not None else lower
+                return lower + (upper - lower) * (rank - cumulative) / count
+            cumulative += count
+        return max_ms
+
+    @staticmethod
+    def _usage_row(
+        calls: int,
+        success: int,
+        client_errors: int,
+        server_errors: int,
+        total_ms: float,
+        max_ms: Optional[float],
+        histogram: List[int]
+    ) -> Dict:
+        """Counts plus average and percentile latencies"""
+        timed = sum(histogram)
+        return {
+            "call_count": calls,
+            "success_count": success,
+            "client_error_count": client_errors,
+            "server_error_count": server_errors,
+            "avg_execution_time_ms": total_ms / timed if timed else None,
+            "max_execution_time_ms": max_ms,
+            "p50_execution_time_ms": ApiUsageService.percentile(histogram, 50, max_ms),
+            "p95_execution_time_ms": ApiUsageService.percentile(histogram, 95, max_ms),
+            "p99_execution_time_ms": ApiUsageService.percentile(histogram, 99, max_ms)
+        }
+
+    @staticmethod
+    async def _rollups(
+        db: AsyncSession,
+        user_id: int,
+        start: datetime,
+        end: datetime,
+        api_key: Optional[str]
+    ) -> List[ApiUsageHourly]:
+        """Rollup rows of a user with bucket_start in [start, end)"""
+        query = select(ApiUsageHourly).where(
+            ApiUsageHourly.user_id == user_id,
+            ApiUsageHourly.bucket_start >= start,
+            ApiUsageHourly.bucket_start < end
+        )
+        if api_key is not None:
+            query = query.where(ApiUsageHourly.api_key == api_key)
+        result = await db.execute(query.order_by(ApiUsageHourly.bucket_start, ApiUsageHourly.api_key))
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def get_hourly_usage(
+        db: AsyncSession,
+        user_id: int,
+        start: datetime,
+        end: datetime,
+        api_key: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Hourly usage of a user, one entry per hour and API key
+
+        Args:
+            db: Database session
+            user_id: User ID
+            start: First hour (inclusive)
+            end: End of the range (exclusive)
+            api_key: Restrict to one API key
+
+        Returns:
+            Usage entries with bucket_start, api_key, counts and latencies
+        """
+        rollups = await ApiUsageService._rollups(db, user_id, start, end, api_key)
+        return [
+            {
+                "bucket_start": rollup.bucket_start,
+                "api_key": rollup.api_key,
+                **ApiUsageService._usage_row(
+                    rollup.call_count,
+                    rollup.success_count,
+                    rollup.client_error_count,
+                    rollup.server_error_count,
+                    rollup.total_execution_time_ms,
+                    rollup.max_execution_time_ms,
+                    rollup.latency_histogram
+                )
+            }
+            for rollup in rollups
+        ]
+
+    @staticmethod
+    async def get_usage_summary(
+        db: AsyncSession,
+        user_id: int,
+        start: datetime,
+        end: datetime,
+        api_key: Optional[str] = None
+    ) -> Dict:
+        """
+        Usage of a user over a range (billing), from merged hourly rollups
+
+        Args:
+            db: Database session
+            user_id: User ID
+            start: First hour (inclusive)
+            end: End of the range (exclusive)
+            api_key: Restrict to one API key
+
+        Returns:
+            Counts and latencies over the whole range
+        """
+        rollups = await ApiUsageService._rollups(db, user_id, start, end, api_key)
+        histogram = [0] * (len(ApiUsageService.LATENCY_BUCKETS_MS) + 1)
+        max_ms = None
+        for rollup in rollups:
+            histogram = [a + b for a, b in zip(histogram, rollup.latency_histogram)]
+            if rollup.max_execution_time_ms is not None:
+                max_ms = max(max_ms or 0.0, rollup.max_execution_time_ms)
+
+        return ApiUsageService._usage_row(
+            sum(r.call_count for r in rollups),
+            sum(r.success_count for r in rollups),
+            sum(r.client_error_count for r in rollups),
+            sum(r.server_error_count for r in rollups),
+            sum(r.total_execution_time_ms for r in rollups),
+            max_ms,
+            histogram
+        )
+
+    # ============================================
+    # Partitions
+    # ============================================
+
+    @staticmethod
+    def add_months(month: date, months: int) -> date:
+        """First day of the month months after month"""
+        index = month.year * 12 + month.month - 1 + months
+        return date(index // 12, index % 12 + 1, 1)
+
+    @staticmethod
+    def partition_name(month: date) -> str:
+        """Name of the api_call_logs partition holding month"""
+        return f"api_call_logs_y{month.year:04d}m{month.month:02d}"
+
+    @staticmethod
+    def partition_month(name: str) -> Optional[date]:
+        """Month held by a partition, None for other tables (default partition)"""
+        match = _PARTITION_NAME.match(name)
+        if match is None:
+            return None
+        return date(int(match.group(1)), int(match.group(2)), 1)
+
+    @staticmethod
+    async def maintain_partitions(
+        db: AsyncSession,
+        months_ahead: int,
+        retention_months: int,
+        now: Optional[datetime] = None
+    ) -> Dict:
+        """
+        Create missing monthly partitions and drop expired ones
+
+        Args:
+            db: Database session
+            months_ahead: Months after the current one to create in advance
+            retention_months: Months of raw logs to keep besides the current
+                one (0 = keep all)
+            now: Current time (default: now, UTC)
+
+        Returns:
+            Names of created and dropped partitions
+        """
+        now = now or datetime.now(timezone.utc)
+        current = date(now.year, now.month, 1)
+
+        result = await db.execute(text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = 'api_call_logs'::regclass"
+        ))
+        existing = {ApiUsageService.partition_month(name) for (name,) in result.all()}
+
+        created = []
+        for offset in range(months_ahead + 1):
+            month = ApiUsageService.add_months(current, offset)
+            if month in existing:
+                continue
+            name = ApiUsageService.partition_name(month)
+            await db.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF api_call_logs "
+                f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') "
+                f"TO ('{ApiUsageService.add_months(month, 1).isoformat()} 00:00:00+00')"
+            ))
+            created.append(name)
+
+        dropped = []
+        if retention_months > 0:
+            oldest_kept = ApiUsageService.add_months(current, -retention_months)
+            for month in sorted(m for m in existing if m is not None and m < oldest_kept):
+                name = ApiUsageService.partition_name(month)
+                await db.execute(text(f"DROP TABLE IF EXISTS {name}"))
+                dropped.append(name)
+
+        await db.commit()
+        if created or dropped:
+            logger.info(f"api_call_logs partitions created: {created}, dropped: {dropped}")
+        return {"created": created, "dropped": dropped}
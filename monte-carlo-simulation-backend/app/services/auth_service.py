@@ -10,7 +10,9 @@ from fastapi import HTTPException, status
 from app.models.user import User
 from app.schemas.user import UserRegister, UserLogin, UserResponse
 from app.schemas.auth import Token, TokenData
-from app.utils.security import hash_password, verify_password, create_access_token
+from app.utils.security import create_access_token
+from app.services.password_hasher import password_hasher
+from app.services.user_status_cache import user_status_cache
 
 
 class AuthService:
@@ -22,6 +24,7 @@ class AuthService:
         - login_user: Authenticate user and issue JWT token
         - get_user_by_email: Retrieve user by email
         - get_user_by_id: Retrieve user by ID
+        - get_cached_user: Retrieve user by ID through the user status cache
     """
 
     @staticmethod
@@ -31,7 +34,7 @@ class AuthService:
 
         Steps:
             1. Check if email already exists
-            2. Hash password using bcrypt (12 rounds)
+            2. Hash password using bcrypt (12 rounds, password hashing pool)
             3. Create user record in database
             4. Return user data (without password)
 
@@ -44,6 +47,7 @@ class AuthService:
 
         Raises:
             HTTPException 400: If email already exists
+            HTTPException 429: If the password hashing pool is saturated
             HTTPException 500: If database error occurs
         """
         try:
@@ -59,7 +63,7 @@ class AuthService:
                 )
 
             # Hash password
-            password_hash = hash_password(user_data.password)
+            password_hash = await password_hasher.hash(user_data.password)
 
             # Create new user
             new_user = User(
@@ -94,7 +98,7 @@ class AuthService:
 
         Steps:
             1. Find user by email
-            2. Verify password
+            2. Verify password (password hashing pool)
             3. Update last_login_at timestamp
             4. Generate JWT token (24-hour expiry)
 
@@ -107,6 +111,7 @@ class AuthService:
 
         Raises:
             HTTPException 401: If credentials are invalid
+            HTTPException 429: If the password hashing pool is saturated
             HTTPException 500: If database error occurs
         """
         try:
@@ -124,7 +129,7 @@ class AuthService:
                 )
 
             # Verify password
-            if not verify_password(credentials.password, user.password_hash):
+            if not await password_hasher.verify(credentials.password, user.password_hash):
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Invalid email or password",
@@ -214,6 +219,26 @@ class AuthService:
 
         return user
 
+    @staticmethod
+    async def get_cached_user(user_id: int, db: AsyncSession) -> User:
+        """
+        Retrieve user by ID, from the user status cache when possible
+
+        Args:
+            user_id: User ID
+            db: Database session (used on cache miss)
+
+        Returns:
+            Detached User (no password hash)
+
+        Raises:
+            HTTPException 404: If user not found
+        """
+        user = user_status_cache.get(user_id)
+        if user is None:
+            user = user_status_cache.put(await AuthService.get_user_by_id(user_id, db))
+        return user
+
     @staticmethod
     async def update_user_profile(
         user_id: int,
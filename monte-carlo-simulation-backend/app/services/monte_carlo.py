@@ -3,31 +3,306 @@ Monte Carlo Simulation Service
 Numba-optimized portfolio simulation engine
 """
 
+import asyncio
 import numpy as np
-from numba import jit, prange
-from typing import Dict, List
-from app.schemas.simulation import SimulationRequest
+from numba import jit, njit, prange
+from collections import defaultdict
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+from app.schemas.simulation import SimulationParameters, SimulationRequest
+from app.services.bloomberg import BloombergService
+from app.services.simulation_executor import simulation_executor
+from app.services import qmc, statistics
+from app.services.rng import (
+    fill_standard_normals,
+    fill_standard_normals32,
+    path_stream,
+    standard_normals,
+    standard_normal_block
+)
 import time
 import uuid
 
 
+# Normals generated per block in the streaming kernels (even: whole pairs;
+# small enough to stay in L1 cache)
+STEP_BLOCK = 256
+
+
+@njit(cache=True)
+def _sum_standard_normals(key: np.uint64, num_draws: int) -> float:
+    """Sum of the first num_draws normals of the stream, generated in blocks"""
+    buffer = np.empty(min(STEP_BLOCK, num_draws))
+    total = 0.0
+    for start in range(0, num_draws, STEP_BLOCK):
+        block = buffer[:min(STEP_BLOCK, num_draws - start)]
+        fill_standard_normals(key, start // 2, block)
+        total += block.sum()
+    return total
+
+
+@njit(cache=True)
+def _sum_standard_normals32(key: np.uint64, num_draws: int) -> np.float32:
+    """float32 sum of the first num_draws normals, Kahan-compensated"""
+    buffer = np.empty(min(STEP_BLOCK, num_draws), dtype=np.float32)
+    total = np.float32(0.0)
+    compensation = np.float32(0.0)
+    for start in range(0, num_draws, STEP_BLOCK):
+        block = buffer[:min(STEP_BLOCK, num_draws - start)]
+        fill_standard_normals32(key, start // 2, block)
+        for t in range(block.shape[0]):
+            # Kahan summation: compensation carries the lost low-order bits
+            increment = block[t] - compensation
+            updated = total + increment
+            compensation = (updated - total) - increment
+            total = updated
+    return total
+
+
+@njit(cache=True)
+def _deposit_step(month: int, steps_per_year: int) -> int:
+    """First step on or after the end of a month (when its deposit is made)"""
+    return (month * steps_per_year + 11) // 12
+
+
+@njit(cache=True)
+def _deposits_due(step: int, steps_per_year: int) -> int:
+    """Number of month ends in ((step - 1) * dt, step * dt] (deposits made at step)"""
+    return (step * 12) // steps_per_year - ((step - 1) * 12) // steps_per_year
+
+
+@njit(cache=True)
+def _sum_with_deposits(key: np.uint64, num_steps: int, steps_per_year: int, drift: float,
+                       signed_vol: float) -> tuple:
+    """
+    Normal sum and deposit discount sum of one path, in one pass over the steps
+
+    Returns (ΣZ, Σ_m 1 / G(t_m)) where G(t) = exp(drift * steps + σ√dt * ΣZ)
+    is the growth factor of the path up to t and t_m are the deposit steps;
+    each deposit then grows by G(T) / G(t_m) along its own path.
+    """
+    buffer = np.empty(min(STEP_BLOCK, num_steps))
+    normal_sum = 0.0
+    discount_sum = 0.0
+    month = 1
+    next_deposit = _deposit_step(month, steps_per_year)
+    for start in range(0, num_steps, STEP_BLOCK):
+        block = buffer[:min(STEP_BLOCK, num_steps - start)]
+        fill_standard_normals(key, start // 2, block)
+        # Sum the block in segments that end at deposit steps
+        position = 0
+        while next_deposit <= start + block.shape[0]:
+            end = next_deposit - start
+            normal_sum += block[position:end].sum()
+            position = end
+            discount = np.exp(-(drift * next_deposit + signed_vol * normal_sum))
+            while _deposit_step(month, steps_per_year) == next_deposit:
+                discount_sum += discount
+                month += 1
+            next_deposit = _deposit_step(month, steps_per_year)
+        normal_sum += block[position:].sum()
+    return normal_sum, discount_sum
+
+
+@njit(cache=True)
+def _sum_with_deposits32(key: np.uint64, num_steps: int, steps_per_year: int, drift: np.float32,
+                         signed_vol: np.float32) -> tuple:
+    """float32 variant of _sum_with_deposits, normal sum Kahan-compensated"""
+    buffer = np.empty(min(STEP_BLOCK, num_steps), dtype=np.float32)
+    normal_sum = np.float32(0.0)
+    compensation = np.float32(0.0)
+    discount_sum = np.float32(0.0)
+    month = 1
+    next_deposit = _deposit_step(month, steps_per_year)
+    for start in range(0, num_steps, STEP_BLOCK):
+        block = buffer[:min(STEP_BLOCK, num_steps - start)]
+        fill_standard_normals32(key, start // 2, block)
+        for k in range(block.shape[0]):
+            increment = block[k] - compensation
+            updated = normal_sum + increment
+            compensation = (updated - normal_sum) - increment
+            normal_sum = updated
+            step = start + k + 1
+            while step == next_deposit:
+                discount_sum += np.exp(-(drift * np.float32(step) + signed_vol * normal_sum))
+                month += 1
+                next_deposit = _deposit_step(month, steps_per_year)
+    return normal_sum, discount_sum
+
+
+@njit(cache=True)
+def _sum_standard_normals_at(key: np.uint64, checkpoints: np.ndarray, out: np.ndarray) -> None:
+    """
+    Sums of the first checkpoints[k] normals of the stream, in one pass
+
+    Blocks and summation order are those of _sum_standard_normals, so
+    out[k] equals _sum_standard_normals(key, checkpoints[k]) exactly.
+    Checkpoints must be ascending.
+    """
+    num_draws = checkpoints[-1]
+    buffer = np.empty(min(STEP_BLOCK, num_draws))
+    total = 0.0
+    k = 0
+    for start in range(0, num_draws, STEP_BLOCK):
+        block = buffer[:min(STEP_BLOCK, num_draws - start)]
+        fill_standard_normals(key, start // 2, block)
+        while k < checkpoints.shape[0] and checkpoints[k] <= start + block.shape[0]:
+            out[k] = total + block[:checkpoints[k] - start].sum()
+            k += 1
+        total += block.sum()
+
+
+@njit(cache=True)
+def _sum_with_deposits_at(key: np.uint64, checkpoints: np.ndarray, steps_per_year: int, drift: float,
+                          signed_vol: float, normal_out: np.ndarray, discount_out: np.ndarray) -> None:
+    """
+    _sum_with_deposits up to each of several (ascending) step counts, in one pass
+
+    Segments and summation order are those of _sum_with_deposits, so
+    (normal_out[k], discount_out[k]) equals _sum_with_deposits(key,
+    checkpoints[k], ...) exactly.
+    """
+    num_steps = checkpoints[-1]
+    buffer = np.empty(min(STEP_BLOCK, num_steps))
+    normal_sum = 0.0
+    discount_sum = 0.0
+    month = 1
+    next_deposit = _deposit_step(month, steps_per_year)
+    k = 0
+    for start in range(0, num_steps, STEP_BLOCK):
+        block = buffer[:min(STEP_BLOCK, num_steps - start)]
+        fill_standard_normals(key, start // 2, block)
+        block_end = start + block.shape[0]
+        position = 0
+        while True:
+            if k < checkpoints.shape[0] and checkpoints[k] <= block_end and checkpoints[k] < next_deposit:
+                # Every deposit up to the checkpoint is in: record its sums
+                normal_out[k] = normal_sum + block[position:checkpoints[k] - start].sum()
+                discount_out[k] = discount_sum
+                k += 1
+            elif next_deposit <= block_end:
+                end = next_deposit - start
+                normal_sum += block[position:end].sum()
+                position = end
+                discount = np.exp(-(drift * next_deposit + signed_vol * normal_sum))
+                while _deposit_step(month, steps_per_year) == next_deposit:
+                    discount_sum += discount
+                    month += 1
+                next_deposit = _deposit_step(month, steps_per_year)
+            else:
+                break
+        normal_sum += block[position:].sum()
+
+
+@njit(cache=True)
+def _fill_gbm_path(row: np.ndarray, S0: float, drift: float, signed_vol: float, key: np.uint64,
+                   contribution: float, steps_per_year: int) -> None:
+    """
+    Write one GBM path into row: bulk normals, cumulative log-returns, exp
+
+    The normals are generated into row itself, turned into log-values by a
+    running sum and exponentiated in one final sweep, so there is no
+    exp-multiply dependency chain between steps. Monthly deposits are folded
+    into the same sweep: V(t) = G(t) * (S0 + contribution * Σ_m≤t 1 / G(t_m)).
+    """
+    fill_standard_normals(key, 0, row[1:])
+    row[0] = 0.0
+    for t in range(1, row.shape[0]):
+        row[t] = row[t - 1] + drift + signed_vol * row[t]
+    discount_sum = 0.0
+    row[0] = S0
+    for t in range(1, row.shape[0]):
+        growth = np.exp(row[t])
+        if contribution > 0.0:
+            discount_sum += _deposits_due(t, steps_per_year) / growth
+        row[t] = growth * (S0 + contribution * discount_sum)
+
+
+@njit(cache=True)
+def _fill_gbm_path32(row: np.ndarray, S0: np.float32, drift: np.float32, signed_vol: np.float32,
+                     key: np.uint64, contribution: np.float32, steps_per_year: int) -> None:
+    """float32 variant of _fill_gbm_path with a Kahan-compensated running sum"""
+    fill_standard_normals32(key, 0, row[1:])
+    log_value = np.float32(0.0)
+    compensation = np.float32(0.0)
+    row[0] = S0
+    for t in range(1, row.shape[0]):
+        increment = drift + signed_vol * row[t] - compensation
+        updated = log_value + increment
+        compensation = (updated - log_value) - increment
+        log_value = updated
+        row[t] = log_value
+    discount_sum = np.float32(0.0)
+    for t in range(1, row.shape[0]):
+        growth = np.exp(row[t])
+        if contribution > np.float32(0.0):
+            discount_sum += np.float32(_deposits_due(t, steps_per_year)) / growth
+        row[t] = growth * (S0 + contribution * discount_sum)
+
+
 class MonteCarloService:
     """
     Monte Carlo simulation engine with Numba optimization
 
     Performance:
-        - 10,000 paths in ~2-5 seconds (Numba JIT compilation)
+        - Kernels are compiled at worker start-up (warmup) and cached on disk,
+          so requests never pay the ~2-5 second Numba JIT compilation
+        - 10,000 paths in ~2-5 seconds
         - 100,000 paths in ~20-50 seconds
         - 10-100x faster than pure Python
 
     Methods:
-        - run_simulation: Main entry point for portfolio simulation
-        - simulate_gbm_paths: Numba-optimized GBM path simulation
+        - run_simulation: Main entry point (runs simulate in the worker pool)
+        - stream_simulation: Runs simulate in the worker pool, yielding interim results
+        - run_batch: Runs simulate_batch in the worker pool
+        - simulate: Synchronous portfolio simulation (CPU-bound)
+        - simulate_batch: Several simulations in one call, sharing random draws
+        - warmup: JIT-compile all kernels with tiny inputs
+        - simulate_gbm_paths: Numba-optimized GBM path simulation (full path matrix)
+        - simulate_gbm_terminal_values: Streaming GBM kernel (terminal values only)
+        - simulate_normal_sums: Per-path sums of the step normals (shared draws)
+        - simulate_deposit_sums: Per-path normal and deposit discount sums
+        - simulate_gbm_terminal_from_sums: Terminal values from shared sums
+        - simulate_gbm_terminal_exact: Closed-form GBM terminal sampling
+        - simulate_gbm_terminal_qmc: Closed-form sampling with scrambled Sobol points
+        - simulate_correlated_terminal_values: Correlated multi-asset simulation
         - calculate_statistics: Compute risk metrics from simulation results
     """
 
+    # Bump whenever kernel output for a given seed changes (invalidates cached results)
+    ENGINE_VERSION = 5
+
+    # Documented bound on float32 percentile drift (relative to float64,
+    # same seed); checked by benchmarks/bench_float32.py
+    FLOAT32_PERCENTILE_TOLERANCE = 1e-4
+
+    # Steps per year for each time_step (252 trading days)
+    STEPS_PER_YEAR = {
+        'daily': 252,
+        'weekly': 52,
+        'monthly': 12,
+        'annual': 1
+    }
+
+    # Adaptive path count: paths per batch (and rounding of batch sizes)
+    ADAPTIVE_BATCH_PATHS = 1000
+
+    # Simplified assumptions for MVP (replace with Bloomberg data in production)
+    ASSET_RETURNS = {
+        'equity': 0.12,    # 12% annual return
+        'bonds': 0.06,     # 6% annual return
+        'commodity': 0.08, # 8% annual return
+        'cash': 0.03       # 3% annual return
+    }
+
+    ASSET_VOLATILITY = {
+        'equity': 0.18,    # 18% volatility
+        'bonds': 0.05,     # 5% volatility
+        'commodity': 0.15, # 15% volatility
+        'cash': 0.01       # 1% volatility
+    }
+
     @staticmethod
-    @jit(nopython=True, parallel=True)
+    @jit(nopython=True, parallel=True, cache=True)
     def simulate_gbm_paths(
         S0: float,
         mu: float,
@@ -35,7 +310,9 @@ class MonteCarloService:
         T: int,
         dt: float,
         num_paths: int,
-        seed: int = 42
+        seed: int = 42,
+        path_offset: int = 0,
+        antithetic: bool = False
     ) -> np.ndarray:
         """
         Simulate stock price paths using Geometric Brownian Motion (Numba-optimized)
@@ -44,51 +321,791 @@ class MonteCarloService:
             dS = μ * S * dt + σ * S * dW
             S(t+dt) = S(t) * exp((μ - 0.5σ²)dt + σ√dt * Z)
 
+        Each row is built as S0 * exp(cumulative sum of log-returns): the
+        normals are drawn in bulk and the exponentials are independent,
+        rather than one exp-and-multiply per step on the previous value.
+
         Args:
             S0: Initial portfolio value
             mu: Expected return (drift) - annual
             sigma: Volatility - annual
             T: Time horizon in years
-            dt: Time step (1/252 for daily)
+            dt: Time step (1/252 daily, 1/12 monthly)
             num_paths: Number of simulation paths
             seed: Random seed for reproducibility
+            path_offset: Global index of the first path (for sharding)
+            antithetic: Pair paths 2k and 2k + 1 with mirrored normals
 
         Returns:
             Array of shape (num_paths, num_steps + 1) with simulated prices
         """
-        np.random.seed(seed)
         num_steps = int(T / dt)
-        paths = np.zeros((num_paths, num_steps + 1))
-        paths[:, 0] = S0
+        paths = np.empty((num_paths, num_steps + 1))
 
         drift = (mu - 0.5 * sigma**2) * dt
         vol = sigma * np.sqrt(dt)
 
         # Parallel loop over paths (Numba optimization)
+        # Each path draws from its own counter-based stream keyed by (seed, path)
         for i in prange(num_paths):
-            for t in range(1, num_steps + 1):
-                Z = np.random.standard_normal()
-                paths[i, t] = paths[i, t-1] * np.exp(drift + vol * Z)
+            key, sign = path_stream(seed, path_offset + i, antithetic)
+            _fill_gbm_path(paths[i], S0, drift, sign * vol, key, 0.0, 1)
 
         return paths
 
     @staticmethod
-    async def run_simulation(request: SimulationRequest) -> Dict:
+    @jit(nopython=True, parallel=True, cache=True)
+    def simulate_gbm_terminal_values(
+        S0: float,
+        mu: float,
+        sigma: float,
+        T: int,
+        dt: float,
+        num_paths: int,
+        num_sample_paths: int = 0,
+        seed: int = 42,
+        path_offset: int = 0,
+        antithetic: bool = False,
+        monthly_contribution: float = 0.0
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Simulate GBM terminal values without materializing the path matrix
+
+        The log-return of a path is drift * num_steps + σ√dt * ΣZ: normals
+        are generated in cache-sized blocks and summed, and the value is
+        exponentiated once at the end, so memory is O(num_paths) instead of
+        O(num_paths * num_steps). Only the first num_sample_paths paths are
+        recorded step by step (for charting).
+
+        Monthly contributions are deposited at the first step on or after
+        each month end (exact for daily and monthly steps) and compound
+        along their own path, accumulated in the same pass:
+            V(T) = G(T) * (S0 + c * Σ_m 1 / G(t_m)),  G(t) = S(t) / S0
+        One extra exp per deposit, no contribution matrix.
+
+        Args:
+            S0: Initial portfolio value
+            mu: Expected return (drift) - annual
+            sigma: Volatility - annual
+            T: Time horizon in years
+            dt: Time step (1/252 daily, 1/12 monthly)
+            num_paths: Number of simulation paths
+            num_sample_paths: Number of leading paths to record in full
+            seed: Random seed for reproducibility
+            path_offset: Global index of the first path (for sharding)
+            antithetic: Pair paths 2k and 2k + 1 with mirrored normals
+            monthly_contribution: Amount deposited at each month end
+
+        Returns:
+            Tuple of (final_values, sample_paths):
+                - final_values: Array of shape (num_paths,)
+                - sample_paths: Array of shape (num_sample_paths, num_steps + 1)
+        """
+        num_steps = int(T / dt)
+        steps_per_year = int(round(1.0 / dt))
+        num_sample_paths = min(num_sample_paths, num_paths)
+        final_values = np.empty(num_paths)
+        sample_paths = np.empty((num_sample_paths, num_steps + 1))
+
+        drift = (mu - 0.5 * sigma**2) * dt
+        vol = sigma * np.sqrt(dt)
+
+        # Parallel loop over paths; only recorded paths keep per-step values
+        for i in prange(num_paths):
+            key, sign = path_stream(seed, path_offset + i, antithetic)
+            signed_vol = sign * vol
+            if i < num_sample_paths:
+                _fill_gbm_path(
+                    sample_paths[i], S0, drift, signed_vol, key, monthly_contribution, steps_per_year
+                )
+                final_values[i] = sample_paths[i, num_steps]
+            elif monthly_contribution > 0.0:
+                normal_sum, discount_sum = _sum_with_deposits(
+                    key, num_steps, steps_per_year, drift, signed_vol
+                )
+                growth = np.exp(drift * num_steps + signed_vol * normal_sum)
+                final_values[i] = growth * (S0 + monthly_contribution * discount_sum)
+            else:
+                log_return = drift * num_steps + signed_vol * _sum_standard_normals(key, num_steps)
+                final_values[i] = S0 * np.exp(log_return)
+
+        return final_values, sample_paths
+
+    @staticmethod
+    @jit(nopython=True, parallel=True, cache=True)
+    def simulate_gbm_terminal_values_f32(
+        S0: float,
+        mu: float,
+        sigma: float,
+        T: int,
+        dt: float,
+        num_paths: int,
+        num_sample_paths: int = 0,
+        seed: int = 42,
+        path_offset: int = 0,
+        antithetic: bool = False,
+        monthly_contribution: float = 0.0
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Single-precision variant of simulate_gbm_terminal_values
+
+        Normals, increments and outputs are float32 (half the memory traffic,
+        twice the SIMD lanes). The normals (and, for recorded paths, the
+        log-values) are accumulated with Kahan (compensated) summation, so the
+        rounding error stays O(ε32) instead of growing with the number of
+        steps; without it a 50-year daily run would lose about 4 significant
+        digits. Callers promote the outputs to float64 before computing
+        statistics.
+
+        Args:
+            S0: Initial portfolio value
+            mu: Expected return (drift) - annual
+            sigma: Volatility - annual
+            T: Time horizon in years
+            dt: Time step (1/252 daily, 1/12 monthly)
+            num_paths: Number of simulation paths
+            num_sample_paths: Number of leading paths to record in full
+            seed: Random seed for reproducibility
+            path_offset: Global index of the first path (for sharding)
+            antithetic: Pair paths 2k and 2k + 1 with mirrored normals
+            monthly_contribution: Amount deposited at each month end
+
+        Returns:
+            Tuple of (final_values, sample_paths) as float32 arrays, shapes as
+            in simulate_gbm_terminal_values
+        """
+        num_steps = int(T / dt)
+        steps_per_year = int(round(1.0 / dt))
+        num_sample_paths = min(num_sample_paths, num_paths)
+        final_values = np.empty(num_paths, dtype=np.float32)
+        sample_paths = np.empty((num_sample_paths, num_steps + 1), dtype=np.float32)
+
+        initial_value = np.float32(S0)
+        contribution = np.float32(monthly_contribution)
+        drift = np.float32((mu - 0.5 * sigma**2) * dt)
+        vol = np.float32(sigma * np.sqrt(dt))
+
+        for i in prange(num_paths):
+            key, sign = path_stream(seed, path_offset + i, antithetic)
+            signed_vol = np.float32(sign) * vol
+            if i < num_sample_paths:
+                _fill_gbm_path32(
+                    sample_paths[i], initial_value, drift, signed_vol, key, contribution, steps_per_year
+                )
+                final_values[i] = sample_paths[i, num_steps]
+            elif monthly_contribution > 0.0:
+                normal_sum, discount_sum = _sum_with_deposits32(
+                    key, num_steps, steps_per_year, drift, signed_vol
+                )
+                growth = np.exp(drift * np.float32(num_steps) + signed_vol * normal_sum)
+                final_values[i] = growth * (initial_value + contribution * discount_sum)
+            else:
+                log_return = drift * np.float32(num_steps) + signed_vol * _sum_standard_normals32(key, num_steps)
+                final_values[i] = initial_value * np.exp(log_return)
+
+        return final_values, sample_paths
+
+    @staticmethod
+    @jit(nopython=True, parallel=True, cache=True)
+    def simulate_normal_sums(
+        step_counts: np.ndarray,
+        num_paths: int,
+        seed: int = 42,
+        path_offset: int = 0,
+        antithetic: bool = False
+    ) -> np.ndarray:
+        """
+        Sum each path's step normals (the random part of its log-return)
+
+        The sums do not depend on the portfolio (S0, mu, sigma), so requests
+        with the same seed and time_step can share them and only pay for the
+        exponentials (simulate_gbm_terminal_from_sums). One pass records the
+        sums at several horizons (streams are prefixes of each other). Uses
+        the same streams and summation order as simulate_gbm_terminal_values,
+        so the resulting terminal values are identical.
+
+        Args:
+            step_counts: Ascending numbers of steps (one per horizon)
+            num_paths: Number of simulation paths
+            seed: Random seed for reproducibility
+            path_offset: Global index of the first path (for sharding)
+            antithetic: Pair paths 2k and 2k + 1 with mirrored normals
+
+        Returns:
+            Array of shape (num_paths, len(step_counts)) with signed sums of
+            the step normals
+        """
+        normal_sums = np.empty((num_paths, step_counts.shape[0]))
+        for i in prange(num_paths):
+            key, sign = path_stream(seed, path_offset + i, antithetic)
+            _sum_standard_normals_at(key, step_counts, normal_sums[i])
+            normal_sums[i] *= sign
+        return normal_sums
+
+    @staticmethod
+    @jit(nopython=True, parallel=True, cache=True)
+    def simulate_deposit_sums(
+        step_counts: np.ndarray,
+        mu: float,
+        sigma: float,
+        dt: float,
+        num_paths: int,
+        seed: int = 42,
+        path_offset: int = 0,
+        antithetic: bool = False
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Normal sums and deposit discount sums of each path (contributions)
+
+        V(T) = G(T) * (S0 + c * D(T)) is linear in the contribution c, so
+        one (G, D) per path serves every contribution amount for the same
+        portfolio (mu, sigma); like simulate_normal_sums, one pass records
+        several horizons.
+
+        Args:
+            step_counts: Ascending numbers of steps (one per horizon)
+            mu: Expected return (drift) - annual
+            sigma: Volatility - annual
+            dt: Time step (1/252 daily, 1/12 monthly)
+            num_paths: Number of simulation paths
+            seed: Random seed for reproducibility
+            path_offset: Global index of the first path (for sharding)
+            antithetic: Pair paths 2k and 2k + 1 with mirrored normals
+
+        Returns:
+            Tuple of (normal_sums, discount_sums), each of shape
+            (num_paths, len(step_counts)); normal sums are signed
+        """
+        steps_per_year = int(round(1.0 / dt))
+        drift = (mu - 0.5 * sigma**2) * dt
+        vol = sigma * np.sqrt(dt)
+        normal_sums = np.empty((num_paths, step_counts.shape[0]))
+        discount_sums = np.empty((num_paths, step_counts.shape[0]))
+        for i in prange(num_paths):
+            key, sign = path_stream(seed, path_offset + i, antithetic)
+            _sum_with_deposits_at(
+                key, step_counts, steps_per_year, drift, sign * vol, normal_sums[i], discount_sums[i]
+            )
+            normal_sums[i] *= sign
+        return normal_sums, discount_sums
+
+    @staticmethod
+    @jit(nopython=True, parallel=True, cache=True)
+    def simulate_gbm_terminal_from_sums(
+        S0: float,
+        mu: float,
+        sigma: float,
+        T: int,
+        dt: float,
+        normal_sums: np.ndarray,
+        monthly_contribution: float,
+        discount_sums: np.ndarray
+    ) -> np.ndarray:
         """
-        Run Monte Carlo simulation for portfolio
+        GBM terminal values from per-path sums (simulate_normal_sums /
+        simulate_deposit_sums)
+
+        Formula:
+            G(T) = exp((μ - 0.5σ²)dt * num_steps + σ√dt * ΣZ)
+            V(T) = G(T) * (S0 + c * D(T))
+
+        Args:
+            S0: Initial portfolio value
+            mu: Expected return (drift) - annual
+            sigma: Volatility - annual
+            T: Time horizon in years
+            dt: Time step (1/252 daily, 1/12 monthly)
+            normal_sums: Signed sums of the step normals, shape (num_paths,)
+            monthly_contribution: Amount deposited at each month end
+            discount_sums: Deposit discount sums D(T), shape (num_paths,)
+                (ignored without contributions)
+
+        Returns:
+            Array of shape (num_paths,) with terminal values
+        """
+        num_steps = int(T / dt)
+        drift = (mu - 0.5 * sigma**2) * dt
+        vol = sigma * np.sqrt(dt)
+        final_values = np.empty(normal_sums.shape[0])
+        for i in prange(normal_sums.shape[0]):
+            if monthly_contribution > 0.0:
+                growth = np.exp(drift * num_steps + vol * normal_sums[i])
+                final_values[i] = growth * (S0 + monthly_contribution * discount_sums[i])
+            else:
+                final_values[i] = S0 * np.exp(drift * num_steps + vol * normal_sums[i])
+        return final_values
+
+    @staticmethod
+    def simulate_gbm_terminal_exact(
+        S0: float,
+        mu: float,
+        sigma: float,
+        T: int,
+        num_paths: int,
+        seed: int = 42,
+        path_offset: int = 0,
+        antithetic: bool = False,
+        normals: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Sample GBM terminal values exactly (one normal draw per path)
+
+        Formula:
+            S(T) = S0 * exp((μ - 0.5σ²)T + σ√T * Z)
+
+        With constant μ and σ this is the exact terminal distribution, so
+        stepping through every day is unnecessary when only terminal values
+        are needed. Results are bit-for-bit reproducible for a given seed.
+
+        Args:
+            S0: Initial portfolio value
+            mu: Expected return (drift) - annual
+            sigma: Volatility - annual
+            T: Time horizon in years
+            num_paths: Number of simulation paths
+            seed: Random seed for reproducibility
+            path_offset: Global index of the first path (for sharding)
+            antithetic: Pair paths 2k and 2k + 1 with mirrored normals
+            normals: Optional pre-drawn normals, shape (num_paths,); drawn
+                from the seed if omitted
+
+        Returns:
+            Array of shape (num_paths,) with terminal values
+        """
+        if normals is None:
+            Z = standard_normals(seed, num_paths, path_offset, 0, antithetic)
+        else:
+            Z = normals
+        return S0 * np.exp((mu - 0.5 * sigma**2) * T + sigma * np.sqrt(T) * Z)
+
+    @staticmethod
+    def simulate_gbm_terminal_qmc(
+        S0: float,
+        mu: float,
+        sigma: float,
+        T: int,
+        dt: float,
+        num_paths: int,
+        num_sample_paths: int = 0,
+        seed: int = 42,
+        replicates: int = qmc.DEFAULT_REPLICATES,
+        normals: Optional[np.ndarray] = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Sample GBM terminal values with scrambled Sobol points (quasi-Monte Carlo)
+
+        Terminal values only depend on W(T), the first coordinate of the
+        Brownian-bridge construction, so each path takes one Sobol point
+        mapped through the inverse normal CDF. Sample paths are completed
+        by a Brownian bridge pinned to the same W(T) (interior points from
+        the counter-based generator), so they end at their terminal values.
+
+        Args:
+            S0: Initial portfolio value
+            mu: Expected return (drift) - annual
+            sigma: Volatility - annual
+            T: Time horizon in years
+            dt: Time step for sample paths (1/252 daily, 1/12 monthly)
+            num_paths: Number of simulation paths
+            num_sample_paths: Number of leading paths to record in full
+            seed: Random seed (scrambling) for reproducibility
+            replicates: Independently scrambled blocks (for standard errors)
+            normals: Optional pre-drawn Sobol normals, shape (num_paths, 1);
+                drawn from the seed if omitted
+
+        Returns:
+            Tuple of (final_values, sample_paths):
+                - final_values: Array of shape (num_paths,)
+                - sample_paths: Array of shape (num_sample_paths, num_steps + 1)
+        """
+        drift = mu - 0.5 * sigma**2
+        if normals is None:
+            normals = qmc.sobol_normals(num_paths, 1, seed, replicates)
+        Z = normals[:, 0]
+        final_values = S0 * np.exp(drift * T + sigma * np.sqrt(T) * Z)
+
+        num_steps = int(T / dt)
+        num_sample_paths = min(num_sample_paths, num_paths)
+        sample_paths = np.empty((num_sample_paths, num_steps + 1))
+        if num_sample_paths > 0:
+            bridge_normals = standard_normal_block(seed, num_sample_paths, num_steps, 0, 0, False)
+            bridge_normals[:, 0] = Z[:num_sample_paths]
+            W = qmc.brownian_bridge(bridge_normals, float(T))
+            times = np.arange(1, num_steps + 1) * dt
+            sample_paths[:, 0] = S0
+            sample_paths[:, 1:] = S0 * np.exp(drift * times + sigma * W)
+            sample_paths[:, -1] = final_values[:num_sample_paths]
+
+        return final_values, sample_paths
+
+    @staticmethod
+    def simulate_correlated_terminal_values(
+        S0: float,
+        weights: np.ndarray,
+        mu: np.ndarray,
+        cholesky_factor: np.ndarray,
+        T: int,
+        dt: float,
+        num_paths: int,
+        num_sample_paths: int = 0,
+        seed: int = 42,
+        path_offset: int = 0,
+        antithetic: bool = False,
+        normals: Optional[np.ndarray] = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Simulate a buy-and-hold portfolio of correlated GBM assets
+
+        Formula (per asset i, annual covariance Σ = L Lᵀ):
+            X_i(T) = (μ_i - 0.5Σ_ii)T + √T * (L Z)_i
+            V(T) = S0 * Σ_i w_i * exp(X_i(T))
+
+        With constant parameters the joint terminal log-returns are exactly
+        multivariate normal, so terminal values need one batched matrix
+        multiply (BLAS GEMM) of shape (num_paths, n) x (n, n). Sample paths
+        are correlated Brownian bridges pinned to the same terminal draws,
+        so each chart path ends exactly at its terminal value.
+
+        Args:
+            S0: Initial portfolio value
+            weights: Asset weights, shape (n,)
+            mu: Expected annual returns, shape (n,)
+            cholesky_factor: Lower Cholesky factor of the annual covariance, shape (n, n)
+            T: Time horizon in years
+            dt: Time step for sample paths (1/252 daily, 1/12 monthly)
+            num_paths: Number of simulation paths
+            num_sample_paths: Number of leading paths to record in full
+            seed: Random seed for reproducibility
+            path_offset: Global index of the first path (for sharding)
+            antithetic: Pair paths 2k and 2k + 1 with mirrored normals
+            normals: Optional pre-drawn terminal normals, shape (num_paths, n)
+                (e.g. scrambled Sobol points); drawn from the seed if omitted
+
+        Returns:
+            Tuple of (final_values, sample_paths):
+                - final_values: Array of shape (num_paths,)
+                - sample_paths: Array of shape (num_sample_paths, num_steps + 1)
+        """
+        num_assets = len(weights)
+        drift = mu - 0.5 * np.sum(cholesky_factor**2, axis=1)
+
+        # Terminal log-returns: counters 0 .. n-1 of each path's stream
+        if normals is None:
+            Z = standard_normal_block(seed, num_paths, num_assets, path_offset, 0, antithetic)
+        else:
+            Z = normals
+        log_returns = Z @ (np.sqrt(T) * cholesky_factor.T)
+        log_returns += drift * T
+        final_values = S0 * (np.exp(log_returns) @ weights)
+
+        # Sample paths: Brownian bridge from 0 to each path's terminal value
+        num_steps = int(T / dt)
+        num_sample_paths = min(num_sample_paths, num_paths)
+        if num_sample_paths == 0:
+            return final_values, np.empty((0, num_steps + 1))
+
+        increments = standard_normal_block(
+            seed, num_sample_paths, num_steps * num_assets, path_offset, num_assets, antithetic
+        ).reshape(num_sample_paths, num_steps, num_assets)
+        brownian = np.cumsum(increments @ (np.sqrt(dt) * cholesky_factor.T), axis=1)
+
+        time_fraction = (np.arange(1, num_steps + 1) / num_steps)[None, :, None]
+        terminal_shock = (log_returns[:num_sample_paths] - drift * T)[:, None, :]
+        bridge = brownian - time_fraction * brownian[:, -1:, :] + time_fraction * terminal_shock
+
+        times = (np.arange(1, num_steps + 1) * dt)[None, :, None]
+        asset_paths = np.exp(drift * times + bridge)
+
+        sample_paths = np.empty((num_sample_paths, num_steps + 1))
+        sample_paths[:, 0] = S0
+        sample_paths[:, 1:] = S0 * (asset_paths @ weights)
+        sample_paths[:, -1] = final_values[:num_sample_paths]
+
+        return final_values, sample_paths
+
+    @staticmethod
+    async def run_simulation(
+        request: SimulationRequest,
+        is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None,
+        timeout_seconds: Optional[float] = None,
+        progress: Optional[Callable[[Dict], None]] = None
+    ) -> Dict:
+        """
+        Run Monte Carlo simulation for portfolio without blocking the event loop
+
+        The CPU-bound work (simulate) is dispatched to the simulation worker
+        pool, so other requests keep being served while it runs.
+
+        Args:
+            request: SimulationRequest with portfolio and parameters
+            is_disconnected: Optional coroutine function; queued work is
+                cancelled if it reports that the client went away
+            timeout_seconds: Override of the default per-request timeout
+            progress: Optional callback, called on the event loop with the
+                interim results of each batch (see simulate)
+
+        Returns:
+            Dictionary with simulation results
+
+        Raises:
+            HTTPException 429: If the worker pool queue is full
+            HTTPException 504: If the simulation times out
+        """
+        return await simulation_executor.run(
+            MonteCarloService.simulate,
+            request,
+            is_disconnected=is_disconnected,
+            timeout_seconds=timeout_seconds,
+            progress=progress
+        )
+
+    @staticmethod
+    async def stream_simulation(
+        request: SimulationRequest,
+        is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None
+    ) -> AsyncIterator[tuple]:
+        """
+        Run Monte Carlo simulation, yielding interim results as batches finish
+
+        Args:
+            request: SimulationRequest with portfolio and parameters
+            is_disconnected: Optional coroutine function; queued work is
+                cancelled if it reports that the client went away
+
+        Yields:
+            ('progress', interim results) after each batch of paths (see
+            simulate), then ('result', results), the same as run_simulation
+
+        Raises:
+            HTTPException 429: If the worker pool queue is full
+            HTTPException 504: If the simulation times out
+        """
+        events: asyncio.Queue = asyncio.Queue()
+
+        async def run() -> Dict:
+            try:
+                return await MonteCarloService.run_simulation(
+                    request, is_disconnected=is_disconnected, progress=events.put_nowait
+                )
+            finally:
+                events.put_nowait(None)  # Every progress callback runs before this
+
+        task = asyncio.create_task(run())
+        try:
+            while (interim := await events.get()) is not None:
+                yield 'progress', interim
+            yield 'result', await task
+        finally:
+            task.cancel()
+
+    @staticmethod
+    async def run_batch(
+        requests: List[SimulationRequest],
+        is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None,
+        timeout_seconds: Optional[float] = None
+    ) -> List[tuple]:
+        """
+        Run several simulations as one task in the simulation worker pool
+
+        Args:
+            requests: Simulation requests (best grouped so they share draws)
+            is_disconnected: Optional coroutine function; queued work is
+                cancelled if it reports that the client went away
+            timeout_seconds: Override of the default per-request timeout
+
+        Returns:
+            List of (results, error_message) per request (see simulate_batch)
+
+        Raises:
+            HTTPException 429: If the worker pool queue is full
+            HTTPException 504: If the simulations time out
+        """
+        return await simulation_executor.run(
+            MonteCarloService.simulate_batch,
+            requests,
+            is_disconnected=is_disconnected,
+            timeout_seconds=timeout_seconds
+        )
+
+    @staticmethod
+    def resolve_engine(parameters: SimulationParameters) -> tuple:
+        """
+        Engine and time step a simulation actually runs with ('auto' resolved)
+
+        Args:
+            parameters: Simulation parameters
+
+        Returns:
+            Tuple of (engine, time_step)
+        """
+        engine = parameters.engine
+        time_step = parameters.time_step or "daily"
+        if parameters.model == "multi_asset":
+            # Correlated assets simulated jointly (exact terminal sampling)
+            return ("qmc" if engine == "qmc" else "exact"), time_step
+
+        # Exact sampling needs no steps, but cannot produce sample paths
+        # or path-dependent contributions
+        if engine == "auto":
+            if parameters.monthly_contribution > 0:
+                # Contributions compound along each path; without charted
+                # paths, monthly steps are the coarsest exact schedule (an
+                # explicit other time_step is rejected by the schema)
+                engine = "stepped"
+                if parameters.num_sample_paths == 0:
+                    time_step = "monthly"
+            else:
+                engine = "exact" if parameters.num_sample_paths == 0 else "stepped"
+        return engine, time_step
+
+    @staticmethod
+    def simulate_batch(requests: List[SimulationRequest]) -> List[tuple]:
+        """
+        Run several simulations, sharing random draws between them (CPU-bound)
+
+        Draws depend only on the seed and the path layout (number of paths,
+        steps, assets, antithetic pairing), never on the portfolio, so
+        requests with the same seed and layout reuse them: the exact and QMC
+        engines share their terminal normals, the stepped engine (float64)
+        its per-path sums of step normals, recorded for every horizon in the
+        batch in one pass (plus deposit discount sums per portfolio, shared
+        by all contribution amounts). Results are identical to running each
+        request on its own.
+
+        Args:
+            requests: Simulation requests
+
+        Returns:
+            List of (results, error_message) tuples in request order;
+            results is None (and error_message set) if a simulation failed
+        """
+        draws: Dict[tuple, Any] = {}
+        MonteCarloService._prefill_step_sums(requests, draws)
+        outcomes = []
+        for request in requests:
+            try:
+                outcomes.append((MonteCarloService.simulate(request, draws), None))
+            except Exception as e:
+                outcomes.append((None, str(e)))
+        return outcomes
+
+    @staticmethod
+    def _step_sums(
+        step_counts: List[int],
+        dt: float,
+        num_paths: int,
+        seed: int,
+        path_offset: int,
+        antithetic: bool,
+        portfolio: Optional[tuple] = None
+    ) -> Dict[int, tuple]:
+        """
+        Per-path sums for the stepped engine at several horizons (one pass)
+
+        Args:
+            step_counts: Numbers of steps (one per horizon)
+            dt: Time step
+            num_paths: Number of simulation paths
+            seed: Random seed
+            path_offset: Global index of the first path
+            antithetic: Mirrored path pairs
+            portfolio: (mu, sigma) for deposit discount sums (contributions),
+                or None for normal sums only
+
+        Returns:
+            Dictionary num_steps -> (normal_sums, discount_sums), each of
+            shape (num_paths,) (discount_sums empty without portfolio)
+        """
+        counts = np.array(sorted(set(step_counts)), dtype=np.int64)
+        if portfolio is None:
+            normal_sums = MonteCarloService.simulate_normal_sums(
+                counts, num_paths, seed, path_offset, antithetic
+            )
+            discount_sums = None
+        else:
+            mu, sigma = portfolio
+            normal_sums, discount_sums = MonteCarloService.simulate_deposit_sums(
+                counts, mu, sigma, dt, num_paths, seed, path_offset, antithetic
+            )
+        return {
+            int(num_steps): (
+                np.ascontiguousarray(normal_sums[:, k]),
+                np.ascontiguousarray(discount_sums[:, k]) if discount_sums is not None else np.empty(0)
+            )
+            for k, num_steps in enumerate(counts)
+        }
+
+    @staticmethod
+    def _prefill_step_sums(requests: List[SimulationRequest], draws: Dict[tuple, Any]) -> None:
+        """
+        Compute the stepped-engine sums of all horizons of a batch at once
+
+        Streams of a longer horizon extend those of a shorter one, so one
+        pass to the longest horizon yields the sums for every horizon with
+        the same seed, time step and paths (adaptive requests, whose batch
+        sizes are not known in advance, draw on demand).
+
+        Args:
+            requests: Simulation requests of the batch
+            draws: Draws cache (see simulate) to fill
+        """
+        horizons = defaultdict(set)
+        for request in requests:
+            parameters = request.parameters
+            engine, time_step = MonteCarloService.resolve_engine(parameters)
+            if (
+                engine != "stepped" or parameters.precision != "float64"
+                or parameters.seed is None or parameters.target_relative_error is not None
+            ):
+                continue
+            dt = 1 / MonteCarloService.STEPS_PER_YEAR[time_step]
+            portfolio = None
+            if parameters.monthly_contribution > 0:
+                portfolio = MonteCarloService._calculate_portfolio_stats(request)
+            layout = (parameters.seed, dt, parameters.num_simulations, parameters.antithetic, portfolio)
+            horizons[layout].add(int(parameters.time_horizon_years / dt))
+
+        for (seed, dt, num_paths, antithetic, portfolio), step_counts in horizons.items():
+            sums = MonteCarloService._step_sums(
+                list(step_counts), dt, num_paths, seed, 0, antithetic, portfolio
+            )
+            for num_steps, step_sums in sums.items():
+                draws[('step_sums', seed, dt, num_paths, 0, antithetic, portfolio, num_steps)] = step_sums
+
+    @staticmethod
+    def simulate(
+        request: SimulationRequest,
+        draws: Optional[Dict[tuple, Any]] = None,
+        progress: Optional[Callable[[Dict], None]] = None
+    ) -> Dict:
+        """
+        Run Monte Carlo simulation for portfolio (synchronous, CPU-bound)
 
         Steps:
             1. Extract portfolio and parameters
-            2. Calculate portfolio mu and sigma (weighted average for MVP)
-            3. Run GBM simulation
+            2. Calculate portfolio mu and sigma (weighted average for MVP),
+               or per-asset stats and factored covariance (multi-asset model)
+            3. Run GBM simulation (exact or streaming kernel - terminal values only);
+               in adaptive mode, add batches of paths until the target metrics
+               reach target_relative_error (or num_simulations paths are used);
+               with a progress callback, paths are added in doubling batches
+               and interim statistics are reported after each one
             4. Calculate statistics (percentiles, VaR, CVaR, probabilities)
             5. Return comprehensive results
 
         Args:
             request: SimulationRequest with portfolio and parameters
+            draws: Optional cache of random draws shared between simulations
+                (see simulate_batch); draws are looked up by everything
+                that determines them, so sharing never changes results
+            progress: Optional callback receiving interim results (statistics
+                of the paths so far, without sample paths, with paths_used)
+                after each batch; the final results are the same as without it
 
         Returns:
-            Dictionary with simulation results
+            Dictionary with simulation results (sample_paths and, with
+            return_distribution, terminal_distribution as NumPy arrays;
+            see app.utils.serialization for their JSON form)
         """
         start_time = time.time()
 
@@ -97,43 +1114,392 @@ class MonteCarloService:
         monthly_contribution = request.parameters.monthly_contribution
         T = request.parameters.time_horizon_years
         num_simulations = request.parameters.num_simulations
+        num_sample_paths = request.parameters.num_sample_paths
+        seed = request.parameters.seed
+        if seed is None:
+            seed = int(time.time()) % 10000  # Different seed each time
+        antithetic = request.parameters.antithetic
+        control_variate = request.parameters.control_variate
+        precision = request.parameters.precision
 
-        # For MVP: Use simplified portfolio statistics
-        # In production: Fetch real data from Bloomberg service
-        mu, sigma = MonteCarloService._calculate_portfolio_stats(request)
-
-        # Run GBM simulation (daily steps)
-        dt = 1/252  # Daily time steps (252 trading days per year)
-        paths = MonteCarloService.simulate_gbm_paths(
-            S0=S0,
-            mu=mu,
-            sigma=sigma,
-            T=T,
-            dt=dt,
-            num_paths=num_simulations,
-            seed=int(time.time()) % 10000  # Different seed each time
-        )
+        engine, time_step = MonteCarloService.resolve_engine(request.parameters)
 
-        # Add monthly contributions (simplified - no compounding in this MVP version)
-        if monthly_contribution > 0:
-            total_contributions = monthly_contribution * 12 * T
-            paths[:, -1] += total_contributions
+        # GBM transitions are exact for any step, so coarser steps only
+        # change the sample path resolution, not the terminal distribution
+        steps_per_year = MonteCarloService.STEPS_PER_YEAR[time_step]
+        dt = 1 / steps_per_year
+
+        # Quasi-Monte Carlo: replicate blocks give the standard errors
+        replicates = qmc.DEFAULT_REPLICATES if engine == "qmc" else 1
+        group_size = 2 if antithetic else 1
+
+        model = request.parameters.model
+        if model == "multi_asset":
+            # Correlated assets simulated jointly (exact terminal sampling)
+            weights, asset_mu, cholesky_factor = MonteCarloService._calculate_asset_stats(request)
+            # E[V(T)] = S0 * Σ w_i exp(μ_i T)
+            analytic_mean = S0 * float(np.dot(weights, np.exp(asset_mu * T)))
+        else:
+            # For MVP: Use simplified portfolio statistics
+            # In production: Fetch real data from Bloomberg service
+            mu, sigma = MonteCarloService._calculate_portfolio_stats(request)
+            analytic_mean = MonteCarloService._expected_terminal_value(
+                S0, mu, T, monthly_contribution, steps_per_year
+            )
+
+        def control_variate_arguments(values: np.ndarray) -> dict:
+            """Control variate of the terminal values (_calculate_statistics arguments)"""
+            if not control_variate:
+                return {}
+            if model == "single_factor" and monthly_contribution == 0:
+                # log V(T) = log S0 + (μ - σ²/2)T + σW(T): correlated with the
+                # terminal value but not equal to it, with a known mean
+                return {
+                    'controls': np.log(values),
+                    'control_mean': float(np.log(S0) + (mu - 0.5 * sigma**2) * T)
+                }
+            # Contributions and correlated assets: only the terminal value
+            # itself has a known mean; it controls probabilities and CVaR,
+            # the mean stays a plain Monte Carlo estimate
+            return {'controls': values, 'control_mean': analytic_mean, 'adjust_mean': False}
+
+        def shared_draws(key: tuple, draw: Callable[[], Any]) -> Any:
+            """Draws for key, computed once per draws cache (read-only)"""
+            if draws is None:
+                return draw()
+            if key not in draws:
+                draws[key] = draw()
+            return draws[key]
+
+        def simulate_paths(num_paths: int, path_offset: int, num_sample_paths: int) -> tuple:
+            """GBM terminal values and sample paths of paths path_offset .. path_offset + num_paths - 1"""
+            if model == "multi_asset":
+                num_assets = len(weights)
+                if engine == "qmc":
+                    normals = shared_draws(
+                        ('sobol', seed, num_paths, num_assets, replicates),
+                        lambda: qmc.sobol_normals(num_paths, num_assets, seed, replicates)
+                    )
+                else:
+                    normals = shared_draws(
+                        ('block', seed, num_paths, num_assets, path_offset, antithetic),
+                        lambda: standard_normal_block(
+                            seed, num_paths, num_assets, path_offset, 0, antithetic
+                        )
+                    )
+                return MonteCarloService.simulate_correlated_terminal_values(
+                    S0=S0,
+                    weights=weights,
+                    mu=asset_mu,
+                    cholesky_factor=cholesky_factor,
+                    T=T,
+                    dt=dt,
+                    num_paths=num_paths,
+                    num_sample_paths=num_sample_paths,
+                    seed=seed,
+                    path_offset=path_offset,
+                    antithetic=antithetic,
+                    normals=normals
+                )
+            if engine == "qmc":
+                # Closed-form terminal values from scrambled Sobol points
+                return MonteCarloService.simulate_gbm_terminal_qmc(
+                    S0=S0,
+                    mu=mu,
+                    sigma=sigma,
+                    T=T,
+                    dt=dt,
+                    num_paths=num_paths,
+                    num_sample_paths=num_sample_paths,
+                    seed=seed,
+                    replicates=replicates,
+                    normals=shared_draws(
+                        ('sobol', seed, num_paths, 1, replicates),
+                        lambda: qmc.sobol_normals(num_paths, 1, seed, replicates)
+                    )
+                )
+            if engine == "exact":
+                # Closed-form terminal values (one draw per path)
+                final_values = MonteCarloService.simulate_gbm_terminal_exact(
+                    S0=S0,
+                    mu=mu,
+                    sigma=sigma,
+                    T=T,
+                    num_paths=num_paths,
+                    seed=seed,
+                    path_offset=path_offset,
+                    antithetic=antithetic,
+                    normals=shared_draws(
+                        ('terminal', seed, num_paths, path_offset, antithetic),
+                        lambda: standard_normals(seed, num_paths, path_offset, 0, antithetic)
+                    )
+                )
+                return final_values, np.empty((0, 0))
+            if precision == "float32":
+                # Single-precision kernel; statistics are computed in float64
+                final_values, sample_paths = MonteCarloService.simulate_gbm_terminal_values_f32(
+                    S0=S0,
+                    mu=mu,
+                    sigma=sigma,
+                    T=T,
+                    dt=dt,
+                    num_paths=num_paths,
+                    num_sample_paths=num_sample_paths,
+                    seed=seed,
+                    path_offset=path_offset,
+                    antithetic=antithetic,
+                    monthly_contribution=float(monthly_contribution)
+                )
+                return final_values.astype(np.float64), sample_paths.astype(np.float64)
+            if draws is not None:
+                # Shared draws: per-path sums serve every portfolio (and, with
+                # contributions, every amount); only the recorded sample
+                # paths are stepped again
+                num_steps = int(T / dt)
+                portfolio = (mu, sigma) if monthly_contribution > 0 else None
+                normal_sums, discount_sums = shared_draws(
+                    ('step_sums', seed, dt, num_paths, path_offset, antithetic, portfolio, num_steps),
+                    lambda: MonteCarloService._step_sums(
+                        [num_steps], dt, num_paths, seed, path_offset, antithetic, portfolio
+                    )[num_steps]
+                )
+                final_values = MonteCarloService.simulate_gbm_terminal_from_sums(
+                    S0, mu, sigma, T, dt, normal_sums, float(monthly_contribution), discount_sums
+                )
+                sample_final_values, sample_paths = MonteCarloService.simulate_gbm_terminal_values(
+                    S0=S0,
+                    mu=mu,
+                    sigma=sigma,
+                    T=T,
+                    dt=dt,
+                    num_paths=min(num_sample_paths, num_paths),
+                    num_sample_paths=num_sample_paths,
+                    seed=seed,
+                    path_offset=path_offset,
+                    antithetic=antithetic,
+                    monthly_contribution=float(monthly_contribution)
+                )
+                final_values[:len(sample_final_values)] = sample_final_values
+                return final_values, sample_paths
+            # Run GBM simulation (steps of the requested time_step)
+            # Only terminal values are needed, so the full path matrix is never built
+            return MonteCarloService.simulate_gbm_terminal_values(
+                S0=S0,
+                mu=mu,
+                sigma=sigma,
+                T=T,
+                dt=dt,
+                num_paths=num_paths,
+                num_sample_paths=num_sample_paths,
+                seed=seed,
+                path_offset=path_offset,
+                antithetic=antithetic,
+                monthly_contribution=float(monthly_contribution)
+            )
+
+        # Adaptive mode: num_simulations is the maximum, start with one batch
+        # Progressive mode (progress callback): batches doubling up to
+        # num_simulations, with interim statistics reported after each one
+        target_relative_error = request.parameters.target_relative_error
+        target_metrics = request.parameters.target_metrics
+        num_paths = num_simulations
+        if target_relative_error is not None or progress is not None:
+            num_paths = min(MonteCarloService.ADAPTIVE_BATCH_PATHS, num_simulations)
 
-        # Extract final values
-        final_values = paths[:, -1]
+        final_values, sample_paths = simulate_paths(num_paths, 0, num_sample_paths)
+
+        while num_paths < num_simulations:
+            interim = MonteCarloService._calculate_statistics(
+                final_values=final_values,
+                initial_investment=S0,
+                paths=np.empty((0, 0)),
+                group_size=group_size,
+                replicates=replicates,
+                **control_variate_arguments(final_values)
+            )
+            if target_relative_error is not None:
+                # Add batches until every target metric reaches the target precision
+                achieved = MonteCarloService._relative_error(interim, target_metrics)
+                if achieved <= target_relative_error:
+                    break
+                next_paths = MonteCarloService._next_path_count(
+                    num_paths, achieved, target_relative_error, num_simulations, engine
+                )
+            else:
+                next_paths = min(2 * num_paths, num_simulations)
+
+            if progress is not None:
+                del interim['sample_paths']
+                interim['paths_used'] = num_paths
+                interim['execution_time_seconds'] = time.time() - start_time
+                progress(interim)
+
+            if engine == "qmc":
+                # Replicate blocks cannot be extended in place: redraw
+                final_values, sample_paths = simulate_paths(next_paths, 0, num_sample_paths)
+            else:
+                # Counter-based streams: the next batch continues at path num_paths
+                batch, _ = simulate_paths(next_paths - num_paths, num_paths, 0)
+                final_values = np.concatenate([final_values, batch])
+            num_paths = next_paths
 
         # Calculate statistics
         results = MonteCarloService._calculate_statistics(
             final_values=final_values,
             initial_investment=S0,
-            paths=paths[:5]  # Store first 5 paths for visualization
+            paths=sample_paths,  # First few paths for visualization
+            group_size=group_size,
+            replicates=replicates,
+            **control_variate_arguments(final_values)
         )
 
         execution_time = time.time() - start_time
         results['execution_time_seconds'] = execution_time
+        results['engine'] = engine
+        results['precision'] = precision
+        results['time_step'] = time_step
+        results['model'] = model
+        results['seed'] = seed
+        results['variance_reduction'] = {
+            'antithetic': antithetic,
+            'control_variate': control_variate
+        }
+        results['paths_used'] = num_paths
+        if request.parameters.return_distribution:
+            # Every terminal value, compact (clients compute their own metrics)
+            results['terminal_distribution'] = final_values.astype(np.float32)
+        if target_relative_error is not None:
+            achieved = MonteCarloService._relative_error(results, target_metrics)
+            results['adaptive'] = {
+                'target_relative_error': target_relative_error,
+                'target_metrics': list(target_metrics),
+                'achieved_relative_error': achieved,
+                'converged': achieved <= target_relative_error
+            }
 
         return results
 
+    @staticmethod
+    def warmup() -> None:
+        """
+        JIT-compile all simulation kernels with tiny inputs
+
+        Called in each worker process at startup so the first real request
+        does not pay the Numba compilation cost. Argument types must match
+        those simulate() passes (float S0/mu/sigma, int T/num_paths/seed),
+        otherwise requests would trigger a second specialization.
+        """
+        MonteCarloService.simulate_gbm_paths(100.0, 0.08, 0.15, 1, 1/252, 2, 0, antithetic=False)
+        MonteCarloService.simulate_gbm_terminal_values(
+            100.0, 0.08, 0.15, 1, 1/252, 2, 1, 0, antithetic=False, monthly_contribution=0.0
+        )
+        MonteCarloService.simulate_gbm_terminal_values_f32(
+            100.0, 0.08, 0.15, 1, 1/252, 2, 1, 0, antithetic=False, monthly_contribution=0.0
+        )
+        MonteCarloService.simulate_gbm_terminal_exact(100.0, 0.08, 0.15, 1, 2, 0, antithetic=False)
+        for portfolio, contribution in ((None, 0.0), ((0.08, 0.15), 100.0)):
+            normal_sums, discount_sums = MonteCarloService._step_sums(
+                [252], 1/252, 2, 0, 0, False, portfolio
+            )[252]
+            MonteCarloService.simulate_gbm_terminal_from_sums(
+                100.0, 0.08, 0.15, 1, 1/252, normal_sums, contribution, discount_sums
+            )
+        MonteCarloService.simulate_correlated_terminal_values(
+            100.0, np.ones(1), np.full(1, 0.08), np.full((1, 1), 0.15), 1, 1/252, 2, 1, 0,
+            antithetic=False
+        )
+        MonteCarloService.simulate_gbm_terminal_qmc(100.0, 0.08, 0.15, 1, 1/252, 2, 1, 0, 1)
+        statistics.summarize(np.ones(2), 100.0)
+
+    @staticmethod
+    def _expected_terminal_value(
+        S0: float,
+        mu: float,
+        T: int,
+        monthly_contribution: float,
+        steps_per_year: int
+    ) -> float:
+        """
+        Analytic mean of the terminal value with compounded contributions
+
+        Formula (deposits at the kernel's deposit steps t_m):
+            E[V(T)] = S0 * exp(μT) + c * Σ_m exp(μ(T - t_m))
+
+        Args:
+            S0: Initial portfolio value
+            mu: Expected return (drift) - annual
+            T: Time horizon in years
+            monthly_contribution: Amount deposited at each month end
+            steps_per_year: Kernel steps per year (deposit timing)
+
+        Returns:
+            Expected terminal portfolio value
+        """
+        expected = S0 * np.exp(mu * T)
+        if monthly_contribution > 0:
+            steps = np.arange(1, T * steps_per_year + 1)
+            deposits = (steps * 12) // steps_per_year - ((steps - 1) * 12) // steps_per_year
+            times = steps / steps_per_year
+            expected += monthly_contribution * float(np.sum(deposits * np.exp(mu * (T - times))))
+        return float(expected)
+
+    @staticmethod
+    def _relative_error(stats: Dict, metrics: List[str]) -> float:
+        """
+        Largest relative standard error among the given metrics
+
+        Accepts either statistics.summarize output or simulation results.
+
+        Args:
+            stats: Statistics with estimates and standard_errors
+            metrics: Metric names (keys of standard_errors)
+
+        Returns:
+            max(standard error / |estimate|), inf if an estimate is zero
+        """
+        sections = ('final_portfolio_value', 'risk_metrics', 'probabilities')
+        flat = dict(stats)
+        for section in sections:
+            flat.update(stats.get(section, {}))
+
+        worst = 0.0
+        for metric in metrics:
+            estimate = abs(flat[metric])
+            error = stats['standard_errors'][metric]
+            worst = max(worst, error / estimate if estimate > 0 else float('inf'))
+        return worst
+
+    @staticmethod
+    def _next_path_count(
+        num_paths: int,
+        achieved: float,
+        target: float,
+        max_paths: int,
+        engine: str
+    ) -> int:
+        """
+        Estimate the total path count needed to reach the target precision
+
+        Monte Carlo error falls as 1/sqrt(N), quasi-Monte Carlo as ~1/N.
+        The estimate gets a 10% margin, grows by at least one batch and is
+        rounded up to whole batches (keeps antithetic pairs aligned).
+
+        Args:
+            num_paths: Paths simulated so far
+            achieved: Current relative error
+            target: Target relative error
+            max_paths: Upper bound (num_simulations)
+            engine: Resolved engine name
+
+        Returns:
+            Total number of paths for the next round
+        """
+        batch = MonteCarloService.ADAPTIVE_BATCH_PATHS
+        exponent = 1 if engine == "qmc" else 2
+        needed = num_paths * min((achieved / target) ** exponent, 1e6) * 1.1
+        next_paths = int(np.ceil(max(needed, num_paths + batch) / batch)) * batch
+        return min(next_paths, max_paths)
+
     @staticmethod
     def _calculate_portfolio_stats(request: SimulationRequest) -> tuple[float, float]:
         """
@@ -148,20 +1514,8 @@ class MonteCarloService:
         Returns:
             Tuple of (mu, sigma) - annual return and volatility
         """
-        # Simplified assumptions for MVP (replace with Bloomberg data in production)
-        asset_returns = {
-            'equity': 0.12,    # 12% annual return
-            'bonds': 0.06,     # 6% annual return
-            'commodity': 0.08, # 8% annual return
-            'cash': 0.03       # 3% annual return
-        }
-
-        asset_volatility = {
-            'equity': 0.18,    # 18% volatility
-            'bonds': 0.05,     # 5% volatility
-            'commodity': 0.15, # 15% volatility
-            'cash': 0.01       # 1% volatility
-        }
+        asset_returns = MonteCarloService.ASSET_RETURNS
+        asset_volatility = MonteCarloService.ASSET_VOLATILITY
 
         # Weighted average return
         mu = sum(
@@ -177,11 +1531,65 @@ class MonteCarloService:
 
         return mu, sigma
 
+    @staticmethod
+    def _calculate_asset_stats(
+        request: SimulationRequest
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Calculate per-asset returns and the factored covariance matrix
+
+        The covariance Σ = D C D (D = diagonal volatilities, C = correlation
+        from BloombergService) is factored once per request. If the
+        correlation estimate is not positive semi-definite, negative
+        eigenvalues are clipped before factoring.
+
+        Args:
+            request: SimulationRequest
+
+        Returns:
+            Tuple of (weights, mu, cholesky_factor):
+                - weights: Asset weights, shape (n,)
+                - mu: Annual returns, shape (n,)
+                - cholesky_factor: Lower Cholesky factor of Σ, shape (n, n)
+        """
+        assets = request.portfolio.assets
+        weights = np.array([asset.weight for asset in assets])
+        mu = np.array([
+            MonteCarloService.ASSET_RETURNS.get(asset.asset_class.lower(), 0.08)
+            for asset in assets
+        ])
+        sigma = np.array([
+            MonteCarloService.ASSET_VOLATILITY.get(asset.asset_class.lower(), 0.15)
+            for asset in assets
+        ])
+
+        correlation = BloombergService.calculate_correlation_matrix(
+            [asset.ticker for asset in assets]
+        )
+        covariance = correlation * np.outer(sigma, sigma)
+
+        try:
+            cholesky_factor = np.linalg.cholesky(covariance)
+        except np.linalg.LinAlgError:
+            # Nearest PSD matrix (eigenvalue clipping), keeping the variances
+            eigenvalues, eigenvectors = np.linalg.eigh(correlation)
+            clipped = (eigenvectors * np.maximum(eigenvalues, 1e-10)) @ eigenvectors.T
+            scale = np.sqrt(np.diag(clipped))
+            clipped = clipped / np.outer(scale, scale)
+            cholesky_factor = np.linalg.cholesky(clipped * np.outer(sigma, sigma))
+
+        return weights, mu, cholesky_factor
+
     @staticmethod
     def _calculate_statistics(
         final_values: np.ndarray,
         initial_investment: float,
-        paths: np.ndarray
+        paths: np.ndarray,
+        group_size: int = 1,
+        controls: Optional[np.ndarray] = None,
+        control_mean: Optional[float] = None,
+        replicates: int = 1,
+        adjust_mean: bool = True
     ) -> Dict:
         """
         Calculate comprehensive statistics from simulation results
@@ -189,36 +1597,24 @@ class MonteCarloService:
         Args:
             final_values: Array of final portfolio values
             initial_investment: Initial investment amount
-            paths: Sample paths for visualization (first 5)
+            paths: Sample paths for visualization (first few)
+            group_size: Paths per independent group (2 for antithetic pairs)
+            controls: Optional control variate per path (with control_mean)
+            control_mean: Known expectation of the control variate
+            replicates: Randomized QMC blocks (standard errors from their spread)
+            adjust_mean: Apply the control variate to the mean (False when the
+                control is the terminal value itself)
 
         Returns:
-            Dictionary with statistics
-        """
-        # Basic statistics
-        mean_value = float(np.mean(final_values))
-        median_value = float(np.median(final_values))
-        std_deviation = float(np.std(final_values))
-        min_value = float(np.min(final_values))
-        max_value = float(np.max(final_values))
-
-        # Percentiles
-        percentiles = {
-            'p1': float(np.percentile(final_values, 1)),
-            'p5': float(np.percentile(final_values, 5)),
-            'p10': float(np.percentile(final_values, 10)),
-            'p25': float(np.percentile(final_values, 25)),
-            'p50': float(np.percentile(final_values, 50)),
-            'p75': float(np.percentile(final_values, 75)),
-            'p90': float(np.percentile(final_values, 90)),
-            'p95': float(np.percentile(final_values, 95)),
-            'p99': float(np.percentile(final_values, 99)),
-        }
-
-        # Risk metrics
-        var_95 = float(np.percentile(final_values, 5))  # Value at Risk (95% confidence)
-        var_99 = float(np.percentile(final_values, 1))  # Value at Risk (99% confidence)
-        cvar_95 = float(np.mean(final_values[final_values <= var_95]))  # Conditional VaR
-        cvar_99 = float(np.mean(final_values[final_values <= var_99]))
+            Dictionary with statistics (including standard errors)
+        """
+        # Percentiles (one partition) + moments, tails, probabilities (one fused pass)
+        stats = statistics.summarize(
+            final_values, initial_investment, group_size, controls, control_mean, replicates,
+            adjust_mean
+        )
+        mean_value = stats['mean']
+        std_deviation = stats['std_deviation']
 
         # Calculate Sharpe Ratio (simplified)
         annual_return = (mean_value / initial_investment) ** (1/10) - 1  # Assume 10 year horizon
@@ -226,35 +1622,31 @@ class MonteCarloService:
         excess_return = annual_return - risk_free_rate
         sharpe_ratio = excess_return / (std_deviation / mean_value) if std_deviation > 0 else 0.0
 
-        # Probabilities
-        prob_loss = float(np.mean(final_values < initial_investment))
-        prob_doubling = float(np.mean(final_values >= initial_investment * 2))
-        prob_positive_return = float(np.mean(final_values > initial_investment))
-
-        # Convert paths to list for JSON serialization
-        sample_paths_list = [path.tolist() for path in paths]
+        # Kept as an array: converted at the response (JSON lists or binary buffer)
+        sample_paths = np.ascontiguousarray(paths, dtype=np.float64)
 
         return {
             'final_portfolio_value': {
                 'mean': mean_value,
-                'median': median_value,
+                'median': stats['median'],
                 'std_deviation': std_deviation,
-                'min': min_value,
-                'max': max_value,
-                'percentiles': percentiles
+                'min': stats['min'],
+                'max': stats['max'],
+                'percentiles': stats['percentiles']
             },
             'risk_metrics': {
-                'var_95': var_95,
-                'var_99': var_99,
-                'cvar_95': cvar_95,
-                'cvar_99': cvar_99,
+                'var_95': stats['var_95'],  # Value at Risk (95% confidence)
+                'var_99': stats['var_99'],  # Value at Risk (99% confidence)
+                'cvar_95': stats['cvar_95'],  # Conditional VaR
+                'cvar_99': stats['cvar_99'],
                 'sharpe_ratio': float(sharpe_ratio),
                 'volatility': std_deviation / mean_value if mean_value > 0 else 0.0
             },
             'probabilities': {
-                'probability_of_loss': prob_loss,
-                'probability_of_positive_return': prob_positive_return,
-                'probability_of_doubling': prob_doubling
+                'probability_of_loss': stats['probability_of_loss'],
+                'probability_of_positive_return': stats['probability_of_positive_return'],
+                'probability_of_doubling': stats['probability_of_doubling']
             },
-            'sample_paths': sample_paths_list  # First 5 paths for charting
+            'standard_errors': stats['standard_errors'],  # Monte Carlo error of the estimates
+            'sample_paths': sample_paths  # First few paths for charting
         }
@@ -0,0 +1,167 @@
+"""
+Password Hasher
+Bounded thread pool for bcrypt hashing and verification
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import HTTPException, status
+
+from app.config import settings
+from app.utils.security import hash_password, verify_password
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt off the event loop, in a dedicated thread pool
+
+    Behaviour:
+        - A bcrypt hash or verify takes ~250 ms at 12 rounds; it runs in one
+          of pool_size threads (bcrypt releases the GIL), so simulations and
+          other requests on the worker keep being served during a login burst
+        - Backpressure: at most pool_size + queue_size operations in flight,
+          further registrations/logins get 429 with a Retry-After header
+        - The pool is separate from the default executor, so a login storm
+          only adds latency to logins
+
+    Methods:
+        - hash: Hash a password
+        - verify: Verify a password against a hash
+        - shutdown: Stop the thread pool
+        - get_stats: In-flight, completed and rejected counts, wait and work times
+    """
+
+    def __init__(self, pool_size: int, queue_size: int, retry_after_seconds: int):
+        self.pool_size = pool_size
+        self.queue_size = queue_size
+        self.retry_after_seconds = retry_after_seconds
+
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self._wait_seconds = 0.0
+        self._work_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of operations running or queued at once"""
+        return self.pool_size + self.queue_size
+
+    async def hash(self, password: str) -> str:
+        """
+        Hash a password in the pool
+
+        Args:
+            password: Plain text password
+
+        Returns:
+            Bcrypt hash
+
+        Raises:
+            HTTPException 429: If the pool and its queue are full
+        """
+        return await self._run(hash_password, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        Verify a password against its hash in the pool
+
+        Args:
+            plain_password: Plain text password
+            hashed_password: Bcrypt hash
+
+        Returns:
+            True if the password matches
+
+        Raises:
+            HTTPException 429: If the pool and its queue are full
+        """
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    async def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run fn(*args) in the pool, rejecting when at capacity"""
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail="Too many authentication requests. Please retry shortly.",
+                    headers={"Retry-After": str(self.retry_after_seconds)}
+                )
+            self._in_flight += 1
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.pool_size,
+                    thread_name_prefix="password-hash"
+                )
+            pool = self._pool
+
+        future = pool.submit(self._timed, time.perf_counter(), fn, *args)
+        # Frees the slot when the work ends, even if the caller went away
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _timed(self, submitted: float, fn: Callable[..., Any], *args: Any) -> Any:
+        """Pool thread: run fn and record queue wait and work time"""
+        started = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            finished = time.perf_counter()
+            with self._lock:
+                self.completed += 1
+                self._wait_seconds += started - submitted
+                self._work_seconds += finished - started
+                self.max_wait_seconds = max(self.max_wait_seconds, started - submitted)
+
+    def _release(self, _future: Future) -> None:
+        """Done callback: free a capacity slot"""
+        with self._lock:
+            self._in_flight -= 1
+
+    def shutdown(self) -> None:
+        """Stop the thread pool (running operations finish first)"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+            logger.info(f"Password hasher stopped: {self.get_stats()}")
+
+    def get_stats(self) -> Dict:
+        """
+        Get password hashing statistics
+
+        Returns:
+            Dictionary with pool_size, capacity, in_flight, completed,
+            rejected and average/maximum queue wait and work times (ms)
+        """
+        with self._lock:
+            completed = self.completed
+            return {
+                "pool_size": self.pool_size,
+                "capacity": self.capacity,
+                "in_flight": self._in_flight,
+                "completed": completed,
+                "rejected": self.rejected,
+                "avg_wait_ms": round(1000 * self._wait_seconds / completed, 2) if completed else 0.0,
+                "max_wait_ms": round(1000 * self.max_wait_seconds, 2),
+                "avg_work_ms": round(1000 * self._work_seconds / completed, 2) if completed else 0.0
+            }
+
+
+# Global hasher (one pool per application process)
+password_hasher = PasswordHasher(
+    pool_size=settings.PASSWORD_HASH_POOL_SIZE,
+    queue_size=settings.PASSWORD_HASH_QUEUE_SIZE,
+    retry_after_seconds=settings.PASSWORD_HASH_RETRY_AFTER_SECONDS
+)
@@ -0,0 +1,128 @@
+"""
+Quasi-Monte Carlo Sampling
+Scrambled Sobol normals and Brownian-bridge path construction
+
+Randomized QMC: the points are split into independently scrambled
+replicates (blocks of consecutive paths), so the spread of the replicate
+estimates gives an honest standard error; the usual iid formulas do not
+apply to low-discrepancy points.
+"""
+
+import warnings
+
+import numpy as np
+from numba import njit
+from scipy.special import ndtri
+from scipy.stats import qmc
+
+
+# Independently scrambled Sobol sequences per simulation (for standard errors)
+DEFAULT_REPLICATES = 8
+
+
+def replicate_sizes(num_points: int, replicates: int) -> np.ndarray:
+    """
+    Number of points in each replicate block (same split as np.array_split)
+
+    Args:
+        num_points: Total number of points
+        replicates: Number of replicate blocks
+
+    Returns:
+        Array of shape (replicates,) with block sizes
+    """
+    sizes = np.full(replicates, num_points // replicates)
+    sizes[:num_points % replicates] += 1
+    return sizes
+
+
+def sobol_normals(
+    num_points: int,
+    dimensions: int,
+    seed: int,
+    replicates: int = DEFAULT_REPLICATES
+) -> np.ndarray:
+    """
+    Standard normals from scrambled Sobol points (inverse normal CDF)
+
+    Each replicate block is the leading part of its own Owen-scrambled
+    Sobol sequence, seeded from (seed, replicate) for reproducibility.
+
+    Args:
+        num_points: Number of points (paths)
+        dimensions: Normals per point (e.g. 1, or one per asset)
+        seed: Simulation seed
+        replicates: Number of independently scrambled blocks
+
+    Returns:
+        Array of shape (num_points, dimensions) with standard normals
+    """
+    blocks = []
+    for replicate, size in enumerate(replicate_sizes(num_points, replicates)):
+        sampler = qmc.Sobol(
+            d=dimensions,
+            scramble=True,
+            seed=np.random.default_rng([seed, replicate])
+        )
+        with warnings.catch_warnings():
+            # Leading n points of a scrambled sequence are fine for any n
+            warnings.simplefilter("ignore", UserWarning)
+            blocks.append(sampler.random(int(size)))
+
+    points = np.concatenate(blocks)
+    return ndtri(np.clip(points, 1e-16, 1 - 1e-16))
+
+
+@njit(cache=True)
+def brownian_bridge(normals: np.ndarray, T: float) -> np.ndarray:
+    """
+    Build Brownian motion paths on a uniform grid by Brownian bridge
+
+    Column 0 of normals fixes W(T); each following column fills the
+    midpoint of the widest remaining interval, conditioned on its
+    endpoints. The first (low-dimensional, well-distributed) coordinates
+    therefore carry most of the path variance, which is what QMC needs.
+
+    Args:
+        normals: Standard normals, shape (num_paths, num_steps)
+        T: Horizon in years
+
+    Returns:
+        Array of shape (num_paths, num_steps) with W(t_1) .. W(t_N)
+    """
+    num_paths, num_steps = normals.shape
+    dt = T / num_steps
+    W = np.empty((num_paths, num_steps))
+    known = np.zeros(num_steps, dtype=np.bool_)
+
+    for p in range(num_paths):
+        W[p, num_steps - 1] = np.sqrt(T) * normals[p, 0]
+    known[num_steps - 1] = True
+
+    left = 0
+    for i in range(1, num_steps):
+        # Next interval with unknown points: (left - 1, right)
+        while known[left]:
+            left = (left + 1) % num_steps
+        right = left
+        while not known[right]:
+            right += 1
+        mid = left + (right - 1 - left) // 2
+        known[mid] = True
+
+        t_left = left * dt
+        t_mid = (mid + 1) * dt
+        t_right = (right + 1) * dt
+        left_weight = (t_right - t_mid) / (t_right - t_left)
+        right_weight = (t_mid - t_left) / (t_right - t_left)
+        std = np.sqrt((t_mid - t_left) * (t_right - t_mid) / (t_right - t_left))
+
+        for p in range(num_paths):
+            w_left = W[p, left - 1] if left > 0 else 0.0
+            W[p, mid] = left_weight * w_left + right_weight * W[p, right] + std * normals[p, i]
+
+        left = right + 1
+        if left >= num_steps:
+            left = 0
+
+    return W
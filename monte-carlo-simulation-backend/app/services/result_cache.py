@@ -0,0 +1,267 @@
+"""
+Simulation Result Cache
+Content-addressed cache for deterministic (seeded) simulation requests
+"""
+
+import json
+import logging
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+import numpy as np
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.cached_simulation_result import CachedSimulationResult
+from app.schemas.simulation import SimulationRequest
+from app.services.monte_carlo import MonteCarloService
+from app.utils.security import hash_request_payload
+from app.utils.serialization import from_jsonable, to_jsonable
+
+logger = logging.getLogger(__name__)
+
+
+class SimulationResultCache:
+    """
+    Two-tier cache of simulation results keyed by request content
+
+    Business Rules:
+        - Only requests with an explicit seed are cached (others are random)
+        - Key = SHA-256 of the canonical request JSON plus ENGINE_VERSION,
+          so bumping the engine version invalidates every entry
+        - Local tier: in-process LRU of the results as simulated (NumPy
+          array fields kept), evicted by total size (max_bytes: JSON size
+          plus array bytes)
+        - Shared tier (optional): simulation_result_cache table in PostgreSQL,
+          visible to all workers, entries expire after shared_ttl_hours;
+          results are stored in their JSON form
+        - Shared tier failures are logged and treated as misses
+
+    Methods:
+        - hash_request: Canonical request hash (also logged in ApiCallLog)
+        - cache_key: Cache key for a request (None if not cacheable)
+        - get: Look up results (local tier, then shared tier)
+        - put: Store results in both tiers
+        - purge_expired: Delete expired shared tier entries
+        - get_stats: Hit/miss counters and local tier size
+    """
+
+    def __init__(
+        self,
+        enabled: bool,
+        max_bytes: int,
+        shared_enabled: bool,
+        shared_ttl_hours: int
+    ):
+        self.enabled = enabled
+        self.max_bytes = max_bytes
+        self.shared_enabled = shared_enabled
+        self.shared_ttl_hours = shared_ttl_hours
+
+        # cache_key -> (results, size in bytes), least recently used first
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._size_bytes = 0
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+
+    # ============================================
+    # Keys
+    # ============================================
+
+    @staticmethod
+    def canonical_json(request: SimulationRequest) -> str:
+        """Serialize request with sorted keys and no whitespace"""
+        return json.dumps(
+            request.model_dump(mode="json"),
+            sort_keys=True,
+            separators=(",", ":")
+        )
+
+    @staticmethod
+    def hash_request(request: SimulationRequest) -> str:
+        """
+        Hash the canonical request payload
+
+        Args:
+            request: Simulation request
+
+        Returns:
+            SHA-256 hash (64 chars hex)
+        """
+        return hash_request_payload(SimulationResultCache.canonical_json(request))
+
+    def cache_key(self, request: SimulationRequest) -> Optional[str]:
+        """
+        Compute the cache key for a request
+
+        Args:
+            request: Simulation request
+
+        Returns:
+            SHA-256 cache key, or None if the request is not cacheable
+        """
+        if not self.enabled or request.parameters.seed is None:
+            return None
+        return hash_request_payload(
+            f"{MonteCarloService.ENGINE_VERSION}:{self.canonical_json(request)}"
+        )
+
+    # ============================================
+    # Lookup / Store
+    # ============================================
+
+    async def get(self, key: Optional[str], db: Optional[AsyncSession] = None) -> Optional[Dict]:
+        """
+        Look up cached results
+
+        Args:
+            key: Cache key from cache_key() (None means not cacheable)
+            db: Database session (required for the shared tier)
+
+        Returns:
+            Copy of cached results, or None on miss
+        """
+        if key is None:
+            return None
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(entry[0])
+
+        if self.shared_enabled and db is not None:
+            results = await self._get_shared(key, db)
+            if results is not None:
+                results = from_jsonable(results)
+                self._put_local(key, results)
+                self.shared_hits += 1
+                return dict(results)
+
+        self.misses += 1
+        return None
+
+    async def put(self, key: Optional[str], results: Dict, db: Optional[AsyncSession] = None) -> None:
+        """
+        Store results in the local tier and (if enabled) the shared tier
+
+        Args:
+            key: Cache key from cache_key() (None means not cacheable)
+            results: Simulation results (JSON-serializable apart from NumPy arrays)
+            db: Database session (required for the shared tier)
+        """
+        if key is None:
+            return
+
+        self._put_local(key, results)
+        if self.shared_enabled and db is not None:
+            await self._put_shared(key, to_jsonable(results), db)
+
+    def clear(self) -> None:
+        """Drop all local tier entries"""
+        self._entries.clear()
+        self._size_bytes = 0
+
+    def get_stats(self) -> Dict:
+        """Cache counters and local tier size"""
+        return {
+            "entries": len(self._entries),
+            "size_bytes": self._size_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses
+        }
+
+    # ============================================
+    # Local tier (LRU)
+    # ============================================
+
+    def _put_local(self, key: str, results: Dict) -> None:
+        """Insert into the LRU, evicting least recently used entries by size"""
+        arrays = [value for value in results.values() if isinstance(value, np.ndarray)]
+        size = len(json.dumps(
+            {name: value for name, value in results.items() if not isinstance(value, np.ndarray)},
+            separators=(",", ":")
+        )) + sum(array.nbytes for array in arrays)
+        if size > self.max_bytes:
+            return
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size_bytes -= previous[1]
+
+        self._entries[key] = (results, size)
+        self._size_bytes += size
+
+        while self._size_bytes > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._size_bytes -= evicted_size
+
+    # ============================================
+    # Shared tier (PostgreSQL)
+    # ============================================
+
+    async def _get_shared(self, key: str, db: AsyncSession) -> Optional[Dict]:
+        """Read an unexpired entry from simulation_result_cache"""
+        try:
+            stmt = select(CachedSimulationResult.results).where(
+                CachedSimulationResult.cache_key == key,
+                CachedSimulationResult.expires_at > datetime.now(timezone.utc)
+            )
+            result = await db.execute(stmt)
+            return result.scalar_one_or_none()
+        except Exception as e:
+            logger.warning(f"Shared result cache lookup failed: {e}")
+            await db.rollback()
+            return None
+
+    async def _put_shared(self, key: str, results: Dict, db: AsyncSession) -> None:
+        """Upsert an entry into simulation_result_cache"""
+        expires_at = datetime.now(timezone.utc) + timedelta(hours=self.shared_ttl_hours)
+        try:
+            stmt = insert(CachedSimulationResult).values(
+                cache_key=key,
+                engine_version=MonteCarloService.ENGINE_VERSION,
+                results=results,
+                expires_at=expires_at
+            ).on_conflict_do_update(
+                index_elements=[CachedSimulationResult.cache_key],
+                set_={"results": results, "expires_at": expires_at}
+            )
+            await db.execute(stmt)
+            await db.commit()
+        except Exception as e:
+            logger.warning(f"Shared result cache write failed: {e}")
+            await db.rollback()
+
+    @staticmethod
+    async def purge_expired(db: AsyncSession) -> int:
+        """
+        Delete expired shared tier entries
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of deleted entries
+        """
+        stmt = delete(CachedSimulationResult).where(
+            CachedSimulationResult.expires_at < datetime.now(timezone.utc)
+        )
+        result = await db.execute(stmt)
+        await db.commit()
+        return result.rowcount
+
+
+# Global result cache instance
+simulation_result_cache = SimulationResultCache(
+    enabled=settings.RESULT_CACHE_ENABLED,
+    max_bytes=settings.RESULT_CACHE_MAX_BYTES,
+    shared_enabled=settings.RESULT_CACHE_SHARED_ENABLED,
+    shared_ttl_hours=settings.RESULT_CACHE_SHARED_TTL_HOURS
+)
@@ -0,0 +1,266 @@
+"""
+Counter-Based Random Number Generation
+SplitMix64 streams keyed by (seed, path_index), callable from Numba kernels
+
+Every draw is a pure function of (seed, stream, counter):
+    - stream: path index (one independent stream per simulation path)
+    - counter: position within the path (e.g. time step)
+
+There is no shared generator state, so a seeded simulation gives identical
+results regardless of thread count, and any path (or range of paths) can be
+regenerated independently on another thread, process or node.
+
+Antithetic variates: paths 2k and 2k + 1 share stream k, and the odd path
+uses the negated normals (see path_stream).
+
+Kernels that need one normal per time step draw them in bulk from the
+paired sequence (fill_standard_normals): both Box-Muller outputs are used.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+# SplitMix64 constants (Steele, Lea & Flood, 2014)
+_GOLDEN_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+_MIX_MULTIPLIER_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX_MULTIPLIER_2 = np.uint64(0x94D049BB133111EB)
+
+# 2^-53: converts the top 53 bits of a uint64 into a double in (0, 1]
+_INV_2_POW_53 = 1.0 / 9007199254740992.0
+_TWO_PI = 2.0 * np.pi
+
+# Single precision: top 24 bits of the same uint64 (uniforms in (0, 1])
+_INV_2_POW_24 = np.float32(1.0 / 16777216.0)
+_TWO_PI_32 = np.float32(2.0 * np.pi)
+
+
+@njit(cache=True)
+def mix64(z: np.uint64) -> np.uint64:
+    """
+    SplitMix64 finalizer (bijective 64-bit mixing function)
+
+    Args:
+        z: 64-bit unsigned integer
+
+    Returns:
+        Mixed 64-bit unsigned integer
+    """
+    z = (z ^ (z >> np.uint64(30))) * _MIX_MULTIPLIER_1
+    z = (z ^ (z >> np.uint64(27))) * _MIX_MULTIPLIER_2
+    return z ^ (z >> np.uint64(31))
+
+
+@njit(cache=True)
+def stream_key(seed: int, stream: int) -> np.uint64:
+    """
+    Derive the key of an independent stream from (seed, stream index)
+
+    Args:
+        seed: Simulation seed
+        stream: Stream index (typically the global path index)
+
+    Returns:
+        64-bit stream key
+    """
+    seed_key = mix64(np.uint64(seed) * _GOLDEN_GAMMA + _GOLDEN_GAMMA)
+    stream_offset = mix64((np.uint64(stream) + np.uint64(1)) * _GOLDEN_GAMMA)
+    return mix64(seed_key ^ stream_offset)
+
+
+@njit(cache=True)
+def path_stream(seed: int, path: int, antithetic: bool) -> tuple:
+    """
+    Stream key and sign of the normals for a simulation path
+
+    Args:
+        seed: Simulation seed
+        path: Global path index
+        antithetic: Pair paths 2k and 2k + 1 on stream k with opposite signs
+
+    Returns:
+        Tuple of (stream key, +1.0 or -1.0)
+    """
+    if antithetic:
+        sign = -1.0 if path % 2 == 1 else 1.0
+        return stream_key(seed, path // 2), sign
+    return stream_key(seed, path), 1.0
+
+
+@njit(cache=True)
+def random_uint64(key: np.uint64, counter: int) -> np.uint64:
+    """
+    Return the counter-th 64-bit output of the stream
+
+    Args:
+        key: Stream key from stream_key()
+        counter: Position within the stream
+
+    Returns:
+        64-bit unsigned integer
+    """
+    return mix64(key + (np.uint64(counter) + np.uint64(1)) * _GOLDEN_GAMMA)
+
+
+@njit(cache=True)
+def uniform(key: np.uint64, counter: int) -> float:
+    """
+    Return the counter-th uniform draw of the stream, in (0, 1]
+
+    Args:
+        key: Stream key from stream_key()
+        counter: Position within the stream
+
+    Returns:
+        Uniform float in (0, 1]
+    """
+    bits = random_uint64(key, counter) >> np.uint64(11)
+    return (float(bits) + 1.0) * _INV_2_POW_53
+
+
+@njit(cache=True)
+def standard_normal(key: np.uint64, counter: int) -> float:
+    """
+    Return the counter-th standard normal draw of the stream (Box-Muller)
+
+    Each normal consumes uniforms 2*counter and 2*counter + 1, so draws
+    at different counters are independent and can be computed in any order.
+
+    Args:
+        key: Stream key from stream_key()
+        counter: Position within the stream
+
+    Returns:
+        Standard normal float
+    """
+    u1 = uniform(key, 2 * counter)
+    u2 = uniform(key, 2 * counter + 1)
+    return np.sqrt(-2.0 * np.log(u1)) * np.cos(_TWO_PI * u2)
+
+
+@njit(cache=True)
+def _polar(key: np.uint64, pair: int) -> tuple:
+    """Box-Muller radius and angle of a pair (uniforms 2 * pair, 2 * pair + 1)"""
+    return np.sqrt(-2.0 * np.log(uniform(key, 2 * pair))), _TWO_PI * uniform(key, 2 * pair + 1)
+
+
+@njit(cache=True)
+def fill_standard_normals(key: np.uint64, first_pair: int, out: np.ndarray) -> None:
+    """
+    Fill out with consecutive draws of the stream's paired normal sequence
+
+    Bulk generator for kernels that consume many normals per path. One
+    Box-Muller transform of uniforms (2p, 2p + 1) yields both normals of
+    pair p (cosine, then sine), halving the uniforms, logarithms and square
+    roots per draw compared with standard_normal. Draw k of the sequence is
+    component k % 2 of pair k // 2, so blocks of even length give the same
+    sequence however it is split. Draw 2p equals standard_normal(key, p).
+
+    Args:
+        key: Stream key from stream_key()
+        first_pair: Pair of the first draw (draw index first_pair * 2)
+        out: Output array (float64), filled in place; an odd length ends
+             with the cosine half of the last pair
+    """
+    n = out.shape[0]
+    for p in range(n // 2):
+        radius, angle = _polar(key, first_pair + p)
+        out[2 * p] = radius * np.cos(angle)
+        out[2 * p + 1] = radius * np.sin(angle)
+    if n % 2 == 1:
+        radius, angle = _polar(key, first_pair + n // 2)
+        out[n - 1] = radius * np.cos(angle)
+
+
+@njit(cache=True)
+def _polar32(key: np.uint64, pair: int) -> tuple:
+    """float32 Box-Muller radius and angle of a pair (top 24 bits of the uniforms)"""
+    u1 = (np.float32(random_uint64(key, 2 * pair) >> np.uint64(40)) + np.float32(1.0)) * _INV_2_POW_24
+    u2 = (np.float32(random_uint64(key, 2 * pair + 1) >> np.uint64(40)) + np.float32(1.0)) * _INV_2_POW_24
+    return np.sqrt(np.float32(-2.0) * np.log(u1)), _TWO_PI_32 * u2
+
+
+@njit(cache=True)
+def fill_standard_normals32(key: np.uint64, first_pair: int, out: np.ndarray) -> None:
+    """
+    Single-precision variant of fill_standard_normals (Box-Muller in float32)
+
+    Uses the top 24 bits of the same uniforms, so each float32 draw tracks
+    the float64 draw to about 1e-6 (relative). The smallest uniform is
+    2^-24, which truncates |Z| at about 5.8.
+
+    Args:
+        key: Stream key from stream_key()
+        first_pair: Pair of the first draw (draw index first_pair * 2)
+        out: Output array (float32), filled in place
+    """
+    n = out.shape[0]
+    for p in range(n // 2):
+        radius, angle = _polar32(key, first_pair + p)
+        out[2 * p] = radius * np.cos(angle)
+        out[2 * p + 1] = radius * np.sin(angle)
+    if n % 2 == 1:
+        radius, angle = _polar32(key, first_pair + n // 2)
+        out[n - 1] = radius * np.cos(angle)
+
+
+@njit(parallel=True, cache=True)
+def standard_normals(
+    seed: int,
+    num_streams: int,
+    stream_offset: int = 0,
+    counter: int = 0,
+    antithetic: bool = False
+) -> np.ndarray:
+    """
+    Draw one standard normal per stream (vectorized helper)
+
+    Args:
+        seed: Simulation seed
+        num_streams: Number of consecutive streams (paths)
+        stream_offset: Index of the first stream (path)
+        counter: Position within each stream
+        antithetic: Antithetic path pairs (see path_stream)
+
+    Returns:
+        Array of shape (num_streams,) with standard normals
+    """
+    out = np.empty(num_streams)
+    for i in prange(num_streams):
+        key, sign = path_stream(seed, stream_offset + i, antithetic)
+        out[i] = sign * standard_normal(key, counter)
+    return out
+
+
+@njit(parallel=True, cache=True)
+def standard_normal_block(
+    seed: int,
+    num_streams: int,
+    width: int,
+    stream_offset: int = 0,
+    counter_offset: int = 0,
+    antithetic: bool = False
+) -> np.ndarray:
+    """
+    Draw a block of consecutive standard normals from each stream
+
+    Row i holds draws counter_offset .. counter_offset + width - 1 of stream
+    stream_offset + i, e.g. one row per path and one column per asset.
+
+    Args:
+        seed: Simulation seed
+        num_streams: Number of consecutive streams (rows)
+        width: Number of consecutive draws per stream (columns)
+        stream_offset: Index of the first stream
+        counter_offset: Position of the first draw within each stream
+        antithetic: Antithetic path pairs (see path_stream)
+
+    Returns:
+        Array of shape (num_streams, width) with standard normals
+    """
+    out = np.empty((num_streams, width))
+    for i in prange(num_streams):
+        key, sign = path_stream(seed, stream_offset + i, antithetic)
+        for j in range(width):
+            out[i, j] = sign * standard_normal(key, counter_offset + j)
+    return out
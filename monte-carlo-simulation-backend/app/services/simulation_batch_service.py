@@ -0,0 +1,386 @@
+"""
+Simulation Batch Service
+Evaluate many simulation requests together: batches (streamed as they finish)
+and parameter sweeps (a grid over one base request)
+"""
+
+import asyncio
+import json
+import math
+import time
+import uuid
+from collections import defaultdict
+from typing import AsyncIterator, Awaitable, Callable, List, Optional
+
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.schemas.simulation import (
+    SimulationRequest,
+    SimulationBatchItem,
+    SimulationSweepRequest,
+    SimulationSweepPoint
+)
+from app.services.monte_carlo import MonteCarloService
+from app.services.result_cache import simulation_result_cache
+from app.services.simulation_executor import simulation_executor
+from app.utils.security import hash_request_payload
+from app.utils.serialization import to_jsonable
+
+
+class SimulationBatchService:
+    """
+    Batch simulation service (POST /api/v1/simulate/batch)
+
+    Business Rules:
+        - Requests with an explicit seed keep it; unseeded requests share one
+          seed drawn for the batch (common random numbers)
+        - Seeded requests are served from the result cache when possible
+        - The rest are grouped by draw layout (seed, engine, time_step, model,
+          paths, ...): each group is one worker pool task that shares its
+          random draws across portfolios, horizons and contribution amounts
+          (MonteCarloService.simulate_batch)
+        - Large groups are split so every worker gets a share, and at most
+          pool_size tasks of a batch are in flight (a batch does not fill
+          the queue and push other callers into 429)
+        - A failed simulation or task (429/504) only fails its own requests
+        - Sweeps run every grid point on one seed (common random numbers);
+          the grid is split into pool tasks of SIMULATION_SWEEP_CHUNK_SIZE
+          points (each draws once), at most pool_size of them in flight, so
+          a sweep never holds a worker for the time of the whole grid
+
+    Methods:
+        - hash_batch: Canonical hash of the whole batch (ApiCallLog)
+        - assign_seeds: Give unseeded requests the batch seed
+        - group_requests: Split requests into draw-sharing pool tasks
+        - run_batch: Yield a SimulationBatchItem per request as results arrive
+        - hash_sweep: Canonical hash of a sweep request (ApiCallLog)
+        - expand_sweep: Grid points and simulation requests of a sweep
+        - run_sweep: Evaluate a sweep
+    """
+
+    # ============================================
+    # Batches
+    # ============================================
+
+    @staticmethod
+    def hash_batch(requests: List[SimulationRequest]) -> str:
+        """
+        Hash the canonical payload of a batch
+
+        Args:
+            requests: Simulation requests
+
+        Returns:
+            SHA-256 hash (64 chars hex)
+        """
+        return hash_request_payload(
+            ":".join(simulation_result_cache.hash_request(request) for request in requests)
+        )
+
+    @staticmethod
+    def assign_seeds(requests: List[SimulationRequest], batch_seed: int) -> List[SimulationRequest]:
+        """
+        Give every unseeded request the batch seed
+
+        Args:
+            requests: Simulation requests
+            batch_seed: Seed shared by the unseeded requests
+
+        Returns:
+            Requests in the same order (copies where the seed was set)
+        """
+        return [
+            request if request.parameters.seed is not None
+            else request.model_copy(update={
+                "parameters": request.parameters.model_copy(update={"seed": batch_seed})
+            })
+            for request in requests
+        ]
+
+    @staticmethod
+    def _draw_layout(request: SimulationRequest) -> tuple:
+        """Parameters that decide which random draws a simulation uses"""
+        parameters = request.parameters
+        return (
+            parameters.seed,
+            *MonteCarloService.resolve_engine(parameters),
+            parameters.model,
+            len(request.portfolio.assets) if parameters.model == "multi_asset" else 1,
+            parameters.num_simulations,
+            parameters.antithetic,
+            parameters.precision,
+            parameters.target_relative_error is not None
+        )
+
+    @staticmethod
+    def group_requests(
+        requests: List[SimulationRequest],
+        indices: List[int],
+        workers: int
+    ) -> List[List[int]]:
+        """
+        Split requests into pool tasks that share random draws
+
+        Requests with the same draw layout go to the same task; groups larger
+        than an even share of the workers are split (each part draws once).
+
+        Args:
+            requests: Simulation requests (seeds assigned)
+            indices: Indices of the requests to run
+            workers: Number of pool workers
+
+        Returns:
+            List of tasks, each a list of request indices
+        """
+        groups = defaultdict(list)
+        for index in indices:
+            groups[SimulationBatchService._draw_layout(requests[index])].append(index)
+
+        chunk_size = max(1, math.ceil(len(indices) / max(workers, 1)))
+        return [
+            group[start:start + chunk_size]
+            for group in groups.values()
+            for start in range(0, len(group), chunk_size)
+        ]
+
+    @staticmethod
+    async def run_batch(
+        requests: List[SimulationRequest],
+        db: Optional[AsyncSession] = None,
+        is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None
+    ) -> AsyncIterator[SimulationBatchItem]:
+        """
+        Run a batch of simulations, yielding each result as it becomes available
+
+        Cache hits come first, then the results of each pool task as it
+        finishes. Every request yields exactly one item.
+
+        Args:
+            requests: Simulation requests
+            db: Database session (shared result cache tier)
+            is_disconnected: Optional coroutine function; queued work is
+                cancelled if it reports that the client went away
+
+        Yields:
+            SimulationBatchItem of type 'result' (index = request position)
+        """
+        seeded = SimulationBatchService.assign_seeds(requests, int(time.time()) % 10000)
+        cache_keys = [simulation_result_cache.cache_key(request) for request in requests]
+
+        pending = []
+        for index, cache_key in enumerate(cache_keys):
+            results = await simulation_result_cache.get(cache_key, db)
+            if results is None:
+                pending.append(index)
+            else:
+                yield SimulationBatchService._item(index, "HIT", results)
+
+        workers = max(simulation_executor.pool_size, 1)
+        semaphore = asyncio.Semaphore(workers)
+
+        async def run_task(task: List[int]) -> tuple:
+            async with semaphore:
+                try:
+                    outcomes = await MonteCarloService.run_batch(
+                        [seeded[index] for index in task],
+                        is_disconnected=is_disconnected,
+                        timeout_seconds=simulation_executor.timeout_seconds * len(task)
+                    )
+                except HTTPException as e:
+                    outcomes = [(None, str(e.detail))] * len(task)
+            return task, outcomes
+
+        tasks = [
+            asyncio.create_task(run_task(task))
+            for task in SimulationBatchService.group_requests(seeded, pending, workers)
+        ]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                task, outcomes = await finished
+                for index, (results, error_message) in zip(task, outcomes):
+                    if results is None:
+                        yield SimulationBatchService._item(index, None, None, error_message)
+                        continue
+                    cache_key = cache_keys[index]
+                    await simulation_result_cache.put(cache_key, results, db)
+                    yield SimulationBatchService._item(index, "MISS" if cache_key else "BYPASS", results)
+        finally:
+            for pending_task in tasks:
+                pending_task.cancel()
+
+    @staticmethod
+    def _item(
+        index: int,
+        cache: Optional[str],
+        results: Optional[dict],
+        error_message: Optional[str] = None
+    ) -> SimulationBatchItem:
+        """Result line for one request"""
+        return SimulationBatchItem(
+            type="result",
+            index=index,
+            simulation_id=f"sim_{uuid.uuid4().hex[:12]}",
+            status="completed" if results is not None else "failed",
+            cache=cache,
+            results=to_jsonable(results) if results is not None else None,
+            error_message=error_message
+        )
+
+    # ============================================
+    # Sweeps
+    # ============================================
+
+    @staticmethod
+    def hash_sweep(sweep: SimulationSweepRequest) -> str:
+        """
+        Hash the canonical payload of a sweep
+
+        Args:
+            sweep: Sweep request
+
+        Returns:
+            SHA-256 hash (64 chars hex)
+        """
+        return hash_request_payload(
+            json.dumps(sweep.model_dump(mode="json"), sort_keys=True, separators=(",", ":"))
+        )
+
+    @staticmethod
+    def expand_sweep(sweep: SimulationSweepRequest, seed: int) -> tuple:
+        """
+        Build the simulation request of every grid point
+
+        Every point gets the same seed, and (when the base engine is 'auto')
+        the same engine and time step, so all points use the same draws.
+
+        Args:
+            sweep: Sweep request
+            seed: Seed shared by all points
+
+        Returns:
+            Tuple of (points, requests): point coordinates (dicts with
+            time_horizon_years, monthly_contribution, allocation_weight) and
+            the matching SimulationRequests, horizons outermost
+
+        Raises:
+            HTTPException 422: If a grid point is not a valid request
+        """
+        base = sweep.base
+        axes = sweep.axes
+        horizons = axes.time_horizon_years or [base.parameters.time_horizon_years]
+        contributions = axes.monthly_contribution or [base.parameters.monthly_contribution]
+        weights = axes.allocation.weights if axes.allocation else [None]
+
+        overrides = {"seed": seed}
+        if base.parameters.engine == "auto" and max(contributions) > 0:
+            # 'auto' would pick another engine for points without contributions
+            engine, time_step = MonteCarloService.resolve_engine(
+                base.parameters.model_copy(update={"monthly_contribution": max(contributions)})
+            )
+            overrides.update(engine=engine, time_step=time_step)
+
+        points = []
+        requests = []
+        for time_horizon_years in horizons:
+            for monthly_contribution in contributions:
+                for weight in weights:
+                    payload = base.model_dump()
+                    payload["parameters"].update(
+                        overrides,
+                        time_horizon_years=time_horizon_years,
+                        monthly_contribution=monthly_contribution
+                    )
+                    if weight is not None:
+                        SimulationBatchService._reweight(
+                            payload["portfolio"]["assets"], axes.allocation.ticker, weight
+                        )
+                    try:
+                        requests.append(SimulationRequest.model_validate(payload))
+                    except ValidationError as e:
+                        raise HTTPException(
+                            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                            detail=(
+                                f"Invalid sweep point (time_horizon_years={time_horizon_years}, "
+                                f"monthly_contribution={monthly_contribution}, "
+                                f"allocation_weight={weight}): {e.errors()[0]['msg']}"
+                            )
+                        )
+                    points.append({
+                        "time_horizon_years": time_horizon_years,
+                        "monthly_contribution": monthly_contribution,
+                        "allocation_weight": weight
+                    })
+        return points, requests
+
+    @staticmethod
+    def _reweight(assets: List[dict], ticker: str, weight: float) -> None:
+        """Set the weight of ticker, rescaling the other assets to fill the rest"""
+        others = [asset for asset in assets if asset["ticker"] != ticker]
+        others_weight = sum(asset["weight"] for asset in others)
+        for asset in assets:
+            if asset["ticker"] == ticker:
+                asset["weight"] = weight
+            elif others_weight > 0:
+                asset["weight"] = asset["weight"] * (1 - weight) / others_weight
+            else:
+                asset["weight"] = (1 - weight) / len(others)
+
+    @staticmethod
+    async def run_sweep(
+        sweep: SimulationSweepRequest,
+        is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None
+    ) -> tuple:
+        """
+        Evaluate every grid point of a sweep with common random numbers
+
+        Args:
+            sweep: Sweep request
+            is_disconnected: Optional coroutine function; queued work is
+                cancelled if it reports that the client went away
+
+        Returns:
+            Tuple of (seed, points) with one SimulationSweepPoint per grid point
+
+        Raises:
+            HTTPException 422: If a grid point is not a valid request
+            HTTPException 429: If the worker pool queue is full
+            HTTPException 504: If the sweep times out
+        """
+        seed = sweep.base.parameters.seed
+        if seed is None:
+            seed = int(time.time()) % 10000
+        points, requests = SimulationBatchService.expand_sweep(sweep, seed)
+
+        chunk_size = max(1, settings.SIMULATION_SWEEP_CHUNK_SIZE)
+        semaphore = asyncio.Semaphore(max(simulation_executor.pool_size, 1))
+
+        async def run_chunk(chunk: List[SimulationRequest]) -> list:
+            async with semaphore:
+                return await MonteCarloService.run_batch(
+                    chunk,
+                    is_disconnected=is_disconnected,
+                    timeout_seconds=simulation_executor.timeout_seconds * len(chunk)
+                )
+
+        tasks = [
+            asyncio.create_task(run_chunk(requests[start:start + chunk_size]))
+            for start in range(0, len(requests), chunk_size)
+        ]
+        try:
+            outcomes = [outcome for chunk in await asyncio.gather(*tasks) for outcome in chunk]
+        finally:
+            # A failed chunk fails the sweep: drop the chunks still queued
+            for task in tasks:
+                task.cancel()
+        return seed, [
+            SimulationSweepPoint(
+                **point,
+                status="completed" if results is not None else "failed",
+                results=to_jsonable(results) if results is not None else None,
+                error_message=error_message
+            )
+            for point, (results, error_message) in zip(points, outcomes)
+        ]
@@ -0,0 +1,529 @@
+"""
+Simulation Executor
+Process pool that runs CPU-bound simulations off the asyncio event loop
+"""
+
+import asyncio
+import functools
+import itertools
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import numba
+from fastapi import HTTPException, status
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _initialize_worker(num_threads: int, ready_queue: Optional[Any] = None) -> None:
+    """
+    Worker process initializer
+
+    Splits the machine's cores between workers (avoids Numba thread
+    oversubscription) and JIT-compiles the simulation kernels so the
+    first request served by the worker does not pay the compile cost.
+
+    Args:
+        num_threads: Numba threads for this worker
+        ready_queue: Optional queue; the worker PID is put on it once warm
+    """
+    from app.services.monte_carlo import MonteCarloService
+
+    numba.set_num_threads(num_threads)
+    MonteCarloService.warmup()
+    if ready_queue is not None:
+        ready_queue.put(os.getpid())
+
+
+def _spawn_worker() -> None:
+    """No-op task: submitting one per worker makes the pool spawn them all"""
+
+
+# Progress queue of a worker process (set by _initialize_process)
+_progress_queue: Optional[Any] = None
+
+# Last progress message of a task (sent when fn returns or raises)
+_PROGRESS_DONE = "__done__"
+
+
+def _initialize_process(
+    progress_queue: Any,
+    initializer: Optional[Callable[..., None]],
+    *initargs: Any
+) -> None:
+    """Pool initializer: keep the progress queue, then run the executor's initializer"""
+    global _progress_queue
+    _progress_queue = progress_queue
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _run_with_progress(token: int, fn: Callable[..., Any], *args: Any) -> Any:
+    """Worker-side wrapper: fn(*args, progress=...) with progress sent to the parent"""
+    try:
+        return fn(*args, progress=lambda payload: _progress_queue.put((token, payload)))
+    finally:
+        _progress_queue.put((token, _PROGRESS_DONE))
+
+
+class SimulationExecutor:
+    """
+    Managed process pool for Monte Carlo simulations
+
+    Behaviour:
+        - Workers are spawned processes with JIT-warmed kernels; compiled
+          kernels are cached on disk (NUMBA_CACHE_DIR) and shared by workers
+        - Backpressure: at most pool_size + queue_size simulations in flight,
+          further requests get 429 with a Retry-After header
+        - Timeouts: requests waiting longer than timeout_seconds get 504
+        - Cancellation: queued work is cancelled when the client disconnects
+          (a simulation already running in a worker finishes and is discarded)
+        - Progress: with a progress callback, fn gets a progress argument;
+          each payload it reports is delivered to the callback on the event
+          loop (through a queue and a dispatcher thread for worker processes),
+          all of them before run returns
+        - Crashed workers: when a worker process dies the pool is broken; it
+          is replaced by a new one (warmed in the background) and the
+          affected requests get 503
+        - Failed warmup (timeout, spawn error): the error is kept in
+          warmup_error, the pool is replaced and warmup retried with
+          exponential backoff until it succeeds
+        - pool_size = 0 runs simulations in a thread instead (development/tests)
+
+    Methods:
+        - start: Create the worker pool
+        - warmup: Start every worker and wait until its kernels are compiled
+        - start_warmup: Run warmup in the background
+        - run: Execute a function in the pool and await its result
+        - shutdown: Stop the worker pool
+        - get_stats: Pool size, capacity and in-flight count
+    """
+
+    WARMUP_RETRY_SECONDS = 5.0  # First delay before retrying a failed warmup
+    WARMUP_RETRY_MAX_SECONDS = 300.0  # Backoff cap
+
+    def __init__(
+        self,
+        pool_size: int,
+        queue_size: int,
+        timeout_seconds: float,
+        retry_after_seconds: int,
+        initializer: Optional[Callable[..., None]] = _initialize_worker
+    ):
+        self.pool_size = pool_size
+        self.queue_size = queue_size
+        self.timeout_seconds = timeout_seconds
+        self.retry_after_seconds = retry_after_seconds
+        self.initializer = initializer
+
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._ready_queue: Optional[Any] = None
+        self._progress_queue: Optional[Any] = None
+        self._progress_thread: Optional[threading.Thread] = None
+        # token -> (event loop, progress callback, done event)
+        self._progress_listeners: Dict[int, tuple] = {}
+        self._tokens = itertools.count()
+        self._started = False
+        self.ready = False
+        self.warmup_error: Optional[str] = None
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._warmup_task: Optional[asyncio.Task] = None
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of simulations running or queued at once"""
+        return max(self.pool_size, 1) + self.queue_size
+
+    def start(self) -> None:
+        """
+        Create the worker pool (no-op if already started)
+
+        Workers are started with the 'spawn' method: forking a process that
+        already runs Numba's threading layer is not safe. With pool_size 0
+        the kernels are warmed on the calling thread instead, so Numba's
+        threading layer is initialized from the main thread.
+        """
+        if self._started:
+            return
+
+        if self.pool_size == 0:
+            if self.initializer:
+                self.initializer(numba.config.NUMBA_NUM_THREADS)
+            self._started = True
+            logger.info("Simulation pool disabled: running simulations in threads")
+            return
+
+        self._started = True
+
+        num_threads = max(1, numba.config.NUMBA_NUM_THREADS // self.pool_size)
+        context = multiprocessing.get_context("spawn")
+        self._ready_queue = context.Queue() if self.initializer else None
+        self._progress_queue = context.Queue()
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.pool_size,
+            mp_context=context,
+            initializer=_initialize_process,
+            initargs=(
+                self._progress_queue,
+                self.initializer,
+                *((num_threads, self._ready_queue) if self.initializer else ())
+            )
+        )
+        self._progress_thread = threading.Thread(
+            target=self._dispatch_progress, args=(self._progress_queue,), daemon=True
+        )
+        self._progress_thread.start()
+        logger.info(
+            f"Simulation pool started: {self.pool_size} workers x {num_threads} threads, "
+            f"queue size {self.queue_size}"
+        )
+
+    async def warmup(self) -> None:
+        """
+        Start every worker and wait until its kernels are compiled
+
+        The process pool spawns workers lazily, so without this the first
+        requests would wait for worker start-up and JIT compilation (or
+        loading it from the on-disk cache). One no-op task per worker is
+        submitted at once, which makes the pool spawn all workers, then each
+        worker's ready message (sent by the initializer) is awaited.
+        Sets ready when done.
+
+        Raises:
+            RuntimeError: If the workers are not warm within timeout_seconds
+        """
+        start_time = time.time()
+        self.start()
+
+        if self._pool is not None:
+            spawned = [self._pool.submit(_spawn_worker) for _ in range(self.pool_size)]
+            try:
+                # Workers run the no-op only once their initializer has returned
+                await asyncio.wait_for(
+                    asyncio.gather(*(asyncio.wrap_future(f) for f in spawned)),
+                    timeout=self.timeout_seconds
+                )
+            except asyncio.TimeoutError:
+                raise RuntimeError(
+                    f"Simulation workers not started after {self.timeout_seconds:g} seconds"
+                )
+
+            if self._ready_queue is not None:
+                loop = asyncio.get_running_loop()
+                pids = set()
+                while len(pids) < self.pool_size:
+                    remaining = self.timeout_seconds - (time.time() - start_time)
+                    try:
+                        pids.add(await loop.run_in_executor(
+                            None, self._ready_queue.get, True, max(remaining, 0.0)
+                        ))
+                    except queue.Empty:
+                        raise RuntimeError(
+                            f"Simulation workers not ready after {self.timeout_seconds:g} seconds"
+                        )
+            logger.info(
+                f"Simulation workers ready: {self.pool_size} processes "
+                f"warmed in {time.time() - start_time:.1f}s"
+            )
+
+        self.ready = True
+
+    def start_warmup(self) -> None:
+        """
+        Run warmup as a background task on the running event loop
+
+        Returns at once; ready becomes True when the workers are warm, so
+        the application can serve /health (503 meanwhile) during warmup.
+        A failed warmup is retried (see _warmup_in_background).
+        """
+        if self._warmup_task is None or self._warmup_task.done():
+            self._warmup_task = asyncio.get_running_loop().create_task(
+                self._warmup_in_background()
+            )
+
+    def shutdown(self) -> None:
+        """Stop the worker pool, cancelling queued simulations and a running warmup"""
+        self.ready = False
+        self._cancel_warmup()
+        detached = self._detach_pool()
+        if detached is not None:
+            self._stop_pool(*detached)
+
+    def _cancel_warmup(self) -> None:
+        """Cancel a background warmup (its pool is going away)"""
+        if self._warmup_task is None:
+            return
+        if not self._warmup_task.done() and self._ready_queue is not None:
+            self._ready_queue.put(None)  # Wakes a warmup waiting for ready messages
+        self._warmup_task.cancel()
+        self._warmup_task = None
+
+    def _detach_pool(self) -> Optional[tuple]:
+        """
+        Take the worker pool out of service (start creates a new one)
+
+        Returns:
+            (pool, progress queue, dispatcher thread) to pass to _stop_pool,
+            or None if there is no pool
+        """
+        self._started = False
+        if self._pool is None:
+            return None
+        detached = (self._pool, self._progress_queue, self._progress_thread)
+        self._pool = None
+        self._ready_queue = None
+        self._progress_queue = None
+        self._progress_thread = None
+        return detached
+
+    @staticmethod
+    def _stop_pool(pool: ProcessPoolExecutor, progress_queue: Any, progress_thread: threading.Thread) -> None:
+        """Stop a detached pool and its dispatcher thread (blocking: waits for the workers)"""
+        try:
+            pool.shutdown(wait=True, cancel_futures=True)
+            progress_queue.put(None)  # Stops the dispatcher thread
+            progress_thread.join()
+            logger.info("Simulation pool stopped")
+        except Exception as e:
+            logger.error(f"Simulation pool shutdown failed: {e}")
+
+    async def run(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None,
+        timeout_seconds: Optional[float] = None,
+        progress: Optional[Callable[[Any], None]] = None
+    ) -> Any:
+        """
+        Run fn(*args) in the pool without blocking the event loop
+
+        Args:
+            fn: Picklable function to execute
+            *args: Picklable arguments
+            is_disconnected: Optional coroutine function (e.g. Request.is_disconnected)
+                polled while waiting; the work is cancelled if it returns True
+            timeout_seconds: Override of the default per-request timeout
+            progress: Optional callback, called on the event loop with every
+                payload fn reports; fn is then called as fn(*args, progress=...)
+                and must accept that keyword (payloads must be picklable)
+
+        Returns:
+            Result of fn(*args)
+
+        Raises:
+            HTTPException 429: If the pool and its queue are full
+            HTTPException 504: If the simulation exceeds the timeout
+            HTTPException 499: If the client disconnected while waiting
+            HTTPException 503: If the worker running the simulation died
+        """
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail="Simulation capacity reached. Please retry shortly.",
+                    headers={"Retry-After": str(self.retry_after_seconds)}
+                )
+            self._in_flight += 1
+
+        loop = asyncio.get_running_loop()
+        done_event = None
+        token = None
+        future = None
+        try:
+            if progress is None:
+                future = self._submit(fn, *args)
+            elif self.pool_size == 0:
+                # Callbacks are scheduled before the result, so all arrive first
+                future = self._submit(functools.partial(
+                    fn, progress=lambda payload: loop.call_soon_threadsafe(progress, payload)
+                ), *args)
+            else:
+                token = next(self._tokens)
+                done_event = asyncio.Event()
+                self._progress_listeners[token] = (loop, progress, done_event)
+                future = self._submit(_run_with_progress, token, fn, *args)
+        finally:
+            if future is None:
+                # Submit failed: the done callback will never free the slot
+                self._release(None)
+                if token is not None:
+                    self._progress_listeners.pop(token, None)
+        pool = self._pool
+        future.add_done_callback(self._release)
+        waiter = asyncio.wrap_future(future)
+
+        timeout = self.timeout_seconds if timeout_seconds is None else timeout_seconds
+        deadline = loop.time() + timeout
+
+        try:
+            while True:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise HTTPException(
+                        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                        detail=f"Simulation exceeded the {timeout:g} second time limit"
+                    )
+
+                poll_interval = remaining if is_disconnected is None else min(remaining, 0.5)
+                done, _ = await asyncio.wait({waiter}, timeout=poll_interval)
+                if done:
+                    try:
+                        result = waiter.result()
+                    except BrokenProcessPool:
+                        # A worker died (e.g. out of memory): replace the pool
+                        self._rebuild_pool(pool)
+                        raise HTTPException(
+                            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                            detail="Simulation worker stopped unexpectedly. Please retry shortly.",
+                            headers={"Retry-After": str(self.retry_after_seconds)}
+                        )
+                    if done_event is not None:
+                        # Results and progress travel separately: wait for the last message
+                        await asyncio.wait_for(done_event.wait(), timeout=max(remaining, 1.0))
+                    return result
+
+                if is_disconnected is not None and await is_disconnected():
+                    raise HTTPException(
+                        status_code=499,
+                        detail="Client closed request"
+                    )
+        except BaseException:
+            # Timeout, disconnect or task cancellation: drop queued work
+            future.cancel()
+            raise
+        finally:
+            if token is not None:
+                self._progress_listeners.pop(token, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get executor statistics
+
+        Returns:
+            Dictionary with pool_size, capacity, in_flight, ready and
+            warmup_error (last failed warmup, None once warm)
+        """
+        return {
+            "pool_size": self.pool_size,
+            "capacity": self.capacity,
+            "in_flight": self._in_flight,
+            "ready": self.ready,
+            "warmup_error": self.warmup_error
+        }
+
+    def _submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """Submit work to the process pool, or to a thread when pool_size is 0"""
+        self.start()
+        if self.pool_size == 0:
+            future: Future = Future()
+
+            def _run_in_thread():
+                if not future.set_running_or_notify_cancel():
+                    return
+                try:
+                    future.set_result(fn(*args))
+                except BaseException as e:
+                    future.set_exception(e)
+
+            threading.Thread(target=_run_in_thread, daemon=True).start()
+            return future
+
+        try:
+            return self._pool.submit(fn, *args)
+        except BrokenProcessPool:
+            self._rebuild_pool(self._pool)
+            return self._pool.submit(fn, *args)
+
+    def _rebuild_pool(self, broken: Optional[ProcessPoolExecutor]) -> None:
+        """
+        Replace a broken worker pool and warm the new workers in the background
+
+        A ProcessPoolExecutor whose worker died rejects all further work, so
+        a new pool is swapped in at once and the broken one is stopped in a
+        thread (stopping waits for the workers and the dispatcher thread,
+        which must not stall the event loop). Only the pool that broke is
+        replaced: requests failing on the same pool do not restart it twice.
+
+        Args:
+            broken: Pool the failed work was submitted to
+        """
+        if broken is None or self._pool is not broken:
+            return  # Already replaced or stopped
+
+        logger.error("Simulation worker pool broken (worker process died): restarting workers")
+        self.ready = False
+        self._cancel_warmup()
+        detached = self._detach_pool()
+        self.start()
+        asyncio.get_running_loop().run_in_executor(None, self._stop_pool, *detached)
+        self.start_warmup()
+
+    async def _warmup_in_background(self) -> None:
+        """
+        Background task: warmup, retried until it succeeds
+
+        After a failure the error is kept in warmup_error (reported by
+        /health), the pool, whose workers may be stuck or dead, is stopped
+        off the event loop, and warmup runs again on a new pool after
+        WARMUP_RETRY_SECONDS, doubling up to WARMUP_RETRY_MAX_SECONDS.
+        """
+        loop = asyncio.get_running_loop()
+        delay = self.WARMUP_RETRY_SECONDS
+        while True:
+            try:
+                await self.warmup()
+                self.warmup_error = None
+                return
+            except Exception as e:
+                self.warmup_error = str(e) or type(e).__name__
+                logger.error(f"Simulation worker warmup failed, retrying in {delay:g}s: {self.warmup_error}")
+
+            detached = self._detach_pool()
+            if detached is not None:
+                await loop.run_in_executor(None, self._stop_pool, *detached)
+            await asyncio.sleep(delay)
+            delay = min(2 * delay, self.WARMUP_RETRY_MAX_SECONDS)
+
+    def _dispatch_progress(self, progress_queue: Any) -> None:
+        """Dispatcher thread: hand progress messages from workers to their event loops"""
+        while True:
+            message = progress_queue.get()
+            if message is None:
+                return
+            token, payload = message
+            listener = self._progress_listeners.get(token)
+            if listener is None:
+                continue  # Caller gone (timeout, disconnect)
+            loop, progress, done_event = listener
+            try:
+                if payload == _PROGRESS_DONE:
+                    loop.call_soon_threadsafe(done_event.set)
+                else:
+                    loop.call_soon_threadsafe(progress, payload)
+            except RuntimeError:
+                pass  # Event loop closed
+
+    def _release(self, _future: Future) -> None:
+        """Done callback: free a capacity slot once the work has finished"""
+        with self._lock:
+            self._in_flight -= 1
+
+
+# Global executor instance
+simulation_executor = SimulationExecutor(
+    pool_size=settings.SIMULATION_POOL_SIZE,
+    queue_size=settings.SIMULATION_QUEUE_SIZE,
+    timeout_seconds=settings.SIMULATION_TIMEOUT_SECONDS,
+    retry_after_seconds=settings.SIMULATION_RETRY_AFTER_SECONDS
+)
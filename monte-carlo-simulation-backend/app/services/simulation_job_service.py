@@ -0,0 +1,444 @@
+"""
+Simulation Job Service
+Asynchronous simulation jobs: submission, local worker queue, result retrieval
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.api_key import ApiKey
+from app.models.simulation_job import SimulationJob
+from app.schemas.simulation import SimulationRequest, SimulationJobResponse
+from app.services.monte_carlo import MonteCarloService
+from app.services.result_cache import SimulationResultCache
+from app.utils.serialization import to_jsonable
+
+logger = logging.getLogger(__name__)
+
+
+class SimulationJobService:
+    """
+    Simulation job service for long-running simulations
+
+    Business Rules:
+        - Jobs are visible only to the user who submitted them
+        - Results are kept for SIMULATION_JOB_RETENTION_HOURS, then purged
+        - Submission is rejected (429) when the local job queue is full
+
+    Methods:
+        - create_job: Persist a pending job and enqueue it
+        - get_job: Retrieve a job owned by the user
+        - purge_expired_jobs: Delete jobs past their retention window
+        - to_response: Convert a job to SimulationJobResponse
+    """
+
+    @staticmethod
+    async def create_job(
+        request: SimulationRequest,
+        api_key: ApiKey,
+        db: AsyncSession
+    ) -> SimulationJob:
+        """
+        Create a pending simulation job and hand it to the worker queue
+
+        Args:
+            request: Simulation request with portfolio and parameters
+            api_key: Validated API key of the caller
+            db: Database session
+
+        Returns:
+            Created SimulationJob (status 'pending')
+
+        Raises:
+            HTTPException 429: If the job queue is full
+        """
+        # Reserved before the commit: concurrent submissions cannot overfill the queue
+        simulation_job_queue.reserve_slot()
+        try:
+            created_at = datetime.now(timezone.utc)
+            job = SimulationJob(
+                id=f"sim_{uuid.uuid4().hex[:12]}",
+                user_id=api_key.user_id,
+                api_key=api_key.key,
+                status='pending',
+                request_payload=request.model_dump(mode="json"),
+                created_at=created_at,
+                expires_at=created_at + timedelta(hours=settings.SIMULATION_JOB_RETENTION_HOURS)
+            )
+
+            db.add(job)
+            await db.commit()
+        except BaseException:
+            simulation_job_queue.release_slot()
+            raise
+
+        simulation_job_queue.enqueue(job.id)
+        return job
+
+    @staticmethod
+    async def get_job(simulation_id: str, user_id: int, db: AsyncSession) -> SimulationJob:
+        """
+        Retrieve a simulation job owned by the user
+
+        Args:
+            simulation_id: Job identifier
+            user_id: User ID (for authorization)
+            db: Database session
+
+        Returns:
+            SimulationJob
+
+        Raises:
+            HTTPException 404: If the job does not exist, has expired,
+                or belongs to another user
+        """
+        job = await db.get(SimulationJob, simulation_id)
+
+        if not job or job.user_id != user_id or job.is_expired:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Simulation {simulation_id} not found"
+            )
+
+        return job
+
+    @staticmethod
+    async def purge_expired_jobs(db: AsyncSession) -> int:
+        """
+        Delete jobs past their retention window
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of deleted jobs
+        """
+        stmt = delete(SimulationJob).where(
+            SimulationJob.expires_at < datetime.now(timezone.utc)
+        )
+        result = await db.execute(stmt)
+        await db.commit()
+        return result.rowcount
+
+    @staticmethod
+    def to_response(job: SimulationJob) -> SimulationJobResponse:
+        """
+        Convert a job to its API response
+
+        Args:
+            job: SimulationJob
+
+        Returns:
+            SimulationJobResponse
+        """
+        return SimulationJobResponse(
+            simulation_id=job.id,
+            status=job.status,
+            created_at=job.created_at,
+            started_at=job.started_at,
+            completed_at=job.completed_at,
+            expires_at=job.expires_at,
+            execution_time_seconds=job.execution_time_seconds,
+            results=job.results,
+            error_message=job.error_message
+        )
+
+
+class SimulationJobQueue:
+    """
+    In-process job queue drained by background worker tasks
+
+    Each worker takes a job id from the queue, claims the job (pending ->
+    running) and loads its request, runs the simulation in the simulation
+    worker pool without holding a database connection, then stores the
+    outcome in a new session. A separate task purges expired jobs and fails
+    stale running jobs periodically.
+
+    The queue only lives in memory, so jobs are recovered from the database:
+        - On start, unexpired 'pending' jobs are queued again (several
+          application processes may queue the same job; the claim makes
+          sure it runs once)
+        - A job runs for at most SIMULATION_JOB_TIMEOUT_SECONDS (waits for a
+          free worker included), so a 'running' job started longer ago than
+          that (plus STALE_GRACE_SECONDS) was interrupted by a restart or a
+          crash and is marked failed, on start and by the purge task. Jobs
+          running in sibling processes are never touched
+        - The outcome is written only while the job is still 'running', so a
+          job failed as stale keeps its status
+
+    Methods:
+        - start: Start recovery, worker and purge tasks (application startup)
+        - stop: Cancel background tasks (application shutdown)
+        - reserve_slot: Reserve room for a job, raise 429 if the queue is full
+        - release_slot: Give back a reservation (job not created)
+        - enqueue: Add a job id to the queue (uses the reservation)
+    """
+
+    PURGE_INTERVAL_SECONDS = 900  # Purge expired jobs every 15 minutes
+    STALE_GRACE_SECONDS = 60  # Margin over the job timeout before a running job is stale
+    INTERRUPTED_MESSAGE = "Simulation interrupted by a server restart. Please resubmit."
+
+    def __init__(
+        self,
+        num_workers: int,
+        max_size: int,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal
+    ):
+        self.num_workers = num_workers
+        self.max_size = max_size
+        self.session_factory = session_factory
+        self._queue: Optional[asyncio.Queue] = None
+        self._reserved = 0
+        self._tasks: List[asyncio.Task] = []
+
+    def start(self) -> None:
+        """Start recovery, worker and purge tasks on the running event loop"""
+        if self._tasks:
+            return
+
+        # Unbounded: max_size is enforced on submission (reserve_slot), so
+        # recovered jobs never block and reserved slots are always available
+        self._queue = asyncio.Queue()
+        self._reserved = 0
+        self._tasks = [asyncio.create_task(self._recover_jobs(), name="simulation-job-recovery")]
+        self._tasks += [
+            asyncio.create_task(self._worker(), name=f"simulation-job-worker-{i}")
+            for i in range(self.num_workers)
+        ]
+        self._tasks.append(asyncio.create_task(self._purge_loop(), name="simulation-job-purge"))
+        logger.info(f"Simulation job queue started: {self.num_workers} workers")
+
+    async def stop(self) -> None:
+        """Cancel background tasks (queued jobs stay 'pending' and are recovered on the next start)"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info("Simulation job queue stopped")
+
+    def reserve_slot(self) -> None:
+        """
+        Reserve room in the queue for a job about to be created
+
+        Checked and taken in one step (no await in between), so concurrent
+        submissions cannot all pass the check. The reservation is used by
+        enqueue, or given back with release_slot.
+
+        Raises:
+            HTTPException 503: If the queue is not running
+            HTTPException 429: If the queue is full
+        """
+        if self._queue is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Simulation job queue is not running"
+            )
+        if self._queue.qsize() + self._reserved >= self.max_size:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many pending simulation jobs. Please retry shortly.",
+                headers={"Retry-After": str(settings.SIMULATION_RETRY_AFTER_SECONDS)}
+            )
+        self._reserved += 1
+
+    def release_slot(self) -> None:
+        """Give back a reservation whose job was not created"""
+        self._reserved = max(self._reserved - 1, 0)
+
+    def enqueue(self, job_id: str) -> None:
+        """
+        Add a job id to the queue, using a reservation made by reserve_slot
+
+        Args:
+            job_id: SimulationJob id
+        """
+        self.release_slot()
+        self._queue.put_nowait(job_id)
+
+    async def _recover_jobs(self) -> None:
+        """
+        Pick up the jobs left over by the previous run of the application
+
+        Stale 'running' jobs are marked failed (fail_stale_jobs); unexpired
+        'pending' jobs are queued again, oldest first.
+        """
+        try:
+            await self.fail_stale_jobs()
+            async with self.session_factory() as db:
+                pending = await db.execute(
+                    select(SimulationJob.id)
+                    .where(
+                        SimulationJob.status == 'pending',
+                        SimulationJob.expires_at > datetime.now(timezone.utc)
+                    )
+                    .order_by(SimulationJob.created_at)
+                )
+                job_ids = pending.scalars().all()
+        except Exception as e:
+            logger.error(f"Simulation job recovery failed: {e}")
+            return
+
+        if job_ids:
+            logger.info(f"Recovered simulation jobs: {len(job_ids)} pending requeued")
+        for job_id in job_ids:
+            self._queue.put_nowait(job_id)
+
+    async def fail_stale_jobs(self) -> int:
+        """
+        Mark failed the running jobs that outlived the job timeout
+
+        A job started more than SIMULATION_JOB_TIMEOUT_SECONDS +
+        STALE_GRACE_SECONDS ago cannot still be running in any process.
+
+        Returns:
+            Number of jobs marked failed
+        """
+        now = datetime.now(timezone.utc)
+        cutoff = now - timedelta(
+            seconds=settings.SIMULATION_JOB_TIMEOUT_SECONDS + self.STALE_GRACE_SECONDS
+        )
+        async with self.session_factory() as db:
+            stale = await db.execute(
+                update(SimulationJob)
+                .where(SimulationJob.status == 'running', SimulationJob.started_at < cutoff)
+                .values(status='failed', error_message=self.INTERRUPTED_MESSAGE, completed_at=now)
+            )
+            await db.commit()
+        if stale.rowcount:
+            logger.warning(f"Marked {stale.rowcount} interrupted simulation jobs failed")
+        return stale.rowcount
+
+    async def _worker(self) -> None:
+        """Run queued jobs one at a time until cancelled"""
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run_job(job_id)
+            except Exception as e:
+                logger.error(f"Simulation job {job_id} could not be processed: {e}", exc_info=True)
+            finally:
+                self._queue.task_done()
+
+    async def _run_job(self, job_id: str) -> None:
+        """
+        Run a single job and persist its outcome
+
+        No database connection is held while the simulation runs: the job is
+        claimed in one session and its outcome written in another.
+
+        Args:
+            job_id: SimulationJob id
+        """
+        async with self.session_factory() as db:
+            # Claim the job atomically: it may be queued twice (submission
+            # and recovery) or by several application processes
+            claimed = await db.execute(
+                update(SimulationJob)
+                .where(SimulationJob.id == job_id, SimulationJob.status == 'pending')
+                .values(status='running', started_at=datetime.now(timezone.utc))
+                .returning(SimulationJob.request_payload)
+            )
+            request_payload = claimed.scalar_one_or_none()
+            await db.commit()
+        if request_payload is None:
+            return
+
+        start_time = time.time()
+        outcome = {}
+        try:
+            request = SimulationRequest.model_validate(request_payload)
+            results = await self._simulate(request)
+            outcome.update(status='completed', results=to_jsonable(results))
+        except HTTPException as e:
+            outcome.update(status='failed', error_message=str(e.detail))
+        except Exception as e:
+            outcome.update(status='failed', error_message=f"Simulation failed: {str(e)}")
+
+        async with self.session_factory() as db:
+            stored = await db.execute(
+                update(SimulationJob)
+                .where(SimulationJob.id == job_id, SimulationJob.status == 'running')
+                .values(
+                    **outcome,
+                    execution_time_seconds=time.time() - start_time,
+                    completed_at=datetime.now(timezone.utc)
+                )
+            )
+            await db.commit()
+        if stored.rowcount == 0:
+            logger.warning(f"Simulation job {job_id} was no longer running; outcome discarded")
+
+    async def _simulate(self, request: SimulationRequest) -> dict:
+        """
+        Run the simulation in the worker pool, waiting while the pool is saturated
+
+        The whole job, waits included, is bounded by SIMULATION_JOB_TIMEOUT_SECONDS
+        (what fail_stale_jobs relies on).
+
+        Args:
+            request: Simulation request
+
+        Returns:
+            Simulation results
+
+        Raises:
+            HTTPException 504: If the job timeout is exceeded
+        """
+        deadline = time.monotonic() + settings.SIMULATION_JOB_TIMEOUT_SECONDS
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise HTTPException(
+                    status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                    detail=(
+                        f"Simulation job exceeded the "
+                        f"{settings.SIMULATION_JOB_TIMEOUT_SECONDS:g} second time limit"
+                    )
+                )
+            try:
+                return await MonteCarloService.run_simulation(request, timeout_seconds=remaining)
+            except HTTPException as e:
+                if e.status_code != status.HTTP_429_TOO_MANY_REQUESTS:
+                    raise
+                await asyncio.sleep(min(settings.SIMULATION_RETRY_AFTER_SECONDS, remaining))
+
+    async def _purge_loop(self) -> None:
+        """Periodically fail stale jobs, delete expired jobs (and shared cache entries) until cancelled"""
+        while True:
+            try:
+                await self.fail_stale_jobs()
+            except Exception as e:
+                logger.error(f"Stale simulation job check failed: {e}")
+            try:
+                async with self.session_factory() as db:
+                    deleted = await SimulationJobService.purge_expired_jobs(db)
+                if deleted:
+                    logger.info(f"Purged {deleted} expired simulation jobs")
+            except Exception as e:
+                logger.error(f"Simulation job purge failed: {e}")
+            if settings.RESULT_CACHE_SHARED_ENABLED:
+                try:
+                    async with self.session_factory() as db:
+                        deleted = await SimulationResultCache.purge_expired(db)
+                    if deleted:
+                        logger.info(f"Purged {deleted} expired cached simulation results")
+                except Exception as e:
+                    logger.error(f"Result cache purge failed: {e}")
+            await asyncio.sleep(self.PURGE_INTERVAL_SECONDS)
+
+
+# Global job queue instance
+simulation_job_queue = SimulationJobQueue(
+    num_workers=settings.SIMULATION_JOB_WORKERS,
+    max_size=settings.SIMULATION_JOB_QUEUE_SIZE
+)
@@ -0,0 +1,311 @@
+"""
+Simulation Statistics Engine
+Quantiles from a single partition, everything else from one fused Numba pass
+
+Expectation-type metrics (mean, probabilities, CVaR) are estimated as means
+of per-path functionals, which makes their standard errors and variance
+reduction uniform:
+    - Antithetic pairs: functionals are averaged per pair (group_size=2)
+      and the pair means treated as the independent samples
+    - Control variate: each functional f is regressed on a control C with
+      known mean μ_C: f̂ = mean(f) - β(mean(C) - μ_C), β = cov(f, C) / var(C).
+      When C is the value itself (adjust_mean=False) the mean is left
+      unadjusted: regressed on itself it would just return μ_C with no error
+"""
+
+from typing import Optional
+
+import numpy as np
+from numba import njit
+
+
+# Reported percentiles (p1 and p5 double as VaR 99% / VaR 95%)
+PERCENTILES = (1, 5, 10, 25, 50, 75, 90, 95, 99)
+
+# Per-path functionals accumulated by fused_statistics (column indices)
+_VALUE, _LOSS, _POSITIVE, _DOUBLING, _TAIL_95, _TAIL_99, _CONTROL = range(7)
+_NUM_FUNCTIONALS = 7
+
+
+@njit(cache=True)
+def fused_statistics(
+    values: np.ndarray,
+    controls: np.ndarray,
+    initial_investment: float,
+    var_95: float,
+    var_99: float,
+    value_shift: float,
+    control_shift: float,
+    group_size: int
+) -> tuple:
+    """
+    Moments, tail sums and probabilities in one pass (Numba-compiled)
+
+    Accumulates sums, sums of squares and cross-products with the control
+    of the group-averaged functionals: value, loss / positive / doubling
+    indicators, tail excesses min(X - VaR, 0) for 95% and 99%, and the
+    control. Values and controls are shifted (by the median and the control
+    mean) first, which keeps the sums of squares well conditioned for large,
+    tightly clustered portfolio values.
+
+    Args:
+        values: Terminal portfolio values, length divisible by group_size
+        controls: Control variate per path (empty array for none)
+        initial_investment: Threshold for loss / positive return / doubling
+        var_95: 5th percentile
+        var_99: 1st percentile
+        value_shift: Subtracted from values before accumulation
+        control_shift: Subtracted from controls before accumulation
+        group_size: Paths per independent group (2 for antithetic pairs)
+
+    Returns:
+        Tuple of (min, max, tail_95_count, tail_99_count, path_sum_squares,
+        sums, squares, cross) where path_sum_squares is the per-path sum of
+        squared shifted values and sums/squares/cross have one entry per
+        functional (cross = sum of products with the control)
+    """
+    n = values.shape[0]
+    has_control = controls.shape[0] > 0
+    doubling_threshold = initial_investment * 2
+    inv_group_size = 1.0 / group_size
+
+    min_value = np.inf
+    max_value = -np.inf
+    tail_95_count = 0
+    tail_99_count = 0
+    path_sum_squares = 0.0
+
+    sums = np.zeros(_NUM_FUNCTIONALS)
+    squares = np.zeros(_NUM_FUNCTIONALS)
+    cross = np.zeros(_NUM_FUNCTIONALS)
+    group = np.zeros(_NUM_FUNCTIONALS)
+
+    for g in range(n // group_size):
+        group[:] = 0.0
+        for j in range(group_size):
+            i = g * group_size + j
+            x = values[i]
+            shifted = x - value_shift
+
+            if x < min_value:
+                min_value = x
+            if x > max_value:
+                max_value = x
+            path_sum_squares += shifted * shifted
+
+            group[_VALUE] += shifted
+            if x < initial_investment:
+                group[_LOSS] += 1.0
+            elif x > initial_investment:
+                group[_POSITIVE] += 1.0
+            if x >= doubling_threshold:
+                group[_DOUBLING] += 1.0
+            if x <= var_95:
+                group[_TAIL_95] += x - var_95
+                tail_95_count += 1
+                if x <= var_99:
+                    group[_TAIL_99] += x - var_99
+                    tail_99_count += 1
+            if has_control:
+                group[_CONTROL] += controls[i] - control_shift
+
+        control = group[_CONTROL] * inv_group_size
+        for k in range(_NUM_FUNCTIONALS):
+            mean_k = group[k] * inv_group_size
+            sums[k] += mean_k
+            squares[k] += mean_k * mean_k
+            cross[k] += mean_k * control
+
+    return (
+        min_value,
+        max_value,
+        tail_95_count,
+        tail_99_count,
+        path_sum_squares,
+        sums,
+        squares,
+        cross
+    )
+
+
+def _order_statistic_indices(n: int, q: float) -> tuple:
+    """Ranks bracketing quantile q by ±1 binomial standard deviation"""
+    spread = np.sqrt(n * q * (1 - q))
+    lower = int(np.clip(np.floor(n * q - spread), 0, n - 1))
+    upper = int(np.clip(np.ceil(n * q + spread), 0, n - 1))
+    return lower, upper
+
+
+def _summarize_block(
+    values: np.ndarray,
+    initial_investment: float,
+    group_size: int = 1,
+    controls: Optional[np.ndarray] = None,
+    control_mean: Optional[float] = None,
+    adjust_mean: bool = True
+) -> dict:
+    """
+    Statistics and (independent-sample) standard errors of one block of values
+
+    See summarize for arguments and returned keys.
+    """
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    n = values.shape[0]
+
+    # Single partition for every order statistic
+    positions = (n - 1) * np.asarray(PERCENTILES) / 100.0
+    below = np.floor(positions).astype(np.int64)
+    above = np.minimum(below + 1, n - 1)
+    se_95 = _order_statistic_indices(n, 0.05)
+    se_99 = _order_statistic_indices(n, 0.01)
+    kth = np.unique(np.concatenate([below, above, se_95, se_99]))
+    ordered = np.partition(values, kth)
+
+    fraction = positions - below
+    quantiles = ordered[below] + (ordered[above] - ordered[below]) * fraction
+    percentiles = {f"p{p}": float(q) for p, q in zip(PERCENTILES, quantiles)}
+    var_95 = percentiles['p5']
+    var_99 = percentiles['p1']
+
+    if controls is None:
+        controls = np.empty(0)
+        control_shift = 0.0
+    else:
+        controls = np.ascontiguousarray(controls, dtype=np.float64)
+        control_shift = float(control_mean)
+
+    value_shift = percentiles['p50']
+    (
+        min_value,
+        max_value,
+        tail_95_count,
+        tail_99_count,
+        path_sum_squares,
+        sums,
+        squares,
+        cross
+    ) = fused_statistics(
+        values, controls, float(initial_investment), var_95, var_99,
+        value_shift, control_shift, group_size
+    )
+
+    # Per-path standard deviation (population, as np.std)
+    path_mean = sums[_VALUE] * group_size / n
+    std_deviation = np.sqrt(max(path_sum_squares / n - path_mean**2, 0.0))
+
+    # Estimates and standard errors of the functionals (over independent groups)
+    num_groups = n // group_size
+    means = sums / num_groups
+    m2 = squares - sums * means
+    co_moment = cross - sums * means[_CONTROL]
+    variance = m2 / max(num_groups - 1, 1)
+    estimates = means.copy()
+    if controls.shape[0] > 0 and m2[_CONTROL] > 0:
+        # Shifted control has known mean 0
+        beta = co_moment / m2[_CONTROL]
+        plain_variance = variance
+        estimates -= beta * means[_CONTROL]
+        variance = (m2 - beta * co_moment) / max(num_groups - 2, 1)
+        if not adjust_mean:
+            estimates[_VALUE] = means[_VALUE]
+            variance[_VALUE] = plain_variance[_VALUE]
+    errors = np.sqrt(np.maximum(variance, 0.0) / num_groups)
+    estimates[_VALUE] += value_shift
+
+    # CVaR = VaR + E[min(X - VaR, 0)] / P(X <= VaR)
+    tail_95 = tail_95_count / n
+    tail_99 = tail_99_count / n
+
+    def probability(k: int) -> float:
+        return float(np.clip(estimates[k], 0.0, 1.0))
+
+    return {
+        'mean': float(estimates[_VALUE]),
+        'median': percentiles['p50'],
+        'std_deviation': float(std_deviation),
+        'min': float(min_value),
+        'max': float(max_value),
+        'percentiles': percentiles,
+        'var_95': var_95,
+        'var_99': var_99,
+        'cvar_95': float(var_95 + estimates[_TAIL_95] / tail_95),
+        'cvar_99': float(var_99 + estimates[_TAIL_99] / tail_99),
+        'probability_of_loss': probability(_LOSS),
+        'probability_of_positive_return': probability(_POSITIVE),
+        'probability_of_doubling': probability(_DOUBLING),
+        'standard_errors': {
+            'mean': float(errors[_VALUE]),
+            'var_95': float(ordered[se_95[1]] - ordered[se_95[0]]) / 2,
+            'var_99': float(ordered[se_99[1]] - ordered[se_99[0]]) / 2,
+            'cvar_95': float(errors[_TAIL_95] / tail_95),
+            'cvar_99': float(errors[_TAIL_99] / tail_99),
+            'probability_of_loss': float(errors[_LOSS]),
+            'probability_of_positive_return': float(errors[_POSITIVE]),
+            'probability_of_doubling': float(errors[_DOUBLING])
+        }
+    }
+
+
+def summarize(
+    values: np.ndarray,
+    initial_investment: float,
+    group_size: int = 1,
+    controls: Optional[np.ndarray] = None,
+    control_mean: Optional[float] = None,
+    replicates: int = 1,
+    adjust_mean: bool = True
+) -> dict:
+    """
+    Compute all distribution statistics of terminal values
+
+    One np.partition call places every order statistic needed (linear
+    interpolation points of all percentiles, plus the ranks bracketing
+    VaR 95/99 for their standard errors); fused_statistics covers the rest.
+
+    With replicates > 1 (randomized QMC), values are consecutive blocks of
+    independently randomized points: estimates use all values, and each
+    standard error is the spread of the per-block estimates / sqrt(blocks).
+
+    Args:
+        values: Terminal portfolio values
+        initial_investment: Initial investment amount
+        group_size: Paths per independent group (2 for antithetic pairs)
+        controls: Optional control variate per path (with control_mean)
+        control_mean: Known expectation of the control variate
+        replicates: Number of independently randomized blocks
+        adjust_mean: Apply the control variate to the mean (False when the
+            control is the value itself)
+
+    Returns:
+        Dictionary with mean, median, std_deviation, min, max, percentiles
+        (p1..p99), var_95, var_99, cvar_95, cvar_99, probabilities and
+        standard_errors (of the estimated metrics)
+    """
+    stats = _summarize_block(
+        values, initial_investment, group_size, controls, control_mean, adjust_mean
+    )
+    if replicates <= 1:
+        return stats
+
+    value_blocks = np.array_split(values, replicates)
+    control_blocks = (
+        np.array_split(controls, replicates) if controls is not None
+        else [None] * replicates
+    )
+    blocks = [
+        _summarize_block(
+            block, initial_investment, group_size, block_controls, control_mean, adjust_mean
+        )
+        for block, block_controls in zip(value_blocks, control_blocks)
+    ]
+    # Floor at the 1/N resolution: in low dimensions the replicate counts of
+    # a probability can coincide exactly, which does not mean zero error
+    resolution = 1.0 / len(values)
+    stats['standard_errors'] = {
+        metric: max(
+            float(np.std([block[metric] for block in blocks], ddof=1) / np.sqrt(replicates)),
+            resolution if metric.startswith('probability') else 0.0
+        )
+        for metric in stats['standard_errors']
+    }
+    return stats
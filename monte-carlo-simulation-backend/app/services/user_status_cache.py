@@ -0,0 +1,139 @@
+"""
+User Status Cache
+In-process TTL cache of users authenticated by JWT
+"""
+
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from sqlalchemy import event
+
+from app.config import settings
+from app.models.user import User
+
+
+class UserStatusCache:
+    """
+    Cache of users looked up by get_current_user (JWT authentication)
+
+    Business Rules:
+        - A user loaded for a JWT request is cached for ttl_seconds; requests
+          within the TTL skip the database lookup, the status check still
+          runs on the cached copy
+        - Updates and deletes of a User through the ORM invalidate the entry
+          at once in this process (mapper events); other application
+          processes see a status change within ttl_seconds. Bulk UPDATE
+          statements bypass the events and must call invalidate
+        - Cached copies are detached and carry no password hash
+        - At most max_entries users are kept (least recently used evicted)
+
+    Methods:
+        - get: Cached user for an ID (None on miss or TTL elapsed)
+        - put: Cache a user loaded from the database
+        - invalidate: Drop a user (status or profile changed)
+        - clear: Drop all users
+        - get_stats: Hit/miss counters
+    """
+
+    def __init__(self, enabled: bool, ttl_seconds: float, max_entries: int):
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        # user id -> (detached User, monotonic time cached), least recently used first
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: int) -> Optional[User]:
+        """
+        Look up a cached user
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Detached User, or None on miss (not cached, TTL elapsed)
+        """
+        entry = self._entries.get(user_id)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        user, cached_at = entry
+        if time.monotonic() - cached_at > self.ttl_seconds:
+            del self._entries[user_id]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        return user
+
+    def put(self, user: User) -> User:
+        """
+        Cache a user loaded from the database
+
+        Args:
+            user: User (attached to a session)
+
+        Returns:
+            Detached copy of the user, safe to share between requests
+        """
+        snapshot = User(
+            id=user.id,
+            email=user.email,
+            full_name=user.full_name,
+            company=user.company,
+            status=user.status,
+            created_at=user.created_at,
+            last_login_at=user.last_login_at
+        )
+        if not self.enabled:
+            return snapshot
+
+        self._entries[user.id] = (snapshot, time.monotonic())
+        self._entries.move_to_end(user.id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return snapshot
+
+    def invalidate(self, user_id: int) -> None:
+        """
+        Drop a user from the cache (status or profile changed, deleted)
+
+        Args:
+            user_id: User ID
+        """
+        self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        """Drop all cached users"""
+        self._entries.clear()
+
+    def get_stats(self) -> Dict:
+        """Cache counters"""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+
+# Global cache (one per application process)
+user_status_cache = UserStatusCache(
+    enabled=settings.USER_CACHE_ENABLED,
+    ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+    max_entries=settings.USER_CACHE_MAX_ENTRIES
+)
+
+
+# ============================================
+# Invalidation Hooks
+# ============================================
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_changed_user(mapper, connection, target: User) -> None:
+    """Drop a user from the cache when its row is updated or deleted"""
+    user_status_cache.invalidate(target.id)
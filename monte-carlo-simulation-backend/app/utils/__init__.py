@@ -16,6 +16,13 @@ from app.utils.validators import (
     validate_api_key_format
 )
 
+from app.utils.serialization import (
+    to_jsonable,
+    from_jsonable,
+    packb,
+    unpackb
+)
+
 __all__ = [
     # Security functions
     'hash_password',
@@ -26,4 +33,9 @@ __all__ = [
     # Validators
     'validate_email',
     'validate_api_key_format',
+    # Serialization
+    'to_jsonable',
+    'from_jsonable',
+    'packb',
+    'unpackb',
 ]
@@ -0,0 +1,178 @@
+"""
+Serialization Utilities
+JSON and MessagePack encodings of simulation results
+
+Simulation results carry their bulk data as NumPy arrays (sample_paths:
+float64 matrix, terminal_distribution: float32 vector). The JSON form keeps
+sample_paths as nested lists and sends terminal_distribution as a base64
+buffer; MessagePack sends both as raw binary buffers, written straight from
+the array memory (no per-float Python objects).
+
+Buffer format (both encodings):
+    {"dtype": "<f4", "shape": [n], "data": <bytes, base64 in JSON>}
+"""
+
+import base64
+from typing import Any, Dict, Optional
+
+import msgpack
+import numpy as np
+
+
+# ============================================
+# Media Types
+# ============================================
+MSGPACK_MEDIA_TYPE = "application/x-msgpack"
+_MSGPACK_MEDIA_TYPES = (MSGPACK_MEDIA_TYPE, "application/msgpack", "application/vnd.msgpack")
+
+# Result fields holding NumPy arrays
+ARRAY_FIELDS = ('sample_paths', 'terminal_distribution')
+
+# Array fields sent as base64 buffers in JSON (the others as nested lists)
+JSON_BUFFER_FIELDS = ('terminal_distribution',)
+
+
+def accepts_msgpack(accept: Optional[str]) -> bool:
+    """
+    Check whether an Accept header asks for MessagePack
+
+    Args:
+        accept: Accept header value (None if absent)
+
+    Returns:
+        True if a MessagePack media type is listed
+
+    Example:
+        >>> accepts_msgpack("application/x-msgpack, application/json;q=0.5")
+        True
+        >>> accepts_msgpack("*/*")
+        False
+    """
+    if not accept:
+        return False
+    media_types = [part.split(";")[0].strip().lower() for part in accept.split(",")]
+    return any(media_type in _MSGPACK_MEDIA_TYPES for media_type in media_types)
+
+
+# ============================================
+# Buffers
+# ============================================
+def encode_buffer(array: np.ndarray, base64_data: bool = True) -> Dict[str, Any]:
+    """
+    Describe an array as a little-endian binary buffer
+
+    Args:
+        array: NumPy array
+        base64_data: Encode the data as a base64 string (JSON); otherwise
+            a memoryview of the array (MessagePack bin, no copy)
+
+    Returns:
+        Dictionary with dtype, shape and data
+    """
+    little_endian = np.ascontiguousarray(array, dtype=array.dtype.newbyteorder("<"))
+    data = memoryview(little_endian).cast("B")
+    return {
+        "dtype": little_endian.dtype.str,
+        "shape": list(little_endian.shape),
+        "data": base64.b64encode(data).decode("ascii") if base64_data else data
+    }
+
+
+def decode_buffer(buffer: Dict[str, Any]) -> np.ndarray:
+    """
+    Rebuild an array from encode_buffer output
+
+    Args:
+        buffer: Dictionary with dtype, shape and data (base64 string or bytes)
+
+    Returns:
+        NumPy array (read-only view of the data)
+    """
+    data = buffer["data"]
+    if isinstance(data, str):
+        data = base64.b64decode(data)
+    return np.frombuffer(data, dtype=np.dtype(buffer["dtype"])).reshape(buffer["shape"])
+
+
+# ============================================
+# Simulation Results
+# ============================================
+def to_jsonable(results: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    JSON form of simulation results (API responses, database storage)
+
+    Args:
+        results: Simulation results with NumPy array fields
+
+    Returns:
+        Shallow copy with sample_paths as nested lists and
+        terminal_distribution as a base64 buffer
+    """
+    jsonable = dict(results)
+    for field in ARRAY_FIELDS:
+        value = jsonable.get(field)
+        if isinstance(value, np.ndarray):
+            jsonable[field] = encode_buffer(value) if field in JSON_BUFFER_FIELDS else value.tolist()
+    return jsonable
+
+
+def from_jsonable(results: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Simulation results with NumPy array fields, from their JSON form
+
+    Args:
+        results: Results as returned by to_jsonable
+
+    Returns:
+        Shallow copy with sample_paths and terminal_distribution as arrays
+    """
+    restored = dict(results)
+    sample_paths = restored.get('sample_paths')
+    if isinstance(sample_paths, list):
+        restored['sample_paths'] = (
+            np.array(sample_paths, dtype=np.float64) if sample_paths else np.empty((0, 0))
+        )
+    distribution = restored.get('terminal_distribution')
+    if isinstance(distribution, dict):
+        restored['terminal_distribution'] = decode_buffer(distribution)
+    return restored
+
+
+def packb(payload: Dict[str, Any]) -> bytes:
+    """
+    Encode a response payload as MessagePack
+
+    NumPy arrays (anywhere in the payload) become binary buffers.
+
+    Args:
+        payload: JSON-like dictionary, possibly containing NumPy arrays
+
+    Returns:
+        MessagePack bytes
+    """
+    def default(value: Any) -> Any:
+        if isinstance(value, np.ndarray):
+            return encode_buffer(value, base64_data=False)
+        if isinstance(value, np.generic):
+            return value.item()
+        raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+    return msgpack.packb(payload, default=default)
+
+
+def unpackb(data: bytes) -> Dict[str, Any]:
+    """
+    Decode a MessagePack payload produced by packb
+
+    Args:
+        data: MessagePack bytes
+
+    Returns:
+        Dictionary with binary buffers rebuilt as NumPy arrays
+    """
+    def object_hook(value: Dict[str, Any]) -> Any:
+        if value.keys() == {"dtype", "shape", "data"} and isinstance(value["data"], bytes):
+            return decode_buffer(value)
+        return value
+
+    return msgpack.unpackb(data, object_hook=object_hook)
@@ -0,0 +1,4 @@
+"""
+Performance Benchmarks
+Standalone scripts: python -m benchmarks.<name>
+"""
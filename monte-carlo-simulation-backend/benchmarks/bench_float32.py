@@ -0,0 +1,64 @@
+"""
+Single-Precision Benchmark
+Compare the float64 and float32 daily-step kernels: time and percentile drift
+
+The float32 kernel must keep every reported percentile within
+MonteCarloService.FLOAT32_PERCENTILE_TOLERANCE (relative) of the float64
+kernel for the same seed; the script exits non-zero otherwise.
+
+Usage:
+    python -m benchmarks.bench_float32 [num_paths]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from app.services import statistics
+from app.services.monte_carlo import MonteCarloService
+
+
+HORIZONS = (1, 5, 10, 30, 50)
+
+
+def timed(fn, *args) -> tuple:
+    """Result and wall-clock time of one call, in milliseconds"""
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main(num_paths: int = 100_000) -> int:
+    S0, mu, sigma, dt, seed = 1_000_000.0, 0.10, 0.18, 1/252, 42
+    # JIT compile / load cache (same argument pattern as the timed calls)
+    MonteCarloService.simulate_gbm_terminal_values(S0, mu, sigma, 1, dt, 2, 0, seed)
+    MonteCarloService.simulate_gbm_terminal_values_f32(S0, mu, sigma, 1, dt, 2, 0, seed)
+
+    tolerance = MonteCarloService.FLOAT32_PERCENTILE_TOLERANCE
+    worst = 0.0
+    print(f"paths: {num_paths:,}   bound: {tolerance:.0e}")
+    print(f"{'years':>5}  {'float64 ms':>10}  {'float32 ms':>10}  {'speedup':>7}  {'max drift':>9}")
+    for T in HORIZONS:
+        (double, _), double_ms = timed(
+            MonteCarloService.simulate_gbm_terminal_values, S0, mu, sigma, T, dt, num_paths, 0, seed
+        )
+        (single, _), single_ms = timed(
+            MonteCarloService.simulate_gbm_terminal_values_f32, S0, mu, sigma, T, dt, num_paths, 0, seed
+        )
+        double_percentiles = statistics.summarize(double, S0)['percentiles']
+        single_percentiles = statistics.summarize(single.astype(np.float64), S0)['percentiles']
+        drift = max(
+            abs(single_percentiles[key] / value - 1)
+            for key, value in double_percentiles.items()
+        )
+        worst = max(worst, drift)
+        print(f"{T:>5}  {double_ms:>10.1f}  {single_ms:>10.1f}  "
+              f"{double_ms / single_ms:>6.2f}x  {drift:>9.1e}")
+
+    print("within bound" if worst < tolerance else "BOUND EXCEEDED")
+    return 0 if worst < tolerance else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000))
@@ -0,0 +1,97 @@
+"""
+Path Kernel Benchmark
+Compare the previous per-step GBM kernels with the bulk-normal kernels
+
+Previous kernels draw one Box-Muller normal per step (discarding the sine
+output) and, for full paths, exponentiate and multiply step by step. The
+current kernels fill blocks of paired normals, sum or cumulative-sum the
+log-returns and exponentiate once per recorded point (or once per path).
+
+Usage:
+    python -m benchmarks.bench_paths
+"""
+
+import time
+
+import numpy as np
+from numba import njit, prange
+
+from app.services.monte_carlo import MonteCarloService
+from app.services.rng import path_stream, standard_normal
+
+
+PATH_COUNTS = (1_000, 10_000, 50_000)
+HORIZONS = (1, 10, 30)
+
+# Full path matrices above this many elements are skipped (memory)
+MAX_MATRIX_ELEMENTS = 40_000_000
+
+
+@njit(parallel=True)
+def legacy_paths(S0, mu, sigma, T, dt, num_paths, seed):
+    """Previous simulate_gbm_paths: exp and multiply per step"""
+    num_steps = int(T / dt)
+    paths = np.zeros((num_paths, num_steps + 1))
+    paths[:, 0] = S0
+    drift = (mu - 0.5 * sigma**2) * dt
+    vol = sigma * np.sqrt(dt)
+    for i in prange(num_paths):
+        key, sign = path_stream(seed, i, False)
+        for t in range(1, num_steps + 1):
+            Z = sign * standard_normal(key, t - 1)
+            paths[i, t] = paths[i, t-1] * np.exp(drift + vol * Z)
+    return paths
+
+
+@njit(parallel=True)
+def legacy_terminal_values(S0, mu, sigma, T, dt, num_paths, seed):
+    """Previous simulate_gbm_terminal_values: one normal per step"""
+    num_steps = int(T / dt)
+    final_values = np.empty(num_paths)
+    drift = (mu - 0.5 * sigma**2) * dt
+    vol = sigma * np.sqrt(dt)
+    for i in prange(num_paths):
+        key, sign = path_stream(seed, i, False)
+        log_return = 0.0
+        for t in range(1, num_steps + 1):
+            log_return += drift + sign * vol * standard_normal(key, t - 1)
+        final_values[i] = S0 * np.exp(log_return)
+    return final_values
+
+
+def timed_ms(fn, *args) -> float:
+    """Wall-clock time of one call, in milliseconds"""
+    start = time.perf_counter()
+    fn(*args)
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    S0, mu, sigma, dt, seed = 1_000_000.0, 0.10, 0.18, 1/252, 42
+
+    # JIT compile / load cache (same argument pattern as the timed calls)
+    MonteCarloService.simulate_gbm_terminal_values(S0, mu, sigma, 1, dt, 2, 0, seed)
+    MonteCarloService.simulate_gbm_paths(S0, mu, sigma, 1, dt, 2, seed)
+    legacy_paths(S0, mu, sigma, 1, dt, 2, seed)
+    legacy_terminal_values(S0, mu, sigma, 1, dt, 2, seed)
+
+    print(f"{'kernel':<9} {'paths':>7} {'years':>5}  {'legacy ms':>10}  {'bulk ms':>9}  {'speedup':>7}")
+    for num_paths in PATH_COUNTS:
+        for T in HORIZONS:
+            legacy_ms = timed_ms(legacy_terminal_values, S0, mu, sigma, T, dt, num_paths, seed)
+            bulk_ms = timed_ms(
+                MonteCarloService.simulate_gbm_terminal_values, S0, mu, sigma, T, dt, num_paths, 0, seed
+            )
+            print(f"{'terminal':<9} {num_paths:>7,} {T:>5}  {legacy_ms:>10.1f}  {bulk_ms:>9.1f}  "
+                  f"{legacy_ms / bulk_ms:>6.2f}x")
+
+            if num_paths * (int(T / dt) + 1) > MAX_MATRIX_ELEMENTS:
+                continue
+            legacy_ms = timed_ms(legacy_paths, S0, mu, sigma, T, dt, num_paths, seed)
+            bulk_ms = timed_ms(MonteCarloService.simulate_gbm_paths, S0, mu, sigma, T, dt, num_paths, seed)
+            print(f"{'paths':<9} {num_paths:>7,} {T:>5}  {legacy_ms:>10.1f}  {bulk_ms:>9.1f}  "
+                  f"{legacy_ms / bulk_ms:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
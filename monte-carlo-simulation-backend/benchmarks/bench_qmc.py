@@ -0,0 +1,63 @@
+"""
+Quasi-Monte Carlo Benchmark
+Root-mean-square error of Monte Carlo vs QMC estimates against closed-form GBM values
+
+Usage:
+    python -m benchmarks.bench_qmc [num_seeds]
+"""
+
+import sys
+
+import numpy as np
+from scipy.stats import norm
+
+from app.services.monte_carlo import MonteCarloService
+from app.services import statistics
+
+
+S0, MU, SIGMA, T = 1_000_000.0, 0.096, 0.128, 10
+
+
+def exact_metrics() -> dict:
+    """Closed-form mean, 5th percentile and P(loss) of GBM terminal value"""
+    m = (MU - 0.5 * SIGMA**2) * T
+    s = SIGMA * np.sqrt(T)
+    return {
+        'mean': S0 * np.exp(MU * T),
+        'var_95': S0 * np.exp(m + s * norm.ppf(0.05)),
+        'probability_of_loss': norm.cdf(-m / s)
+    }
+
+
+def rmse(engine: str, num_paths: int, num_seeds: int) -> dict:
+    """RMSE of each metric over num_seeds seeds"""
+    exact = exact_metrics()
+    errors = {metric: [] for metric in exact}
+    for seed in range(num_seeds):
+        if engine == "qmc":
+            values, _ = MonteCarloService.simulate_gbm_terminal_qmc(
+                S0, MU, SIGMA, T, 1/252, num_paths, 0, seed
+            )
+        else:
+            values = MonteCarloService.simulate_gbm_terminal_exact(
+                S0, MU, SIGMA, T, num_paths, seed, antithetic=False
+            )
+        stats = statistics.summarize(values, S0)
+        for metric in exact:
+            errors[metric].append(stats[metric] - exact[metric])
+    return {metric: float(np.sqrt(np.mean(np.square(e)))) for metric, e in errors.items()}
+
+
+def main(num_seeds: int = 50) -> None:
+    print(f"{'paths':>8} {'engine':>6} {'mean':>10} {'var_95':>10} {'P(loss)':>10}")
+    for num_paths in (1_000, 10_000, 100_000):
+        for engine in ("exact", "qmc"):
+            errors = rmse(engine, num_paths, num_seeds)
+            print(
+                f"{num_paths:>8,} {engine:>6} {errors['mean']:>10.1f} "
+                f"{errors['var_95']:>10.1f} {errors['probability_of_loss']:>10.5f}"
+            )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
@@ -0,0 +1,67 @@
+"""
+Statistics Benchmark
+Compare the legacy per-metric NumPy statistics with the single-pass engine
+
+Usage:
+    python -m benchmarks.bench_statistics [num_values]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from app.services import statistics
+
+
+def legacy_statistics(final_values: np.ndarray, initial_investment: float) -> dict:
+    """Previous implementation: one np.percentile call (partition) per metric"""
+    percentiles = {
+        f"p{p}": float(np.percentile(final_values, p))
+        for p in statistics.PERCENTILES
+    }
+    var_95 = float(np.percentile(final_values, 5))
+    var_99 = float(np.percentile(final_values, 1))
+    return {
+        'mean': float(np.mean(final_values)),
+        'median': float(np.median(final_values)),
+        'std_deviation': float(np.std(final_values)),
+        'min': float(np.min(final_values)),
+        'max': float(np.max(final_values)),
+        'percentiles': percentiles,
+        'var_95': var_95,
+        'var_99': var_99,
+        'cvar_95': float(np.mean(final_values[final_values <= var_95])),
+        'cvar_99': float(np.mean(final_values[final_values <= var_99])),
+        'probability_of_loss': float(np.mean(final_values < initial_investment)),
+        'probability_of_positive_return': float(np.mean(final_values > initial_investment)),
+        'probability_of_doubling': float(np.mean(final_values >= initial_investment * 2))
+    }
+
+
+def best_time(fn, *args, repeats: int = 20) -> float:
+    """Best wall-clock time of repeated calls, in milliseconds"""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main(num_values: int = 100_000) -> None:
+    initial_investment = 1_000_000.0
+    values = np.random.default_rng(0).lognormal(np.log(initial_investment), 0.4, num_values)
+
+    statistics.summarize(values, initial_investment)  # JIT compile / load cache
+
+    legacy_ms = best_time(legacy_statistics, values, initial_investment)
+    fused_ms = best_time(statistics.summarize, values, initial_investment)
+
+    print(f"values:  {num_values:,}")
+    print(f"legacy:  {legacy_ms:8.2f} ms")
+    print(f"fused:   {fused_ms:8.2f} ms  ({legacy_ms / fused_ms:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,214 @@
+"""
+API Call Logger Tests
+Test buffering, batched inserts and draining of API call logs (no database required)
+"""
+
+import asyncio
+
+from app.services.api_call_logger import ApiCallLogger
+
+
+class RecordingDatabase:
+    """Stand-in session factory recording inserted batches"""
+
+    def __init__(self, failures: int = 0, poisoned: float = None):
+        self.failures = failures
+        # Any insert containing the row with this execution time fails
+        self.poisoned = poisoned
+        self.batches = []
+        self.statements_per_commit = []
+
+    def __call__(self):
+        return RecordingSession(self)
+
+
+class RecordingSession:
+    """Stand-in AsyncSession (async context manager)"""
+
+    def __init__(self, database: RecordingDatabase):
+        self.database = database
+        self.executed = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def execute(self, statement, parameters=None):
+        if self.database.failures > 0:
+            self.database.failures -= 1
+            raise RuntimeError("database unavailable")
+        if parameters and any(row["execution_time_ms"] == self.database.poisoned for row in parameters):
+            raise RuntimeError("invalid row")
+        self.executed.append((statement, parameters))
+
+    async def commit(self):
+        # Log rows are the parameters of the multi-row INSERT (first statement)
+        self.database.batches.append(self.executed[0][1])
+        self.database.statements_per_commit.append(len(self.executed))
+
+
+def make_logger(database: RecordingDatabase, **overrides) -> ApiCallLogger:
+    """Build a logger writing to a recording database"""
+    options = dict(
+        max_queue_size=100,
+        batch_size=10,
+        flush_interval_seconds=60.0,
+        drain_timeout_seconds=5.0,
+        session_factory=database
+    )
+    options.update(overrides)
+    return ApiCallLogger(**options)
+
+
+def log_calls(logger: ApiCallLogger, count: int) -> None:
+    """Buffer count successful calls"""
+    for i in range(count):
+        logger.log(
+            user_id=1,
+            api_key="mk_live_test",
+            endpoint="/api/v1/simulate",
+            method="POST",
+            status_code=200,
+            execution_time_ms=float(i)
+        )
+
+
+# ============================================================================
+# BUFFERING TESTS
+# ============================================================================
+
+def test_flush_inserts_in_batches():
+    """
+    Test buffered rows are written as batch_size multi-row inserts
+
+    Expected:
+    - 25 rows become batches of 10, 10 and 5, in logging order
+    - Each batch commits together with its usage rollup upsert
+    - Counters report everything written
+    """
+    database = RecordingDatabase()
+    logger = make_logger(database)
+    log_calls(logger, 25)
+
+    written = asyncio.run(logger.flush())
+
+    assert written == 25
+    assert [len(batch) for batch in database.batches] == [10, 10, 5]
+    assert [row["execution_time_ms"] for row in database.batches[0]] == list(range(10))
+    assert database.statements_per_commit == [2, 2, 2]
+    assert logger.get_stats()["queued"] == 0
+    assert logger.get_stats()["written"] == 25
+
+
+def test_full_buffer_drops_new_rows():
+    """
+    Test the bounded buffer
+
+    Expected:
+    - Rows beyond max_queue_size are dropped and counted
+    """
+    logger = make_logger(RecordingDatabase(), max_queue_size=5)
+
+    log_calls(logger, 8)
+
+    stats = logger.get_stats()
+    assert stats["queued"] == 5
+    assert stats["enqueued"] == 5
+    assert stats["dropped"] == 3
+
+
+def test_failed_insert_keeps_rows_for_retry():
+    """
+    Test a failed batch is retried by the next flush
+
+    Expected:
+    - First flush writes nothing and keeps all rows
+    - Second flush writes them in the original order
+    """
+    database = RecordingDatabase(failures=1)
+    logger = make_logger(database)
+    log_calls(logger, 15)
+
+    assert asyncio.run(logger.flush()) == 0
+    assert logger.get_stats()["queued"] == 15
+    assert logger.get_stats()["failed_batches"] == 1
+
+    assert asyncio.run(logger.flush()) == 15
+    assert [row["execution_time_ms"] for row in database.batches[0]] == list(range(10))
+
+
+def test_poisoned_row_is_dropped_after_retries():
+    """
+    Test a batch that keeps failing does not stall the pipeline
+
+    Expected:
+    - The failing batch is retried max_batch_attempts times
+    - Then its good rows are written one by one and the bad row is dropped
+    - Later batches are written
+    """
+    database = RecordingDatabase(poisoned=3.0)
+    logger = make_logger(database, max_batch_attempts=2)
+    log_calls(logger, 15)
+
+    assert asyncio.run(logger.flush()) == 0
+    assert asyncio.run(logger.flush()) == 14
+
+    stats = logger.get_stats()
+    assert (stats["queued"], stats["written"], stats["dropped"]) == (0, 14, 1)
+    assert stats["failed_batches"] == 2
+    written = [row["execution_time_ms"] for batch in database.batches for row in batch]
+    assert sorted(written) == [float(i) for i in range(15) if i != 3]
+
+
+# ============================================================================
+# WRITER TASK TESTS
+# ============================================================================
+
+def test_writer_flushes_on_size_and_drains_on_stop():
+    """
+    Test the background writer
+
+    Expected:
+    - A full batch is written without waiting for the flush interval
+    - Rows still buffered at shutdown are written by stop()
+    """
+    database = RecordingDatabase()
+    logger = make_logger(database)
+
+    async def scenario():
+        logger.start()
+        log_calls(logger, 10)
+        await asyncio.sleep(0.05)
+        written_before_stop = sum(len(batch) for batch in database.batches)
+        log_calls(logger, 3)
+        await logger.stop()
+        return written_before_stop
+
+    assert asyncio.run(scenario()) == 10
+    assert [len(batch) for batch in database.batches] == [10, 3]
+    assert logger.get_stats()["queued"] == 0
+
+
+def test_rows_left_after_final_flush_are_counted_dropped():
+    """
+    Test rows the shutdown drain cannot write are not lost silently
+
+    Expected:
+    - With the database down, stop() counts the buffered rows as dropped
+    - Nothing is left queued
+    """
+    database = RecordingDatabase(failures=100)
+    logger = make_logger(database)
+
+    async def scenario():
+        logger.start()
+        log_calls(logger, 3)
+        await logger.stop()
+
+    asyncio.run(scenario())
+
+    stats = logger.get_stats()
+    assert (stats["queued"], stats["written"], stats["dropped"]) == (0, 0, 3)
+    assert database.batches == []
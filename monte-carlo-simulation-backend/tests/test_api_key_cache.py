@@ -0,0 +1,184 @@
+"""
+API Key Cache Tests
+Test cached validation and batched last_used_at writes (no database required)
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+from app.models.api_key import ApiKey
+from app.services.api_key_cache import ApiKeyCache
+from app.services.api_key_service import ApiKeyService
+
+
+def make_cache(ttl_seconds: float = 60.0, max_entries: int = 100) -> ApiKeyCache:
+    """Build an enabled cache"""
+    return ApiKeyCache(
+        enabled=True,
+        ttl_seconds=ttl_seconds,
+        max_entries=max_entries,
+        flush_interval_seconds=30.0
+    )
+
+
+def make_key(key_id: int = 1, expires_in_days: float = 30) -> ApiKey:
+    """Build an active ApiKey"""
+    now = datetime.now(timezone.utc)
+    return ApiKey(
+        id=key_id,
+        user_id=10,
+        key=f"mk_live_{key_id:024d}",
+        name="test",
+        status="active",
+        created_at=now,
+        expires_at=now + timedelta(days=expires_in_days)
+    )
+
+
+class RecordingSession:
+    """Stand-in AsyncSession recording executed statements"""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.executed = []
+        self.commits = 0
+
+    async def execute(self, statement, parameters=None):
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        self.executed.append((statement, parameters))
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        pass
+
+
+# ============================================================================
+# VALIDATED KEY TESTS
+# ============================================================================
+
+def test_cached_key_is_served_until_ttl():
+    """
+    Test hits within the TTL and a miss afterwards
+
+    Expected:
+    - Detached copy returned on hit
+    - Entry dropped once the TTL has elapsed
+    """
+    cache = make_cache(ttl_seconds=0.05)
+    key = make_key()
+
+    snapshot = cache.put(key)
+
+    assert cache.get(key.key) is snapshot
+    assert snapshot is not key and snapshot.user_id == key.user_id
+    time.sleep(0.1)
+    assert cache.get(key.key) is None
+    assert cache.get_stats()["hits"] == 1
+
+
+def test_invalidate_and_expiry():
+    """
+    Test revoked and expired keys are not served
+
+    Expected:
+    - Invalidated key misses
+    - Key past expires_at misses even within the TTL
+    """
+    cache = make_cache()
+    revoked = make_key(1)
+    expired = make_key(2, expires_in_days=-1)
+
+    cache.put(revoked)
+    cache.put(expired)
+    cache.invalidate(revoked.key)
+
+    assert cache.get(revoked.key) is None
+    assert cache.get(expired.key) is None
+
+
+def test_evicts_least_recently_used():
+    """
+    Test max_entries bound
+
+    Expected:
+    - Oldest unread key evicted, recently read key kept
+    """
+    cache = make_cache(max_entries=2)
+    keys = [make_key(i) for i in range(3)]
+
+    cache.put(keys[0])
+    cache.put(keys[1])
+    cache.get(keys[0].key)
+    cache.put(keys[2])
+
+    assert cache.get(keys[0].key) is not None
+    assert cache.get(keys[1].key) is None
+    assert cache.get(keys[2].key) is not None
+
+
+def test_validate_api_key_hit_skips_database(monkeypatch):
+    """
+    Test a cached key is validated without the database
+
+    Expected:
+    - Cached key returned, session never used
+    - Use recorded for the next flush
+    """
+    cache = make_cache()
+    monkeypatch.setattr("app.services.api_key_service.api_key_cache", cache)
+    snapshot = cache.put(make_key())
+
+    result = asyncio.run(ApiKeyService.validate_api_key(snapshot.key, db=None))
+
+    assert result is snapshot
+    assert result.last_used_at is not None
+    assert cache.get_stats()["pending_last_used"] == 1
+
+
+# ============================================================================
+# WRITE-BEHIND TESTS
+# ============================================================================
+
+def test_flush_coalesces_uses_into_one_update():
+    """
+    Test repeated uses become one row per key in a single statement
+
+    Expected:
+    - One execute with one parameter set per key (latest use), one commit
+    - Nothing pending afterwards
+    """
+    cache = make_cache()
+    first, second = make_key(1), make_key(2)
+    for _ in range(5):
+        cache.record_use(first)
+    cache.record_use(second)
+    session = RecordingSession()
+
+    flushed = asyncio.run(cache.flush(session))
+
+    assert flushed == 2
+    assert len(session.executed) == 1 and session.commits == 1
+    parameters = session.executed[0][1]
+    assert {row["id"]: row["last_used_at"] for row in parameters} == {
+        1: first.last_used_at,
+        2: second.last_used_at
+    }
+    assert asyncio.run(cache.flush(session)) == 0
+
+
+def test_failed_flush_keeps_pending_uses():
+    """
+    Test a failed write is retried by the next flush
+
+    Expected:
+    - Nothing reported flushed, updates still pending
+    """
+    cache = make_cache()
+    cache.record_use(make_key())
+
+    assert asyncio.run(cache.flush(RecordingSession(fail=True))) == 0
+    assert cache.get_stats()["pending_last_used"] == 1
@@ -0,0 +1,163 @@
+"""
+API Usage Service Tests
+Test hourly usage rollups and partition maintenance (no database required)
+"""
+
+import asyncio
+from datetime import date, datetime, timezone
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services.api_usage_service import ApiUsageService
+
+
+def make_row(minute: int, user_id: int = 1, api_key: str = "mk_live_a", status_code: int = 200,
+             execution_time_ms=40.0, hour: int = 9) -> dict:
+    """Build an API call log row (ApiCallLogger format)"""
+    return {
+        "user_id": user_id,
+        "api_key": api_key,
+        "endpoint": "/api/v1/simulate",
+        "method": "POST",
+        "status_code": status_code,
+        "execution_time_ms": execution_time_ms,
+        "error_message": None,
+        "request_payload_hash": None,
+        "created_at": datetime(2026, 10, 18, hour, minute, tzinfo=timezone.utc)
+    }
+
+
+class PartitionSession:
+    """Stand-in AsyncSession listing existing partitions and recording DDL"""
+
+    def __init__(self, partitions):
+        self.partitions = partitions
+        self.statements = []
+        self.commits = 0
+
+    async def execute(self, statement, parameters=None):
+        sql = str(statement)
+        if "pg_inherits" in sql:
+            return PartitionResult(self.partitions)
+        self.statements.append(sql)
+
+    async def commit(self):
+        self.commits += 1
+
+
+class PartitionResult:
+    """Result rows of the partition listing"""
+
+    def __init__(self, partitions):
+        self.partitions = partitions
+
+    def all(self):
+        return [(name,) for name in self.partitions]
+
+
+# ============================================================================
+# ROLLUP TESTS
+# ============================================================================
+
+def test_rollup_rows_groups_by_hour_user_and_key():
+    """
+    Test aggregation of a batch of log rows
+
+    Expected:
+    - One rollup per (hour, user, key), sorted
+    - Status classes counted, untimed calls counted but not in the histogram
+    """
+    rows = [
+        make_row(5, execution_time_ms=3.0),
+        make_row(10, status_code=422, execution_time_ms=40.0),
+        make_row(20, status_code=500, execution_time_ms=None),
+        make_row(30, api_key="mk_live_b", execution_time_ms=200000.0),
+        make_row(15, hour=10, execution_time_ms=5.0)
+    ]
+
+    rollups = ApiUsageService.rollup_rows(rows)
+
+    assert [(r["bucket_start"].hour, r["api_key"]) for r in rollups] == [
+        (9, "mk_live_a"), (9, "mk_live_b"), (10, "mk_live_a")
+    ]
+    first = rollups[0]
+    assert (first["call_count"], first["success_count"]) == (3, 1)
+    assert (first["client_error_count"], first["server_error_count"]) == (1, 1)
+    assert first["total_execution_time_ms"] == 43.0
+    assert first["max_execution_time_ms"] == 40.0
+    assert first["latency_histogram"][0] == 1 and first["latency_histogram"][3] == 1
+    assert sum(first["latency_histogram"]) == 2
+    assert rollups[1]["latency_histogram"][-1] == 1
+    # Bucket bounds are inclusive upper bounds
+    assert rollups[2]["latency_histogram"][0] == 1
+
+
+def test_percentile_from_histogram():
+    """
+    Test percentile estimates
+
+    Expected:
+    - Linear interpolation within the bucket holding the rank
+    - Overflow bucket bounded by the slowest call
+    - None without timed calls
+    """
+    histogram = [0] * (len(ApiUsageService.LATENCY_BUCKETS_MS) + 1)
+    histogram[4] = 100  # (50, 100] ms
+
+    assert ApiUsageService.percentile(histogram, 50) == pytest.approx(75.0)
+    assert ApiUsageService.percentile(histogram, 99, max_ms=90.0) == pytest.approx(89.6)
+
+    histogram[-1] = 100
+    assert ApiUsageService.percentile(histogram, 100, max_ms=150000.0) == pytest.approx(150000.0)
+    assert ApiUsageService.percentile([0] * len(histogram), 50) is None
+
+
+def test_upsert_adds_to_existing_rollups():
+    """
+    Test the rollup upsert statement
+
+    Expected:
+    - Conflicts on the rollup key add counts and histograms element-wise
+    """
+    statement = ApiUsageService.upsert_statement(ApiUsageService.rollup_rows([make_row(5)]))
+
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+
+    assert "ON CONFLICT (user_id, bucket_start, api_key) DO UPDATE" in sql
+    assert "call_count = (api_usage_hourly.call_count + excluded.call_count)" in sql
+    assert "unnest(api_usage_hourly.latency_histogram, excluded.latency_histogram)" in sql
+
+
+# ============================================================================
+# PARTITION TESTS
+# ============================================================================
+
+def test_maintain_partitions_creates_ahead_and_drops_expired():
+    """
+    Test partition maintenance
+
+    Expected:
+    - Missing months up to months_ahead created with UTC month bounds
+    - Months before the retention window dropped, default partition kept
+    """
+    session = PartitionSession([
+        "api_call_logs_y2026m05", "api_call_logs_y2026m10", "api_call_logs_default"
+    ])
+
+    result = asyncio.run(ApiUsageService.maintain_partitions(
+        session, months_ahead=3, retention_months=3,
+        now=datetime(2026, 10, 18, tzinfo=timezone.utc)
+    ))
+
+    assert result == {
+        "created": ["api_call_logs_y2026m11", "api_call_logs_y2026m12", "api_call_logs_y2027m01"],
+        "dropped": ["api_call_logs_y2026m05"]
+    }
+    assert (
+        "CREATE TABLE IF NOT EXISTS api_call_logs_y2027m01 PARTITION OF api_call_logs "
+        "FOR VALUES FROM ('2027-01-01 00:00:00+00') TO ('2027-02-01 00:00:00+00')"
+    ) in session.statements
+    assert session.commits == 1
+    assert ApiUsageService.partition_month("api_call_logs_default") is None
+    assert ApiUsageService.add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
@@ -4,6 +4,7 @@ Test user registration, login, and JWT token validation
 """
 
 import pytest
+import pytest_asyncio
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.pool import NullPool
@@ -11,6 +12,7 @@ from sqlalchemy.pool import NullPool
 from app.main import app
 from app.database import Base, get_db
 from app.config import settings
+from app.services.user_status_cache import user_status_cache
 
 # Test database URL (use separate test database)
 TEST_DATABASE_URL = settings.DATABASE_URL_ASYNC.replace("monte_carlo_dev", "monte_carlo_test")
@@ -31,13 +33,16 @@ TestSessionLocal = async_sessionmaker(
 
 
 # Fixtures
-@pytest.fixture(scope="function")
+@pytest_asyncio.fixture(scope="function")
 async def db_session():
     """
     Create test database tables and provide a database session
 
     Scope: function - creates fresh database for each test
     """
+    # Fresh tables reuse user IDs: forget users cached by earlier tests
+    user_status_cache.clear()
+
     # Create all tables
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -51,7 +56,7 @@ async def db_session():
         await conn.run_sync(Base.metadata.drop_all)
 
 
-@pytest.fixture(scope="function")
+@pytest_asyncio.fixture(scope="function")
 async def client(db_session):
     """
     Create test client with database dependency override
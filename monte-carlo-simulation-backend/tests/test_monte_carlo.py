@@ -0,0 +1,729 @@
+"""
+Monte Carlo Engine Tests
+Test GBM kernels and simulation results (no database required)
+"""
+
+import asyncio
+
+import numba
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.simulation import SimulationRequest
+from app.services.monte_carlo import MonteCarloService
+from app.services.simulation_executor import simulation_executor
+from app.services import rng
+
+
+# Test Data
+base_request = {
+    "portfolio": {
+        "assets": [
+            {"ticker": "NSEI Index", "weight": 0.6, "asset_class": "equity"},
+            {"ticker": "GIND10YR Index", "weight": 0.4, "asset_class": "bonds"}
+        ]
+    },
+    "parameters": {
+        "initial_investment": 1000000,
+        "monthly_contribution": 0,
+        "time_horizon_years": 5,
+        "num_simulations": 2000
+    }
+}
+
+
+def make_request(**parameters) -> SimulationRequest:
+    """Build a SimulationRequest with overridden parameters"""
+    payload = {
+        "portfolio": base_request["portfolio"],
+        "parameters": {**base_request["parameters"], **parameters}
+    }
+    return SimulationRequest(**payload)
+
+
+# ============================================================================
+# COUNTER-BASED RNG TESTS
+# ============================================================================
+
+def test_rng_streams_are_standard_normal():
+    """
+    Test counter-based normals have zero mean and unit variance
+
+    Expected:
+    - Sample mean ~0 and standard deviation ~1
+    """
+    Z = rng.standard_normals(seed=1, num_streams=200000)
+
+    assert abs(Z.mean()) < 0.01
+    assert abs(Z.std() - 1) < 0.01
+
+
+def test_rng_bulk_normals_do_not_depend_on_blocking():
+    """
+    Test the paired normal sequence is the same for any block split
+
+    Expected:
+    - Block starting at a later pair equals the slice of one long block
+    - Even draws match standard_normal, the sequence is standard normal
+    """
+    key = rng.stream_key(3, 5)
+    whole = np.empty(100001)
+    rng.fill_standard_normals(key, 0, whole)
+    part = np.empty(11)
+    rng.fill_standard_normals(key, 3, part)
+
+    assert np.array_equal(part, whole[6:17])
+    assert whole[4] == rng.standard_normal(key, 2)
+    assert abs(whole.mean()) < 0.01
+    assert abs(whole.std() - 1) < 0.01
+
+
+def test_rng_streams_are_independent_of_thread_count():
+    """
+    Test seeded kernels give identical results for any thread count
+
+    Expected:
+    - Single-threaded and multi-threaded runs are bit-for-bit equal
+    """
+    kwargs = dict(S0=100.0, mu=0.08, sigma=0.15, T=1, dt=1/252,
+                  num_paths=4000, num_sample_paths=2, seed=9)
+
+    default_threads = numba.get_num_threads()
+    numba.set_num_threads(1)
+    try:
+        single, single_samples = MonteCarloService.simulate_gbm_terminal_values(**kwargs)
+    finally:
+        numba.set_num_threads(default_threads)
+    multi, multi_samples = MonteCarloService.simulate_gbm_terminal_values(**kwargs)
+
+    assert np.array_equal(single, multi)
+    assert np.array_equal(single_samples, multi_samples)
+
+
+def test_rng_paths_can_be_sharded():
+    """
+    Test any range of paths can be regenerated independently
+
+    Expected:
+    - Two shards with path offsets equal one combined run
+    - Full-path kernel agrees with the streaming kernel
+    """
+    kwargs = dict(S0=100.0, mu=0.08, sigma=0.15, T=1, dt=1/252, seed=21)
+
+    combined, _ = MonteCarloService.simulate_gbm_terminal_values(num_paths=3000, **kwargs)
+    first, _ = MonteCarloService.simulate_gbm_terminal_values(num_paths=1000, **kwargs)
+    second, _ = MonteCarloService.simulate_gbm_terminal_values(
+        num_paths=2000, path_offset=1000, **kwargs
+    )
+    paths = MonteCarloService.simulate_gbm_paths(num_paths=10, path_offset=1000, **kwargs)
+
+    assert np.array_equal(combined, np.concatenate([first, second]))
+    np.testing.assert_allclose(paths[:, -1], second[:10])
+
+
+# ============================================================================
+# STREAMING KERNEL TESTS
+# ============================================================================
+
+def test_terminal_kernel_shapes():
+    """
+    Test streaming kernel returns terminal values and sample paths only
+
+    Expected:
+    - final_values has one entry per path
+    - sample_paths has num_sample_paths rows and num_steps + 1 columns
+    - sample paths start at S0 and end at their terminal value
+    """
+    final_values, sample_paths = MonteCarloService.simulate_gbm_terminal_values(
+        S0=100.0, mu=0.08, sigma=0.15, T=2, dt=1/252,
+        num_paths=1000, num_sample_paths=3, seed=7
+    )
+
+    assert final_values.shape == (1000,)
+    assert sample_paths.shape == (3, 2 * 252 + 1)
+    assert np.all(sample_paths[:, 0] == 100.0)
+    np.testing.assert_allclose(sample_paths[:, -1], final_values[:3])
+
+
+def test_terminal_kernel_matches_gbm_moments():
+    """
+    Test terminal values follow the GBM distribution
+
+    Expected:
+    - Mean of final values is close to S0 * exp(mu * T)
+    """
+    S0, mu, sigma, T = 100.0, 0.08, 0.15, 3
+    final_values, _ = MonteCarloService.simulate_gbm_terminal_values(
+        S0=S0, mu=mu, sigma=sigma, T=T, dt=1/252,
+        num_paths=20000, num_sample_paths=0, seed=11
+    )
+
+    expected_mean = S0 * np.exp(mu * T)
+    assert abs(final_values.mean() / expected_mean - 1) < 0.01
+
+
+# ============================================================================
+# EXACT ENGINE TESTS
+# ============================================================================
+
+def test_exact_sampling_is_reproducible():
+    """
+    Test exact terminal sampling is bit-for-bit reproducible under a seed
+
+    Expected:
+    - Same seed gives identical arrays
+    - Different seeds give different arrays
+    """
+    kwargs = dict(S0=100.0, mu=0.08, sigma=0.15, T=50, num_paths=5000)
+
+    first = MonteCarloService.simulate_gbm_terminal_exact(seed=3, **kwargs)
+    second = MonteCarloService.simulate_gbm_terminal_exact(seed=3, **kwargs)
+    other = MonteCarloService.simulate_gbm_terminal_exact(seed=4, **kwargs)
+
+    assert np.array_equal(first, second)
+    assert not np.array_equal(first, other)
+
+
+def test_exact_matches_stepped_distribution():
+    """
+    Test exact and stepped engines sample the same terminal distribution
+
+    Expected:
+    - Medians agree within Monte Carlo error
+    """
+    kwargs = dict(S0=100.0, mu=0.08, sigma=0.15, T=2, num_paths=20000)
+
+    exact = MonteCarloService.simulate_gbm_terminal_exact(seed=5, **kwargs)
+    stepped, _ = MonteCarloService.simulate_gbm_terminal_values(
+        dt=1/252, num_sample_paths=0, seed=5, **kwargs
+    )
+
+    assert abs(np.median(exact) / np.median(stepped) - 1) < 0.01
+
+
+def test_auto_engine_uses_exact_without_sample_paths():
+    """
+    Test auto engine selection and seeded reproducibility of simulate
+
+    Expected:
+    - engine is 'exact' and no sample paths are returned
+    - Same seed gives identical statistics
+    """
+    request = make_request(num_sample_paths=0, seed=123)
+
+    first = MonteCarloService.simulate(request)
+    second = MonteCarloService.simulate(request)
+
+    assert first["engine"] == "exact"
+    assert first["sample_paths"].size == 0
+    assert first["final_portfolio_value"] == second["final_portfolio_value"]
+
+
+def test_exact_engine_rejects_sample_paths():
+    """
+    Test exact engine cannot be combined with sample paths
+
+    Expected:
+    - ValidationError when num_sample_paths > 0
+    """
+    with pytest.raises(ValidationError):
+        make_request(engine="exact", num_sample_paths=5)
+
+
+# ============================================================================
+# MULTI-ASSET ENGINE TESTS
+# ============================================================================
+
+def test_multi_asset_matches_analytic_mean():
+    """
+    Test correlated engine reproduces the buy-and-hold expected value
+
+    Expected:
+    - Mean of final values is close to S0 * sum(w_i * exp(mu_i * T))
+    - Sample paths start at S0 and end at their terminal values
+    """
+    request = make_request(model="multi_asset", time_horizon_years=3)
+    weights, mu, cholesky_factor = MonteCarloService._calculate_asset_stats(request)
+
+    final_values, sample_paths = MonteCarloService.simulate_correlated_terminal_values(
+        S0=100.0, weights=weights, mu=mu, cholesky_factor=cholesky_factor,
+        T=3, dt=1/252, num_paths=50000, num_sample_paths=2, seed=17
+    )
+
+    expected_mean = 100.0 * np.sum(weights * np.exp(mu * 3))
+    assert abs(final_values.mean() / expected_mean - 1) < 0.01
+    assert sample_paths.shape == (2, 3 * 252 + 1)
+    assert np.all(sample_paths[:, 0] == 100.0)
+    np.testing.assert_allclose(sample_paths[:, -1], final_values[:2])
+
+
+def test_multi_asset_covariance_factor():
+    """
+    Test the covariance factor reproduces volatilities and correlation
+
+    Expected:
+    - L @ L.T equals D C D for the mock correlation matrix
+    """
+    request = make_request(model="multi_asset")
+    _, _, cholesky_factor = MonteCarloService._calculate_asset_stats(request)
+
+    covariance = cholesky_factor @ cholesky_factor.T
+    np.testing.assert_allclose(np.sqrt(np.diag(covariance)), [0.18, 0.05])
+    np.testing.assert_allclose(covariance[0, 1], -0.2 * 0.18 * 0.05)
+
+
+def test_multi_asset_rejects_stepped_engine():
+    """
+    Test multi-asset model only accepts exact terminal sampling
+
+    Expected:
+    - ValidationError for engine 'stepped'
+    """
+    with pytest.raises(ValidationError):
+        make_request(model="multi_asset", engine="stepped")
+
+
+# ============================================================================
+# VARIANCE REDUCTION TESTS
+# ============================================================================
+
+def test_antithetic_pairs_are_mirrored():
+    """
+    Test antithetic paths use negated normals of their partner
+
+    Expected:
+    - log(S_2k / S0) + log(S_2k+1 / S0) = 2 * drift * T for every pair
+    """
+    T, mu, sigma = 3, 0.08, 0.2
+    exact = MonteCarloService.simulate_gbm_terminal_exact(
+        1.0, mu, sigma, T, 1000, seed=4, antithetic=True
+    )
+    stepped, _ = MonteCarloService.simulate_gbm_terminal_values(
+        1.0, mu, sigma, T, 1/252, 1000, 0, 4, antithetic=True
+    )
+
+    for values in (exact, stepped):
+        pair_sums = np.log(values[0::2]) + np.log(values[1::2])
+        np.testing.assert_allclose(pair_sums, 2 * (mu - 0.5 * sigma**2) * T, atol=1e-9)
+
+
+def test_variance_reduction_lowers_standard_error():
+    """
+    Test antithetic + control variate reach plain precision with half the paths
+
+    Expected:
+    - Standard errors of mean, CVaR 95 and probability of loss at 5,000
+      paths with variance reduction are below plain errors at 10,000 paths
+    """
+    plain = MonteCarloService.simulate(
+        make_request(num_simulations=10000, num_sample_paths=0, seed=1, monthly_contribution=500)
+    )
+    reduced = MonteCarloService.simulate(make_request(
+        num_simulations=5000, num_sample_paths=0, seed=1, monthly_contribution=500,
+        antithetic=True, control_variate=True
+    ))
+
+    assert reduced["variance_reduction"] == {"antithetic": True, "control_variate": True}
+    for metric in ("mean", "cvar_95", "probability_of_loss"):
+        assert reduced["standard_errors"][metric] < plain["standard_errors"][metric], metric
+
+
+def test_control_variate_mean_is_a_monte_carlo_estimate():
+    """
+    Test the control variate reduces, but does not eliminate, the error of the mean
+
+    Expected:
+    - Standard error of the mean is positive and below the plain one
+    - The mean agrees with the analytic mean within sampling error
+    - Adaptive mode keeps sampling when the target is below the achievable error
+    """
+    parameters = dict(num_simulations=20000, num_sample_paths=0, seed=3, engine="exact")
+    plain = MonteCarloService.simulate(make_request(**parameters))
+    controlled = MonteCarloService.simulate(make_request(control_variate=True, **parameters))
+    mu, _ = MonteCarloService._calculate_portfolio_stats(make_request())
+    expected = MonteCarloService._expected_terminal_value(1000000, mu, 5, 0, 252)
+
+    error = controlled["standard_errors"]["mean"]
+    assert 0 < error < 0.5 * plain["standard_errors"]["mean"]
+    assert abs(controlled["final_portfolio_value"]["mean"] - expected) < 4 * error
+
+    adaptive = MonteCarloService.simulate(make_request(
+        control_variate=True, target_relative_error=1e-4, target_metrics=["mean"], **parameters
+    ))
+    assert adaptive["paths_used"] == 20000
+    assert not adaptive["adaptive"]["converged"]
+
+
+def test_control_variate_leaves_mean_unadjusted_with_contributions():
+    """
+    Test the terminal value control does not replace the mean by its analytic value
+
+    Expected:
+    - With contributions, mean and its standard error equal the plain estimate
+    - Probability of loss error still reduced
+    """
+    parameters = dict(num_simulations=10000, num_sample_paths=0, seed=6, monthly_contribution=500)
+    plain = MonteCarloService.simulate(make_request(**parameters))
+    controlled = MonteCarloService.simulate(make_request(control_variate=True, **parameters))
+
+    assert controlled["final_portfolio_value"]["mean"] == pytest.approx(plain["final_portfolio_value"]["mean"])
+    assert controlled["standard_errors"]["mean"] == pytest.approx(plain["standard_errors"]["mean"])
+    assert controlled["standard_errors"]["probability_of_loss"] <= plain["standard_errors"]["probability_of_loss"]
+
+
+def test_antithetic_requires_even_path_count():
+    """
+    Test antithetic validation
+
+    Expected:
+    - Odd num_simulations rejected
+    """
+    with pytest.raises(ValidationError):
+        make_request(num_simulations=1001, antithetic=True)
+
+
+# ============================================================================
+# QUASI-MONTE CARLO ENGINE TESTS
+# ============================================================================
+
+def test_qmc_sample_paths_end_at_terminal_values():
+    """
+    Test QMC sample paths are bridged to the Sobol terminal values
+
+    Expected:
+    - Paths start at S0, have daily length and end at their terminal value
+    """
+    final_values, sample_paths = MonteCarloService.simulate_gbm_terminal_qmc(
+        1000.0, 0.08, 0.2, 2, 1/252, 1000, 3, seed=5
+    )
+
+    assert sample_paths.shape == (3, 2 * 252 + 1)
+    assert np.all(sample_paths[:, 0] == 1000.0)
+    np.testing.assert_allclose(sample_paths[:, -1], final_values[:3])
+    np.testing.assert_allclose(sample_paths[:, -2], final_values[:3], rtol=0.1)
+
+
+def test_qmc_engine_reports_lower_standard_error():
+    """
+    Test QMC engine against pseudo-random exact sampling at the same path count
+
+    Expected:
+    - Mean agrees within a few standard errors
+    - QMC standard errors of mean and VaR are several times smaller
+    """
+    exact = MonteCarloService.simulate(make_request(engine="exact", num_sample_paths=0, seed=2))
+    quasi = MonteCarloService.simulate(make_request(engine="qmc", num_sample_paths=0, seed=2))
+
+    assert quasi["engine"] == "qmc"
+    difference = abs(quasi["final_portfolio_value"]["mean"] - exact["final_portfolio_value"]["mean"])
+    assert difference < 4 * exact["standard_errors"]["mean"]
+    assert quasi["standard_errors"]["mean"] < exact["standard_errors"]["mean"] / 3
+    assert quasi["standard_errors"]["var_95"] < exact["standard_errors"]["var_95"] / 3
+
+
+def test_qmc_rejects_antithetic():
+    """
+    Test QMC validation
+
+    Expected:
+    - engine 'qmc' with antithetic rejected
+    """
+    with pytest.raises(ValidationError):
+        make_request(engine="qmc", antithetic=True)
+
+
+# ============================================================================
+# CONTRIBUTION TESTS
+# ============================================================================
+
+def test_contributions_compound_along_path():
+    """
+    Test deposits compound in the kernel (zero volatility is deterministic)
+
+    Expected:
+    - Terminal values (streamed and recorded paths, float64 and float32)
+      equal S0 exp(μT) + c Σ exp(μ(T - t_m)) for daily and monthly steps
+    """
+    for steps_per_year in (252, 12):
+        expected = MonteCarloService._expected_terminal_value(1000.0, 0.06, 3, 10.0, steps_per_year)
+        for kernel in (
+            MonteCarloService.simulate_gbm_terminal_values,
+            MonteCarloService.simulate_gbm_terminal_values_f32
+        ):
+            final_values, sample_paths = kernel(
+                1000.0, 0.06, 0.0, 3, 1 / steps_per_year, 4, 2, 0, monthly_contribution=10.0
+            )
+            np.testing.assert_allclose(final_values, expected, rtol=1e-5)
+            np.testing.assert_allclose(sample_paths[:, -1], final_values[:2])
+
+    assert expected > 1000.0 * np.exp(0.06 * 3) + 10.0 * 36
+
+
+def test_contributions_match_analytic_mean():
+    """
+    Test simulated mean with contributions against the closed form
+
+    Expected:
+    - auto engine steps monthly, mean within 4 standard errors
+    """
+    results = MonteCarloService.simulate(make_request(
+        num_simulations=20000, num_sample_paths=0, seed=2, monthly_contribution=20000
+    ))
+    mu, _ = MonteCarloService._calculate_portfolio_stats(make_request())
+    expected = MonteCarloService._expected_terminal_value(1000000, mu, 5, 20000, 12)
+
+    assert results["engine"] == "stepped"
+    assert results["time_step"] == "monthly"
+    difference = abs(results["final_portfolio_value"]["mean"] - expected)
+    assert difference < 4 * results["standard_errors"]["mean"]
+
+
+def test_contributions_require_stepped_engine():
+    """
+    Test contribution validation
+
+    Expected:
+    - exact engine and multi-asset model rejected with contributions
+    """
+    with pytest.raises(ValidationError):
+        make_request(monthly_contribution=1000, engine="exact", num_sample_paths=0)
+    with pytest.raises(ValidationError):
+        make_request(monthly_contribution=1000, model="multi_asset", num_sample_paths=0)
+
+
+def test_auto_engine_keeps_explicit_time_step():
+    """
+    Test 'auto' only switches to monthly steps when time_step was omitted
+
+    Expected:
+    - Omitted time_step: monthly steps for contributions without sample paths
+    - Explicit 'monthly' accepted, explicit 'daily' rejected (422)
+    - Explicit 'daily' honoured with engine 'stepped' or with sample paths
+    """
+    parameters = dict(monthly_contribution=1000, num_sample_paths=0)
+
+    assert MonteCarloService.resolve_engine(make_request(**parameters).parameters) == ("stepped", "monthly")
+    assert MonteCarloService.resolve_engine(
+        make_request(time_step="monthly", **parameters).parameters
+    ) == ("stepped", "monthly")
+    with pytest.raises(ValidationError):
+        make_request(time_step="daily", **parameters)
+    assert MonteCarloService.resolve_engine(
+        make_request(time_step="daily", engine="stepped", **parameters).parameters
+    ) == ("stepped", "daily")
+    assert MonteCarloService.resolve_engine(
+        make_request(time_step="weekly", monthly_contribution=1000, num_sample_paths=1).parameters
+    ) == ("stepped", "weekly")
+
+
+# ============================================================================
+
+def test_monthly_steps_match_daily_distribution():
+    """
+    Test coarser exact GBM steps leave the terminal distribution unchanged
+
+    Expected:
+    - Monthly sample paths have 12 points per year
+    - Mean and VaR 95% agree with daily steps within sampling error
+    """
+    parameters = dict(num_simulations=20000, num_sample_paths=1, engine="stepped", seed=5)
+    daily = MonteCarloService.simulate(make_request(**parameters))
+    monthly = MonteCarloService.simulate(make_request(time_step="monthly", **parameters))
+
+    assert monthly["time_step"] == "monthly"
+    assert len(monthly["sample_paths"][0]) == 5 * 12 + 1
+
+    for section, metric in (("final_portfolio_value", "mean"), ("risk_metrics", "var_95")):
+        error = np.hypot(daily["standard_errors"][metric], monthly["standard_errors"][metric])
+        assert abs(daily[section][metric] - monthly[section][metric]) < 4 * error
+
+
+# ============================================================================
+
+def test_float32_percentiles_within_tolerance():
+    """
+    Test float32 kernel against float64 with the same seed
+
+    Expected:
+    - Every percentile within FLOAT32_PERCENTILE_TOLERANCE (relative)
+    - Kernel outputs are float32, results report the precision
+    """
+    parameters = dict(num_simulations=5000, num_sample_paths=2, engine="stepped", seed=11,
+                      time_horizon_years=30)
+    double = MonteCarloService.simulate(make_request(**parameters))
+    single = MonteCarloService.simulate(make_request(precision="float32", **parameters))
+
+    for key, value in double["final_portfolio_value"]["percentiles"].items():
+        drift = abs(single["final_portfolio_value"]["percentiles"][key] / value - 1)
+        assert drift < MonteCarloService.FLOAT32_PERCENTILE_TOLERANCE
+    assert single["precision"] == "float32"
+
+    final_values, sample_paths = MonteCarloService.simulate_gbm_terminal_values_f32(
+        100.0, 0.08, 0.15, 1, 1/252, 10, 1, 0
+    )
+    assert final_values.dtype == np.float32
+    assert sample_paths[0, -1] == final_values[0]
+
+
+def test_float32_requires_stepped_engine():
+    """
+    Test precision validation
+
+    Expected:
+    - float32 with the default (auto) engine rejected
+    """
+    with pytest.raises(ValidationError):
+        make_request(precision="float32")
+
+
+# ============================================================================
+
+def test_adaptive_stops_at_target_precision():
+    """
+    Test adaptive mode stops once the target is met
+
+    Expected:
+    - Fewer paths than the maximum, target reached and reported
+    """
+    results = MonteCarloService.simulate(make_request(
+        num_simulations=100000,
+        num_sample_paths=0,
+        target_relative_error=0.01,
+        target_metrics=["var_95", "mean"]
+    ))
+
+    assert results["paths_used"] < 100000
+    assert results["adaptive"]["converged"]
+    assert results["adaptive"]["achieved_relative_error"] <= 0.01
+    errors = results["standard_errors"]
+    assert errors["var_95"] <= 0.01 * results["risk_metrics"]["var_95"]
+
+
+def test_adaptive_matches_fixed_run_with_same_paths():
+    """
+    Test batches continue the same random streams
+
+    Expected:
+    - Adaptive result equals a fixed run with paths_used paths and the same seed
+    """
+    adaptive = MonteCarloService.simulate(make_request(
+        num_simulations=100000,
+        num_sample_paths=0,
+        target_relative_error=0.005,
+        antithetic=True
+    ))
+    fixed = MonteCarloService.simulate(make_request(
+        num_simulations=adaptive["paths_used"],
+        num_sample_paths=0,
+        antithetic=True
+    ))
+
+    assert adaptive["final_portfolio_value"] == fixed["final_portfolio_value"]
+    assert adaptive["standard_errors"] == fixed["standard_errors"]
+
+
+def test_adaptive_stops_at_maximum():
+    """
+    Test an unreachable target stops at num_simulations
+
+    Expected:
+    - All paths used, not converged
+    """
+    results = MonteCarloService.simulate(make_request(
+        num_simulations=3000,
+        num_sample_paths=0,
+        target_relative_error=0.0001
+    ))
+
+    assert results["paths_used"] == 3000
+    assert not results["adaptive"]["converged"]
+
+
+@pytest.mark.parametrize("parameters", [
+    {"engine": "stepped", "num_sample_paths": 2, "monthly_contribution": 5000},
+    {"engine": "exact", "num_sample_paths": 0, "antithetic": True},
+    {"engine": "qmc", "num_sample_paths": 2}
+])
+def test_progress_reports_batches_without_changing_results(parameters):
+    """
+    Test progressive mode reports interim statistics per batch
+
+    Expected:
+    - Interim results after 1000, 2000 and 4000 paths (doubling)
+    - Final result equals the same request run without progress
+    """
+    request = make_request(num_simulations=5000, seed=7, **parameters)
+    interim = []
+
+    results = MonteCarloService.simulate(request, progress=interim.append)
+    single = MonteCarloService.simulate(request)
+
+    assert [update["paths_used"] for update in interim] == [1000, 2000, 4000]
+    assert all("sample_paths" not in update for update in interim)
+    assert results["paths_used"] == 5000
+    assert results["final_portfolio_value"] == single["final_portfolio_value"]
+    assert np.array_equal(results["sample_paths"], single["sample_paths"])
+
+
+def test_stream_simulation_yields_progress_then_result(monkeypatch):
+    """
+    Test streaming through the executor
+
+    Expected:
+    - Progress events first, the final result last
+    """
+    monkeypatch.setattr(simulation_executor, "pool_size", 0)
+    monkeypatch.setattr(simulation_executor, "_started", False)
+
+    async def scenario():
+        return [
+            (kind, results["paths_used"]) async for kind, results
+            in MonteCarloService.stream_simulation(make_request(num_simulations=3000, seed=3))
+        ]
+
+    assert asyncio.run(scenario()) == [("progress", 1000), ("progress", 2000), ("result", 3000)]
+
+
+# ============================================================================
+
+def test_simulate_returns_sample_paths():
+    """
+    Test simulate result structure
+
+    Expected:
+    - Five sample paths of daily length
+    - Percentiles are ordered
+    """
+    results = MonteCarloService.simulate(make_request())
+
+    assert results["engine"] == "stepped"
+    assert len(results["sample_paths"]) == 5
+    assert len(results["sample_paths"][0]) == 5 * 252 + 1
+
+    percentiles = results["final_portfolio_value"]["percentiles"]
+    assert percentiles["p5"] <= percentiles["p50"] <= percentiles["p95"]
+
+
+def test_warmup_compiles_request_specializations():
+    """
+    Test warmup compiles the same specializations requests use
+
+    Expected:
+    - Stepped, exact and multi-asset simulations after warmup add no
+      new compiled signatures to any Numba kernel
+    """
+    kernels = [
+        MonteCarloService.simulate_gbm_paths,
+        MonteCarloService.simulate_gbm_terminal_values,
+        rng.standard_normals,
+        rng.standard_normal_block
+    ]
+    MonteCarloService.warmup()
+    compiled = [len(kernel.signatures) for kernel in kernels]
+
+    MonteCarloService.simulate(make_request(num_simulations=1000, num_sample_paths=1))
+    MonteCarloService.simulate(make_request(num_simulations=1000, num_sample_paths=0))
+    MonteCarloService.simulate(make_request(num_simulations=1000, model="multi_asset"))
+
+    assert [len(kernel.signatures) for kernel in kernels] == compiled
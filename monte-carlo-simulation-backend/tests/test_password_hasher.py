@@ -0,0 +1,85 @@
+"""
+Password Hasher Tests
+Test bcrypt offloading, backpressure and metrics (no database required)
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi import HTTPException
+
+from app.services.password_hasher import PasswordHasher
+
+
+def test_hash_and_verify_keep_event_loop_responsive():
+    """
+    Test bcrypt runs off the event loop
+
+    Expected:
+    - Hash verifies, wrong password does not
+    - Event loop keeps ticking while bcrypt runs
+    - Completed operations counted with their work time
+    """
+    hasher = PasswordHasher(pool_size=2, queue_size=4, retry_after_seconds=1)
+
+    async def scenario():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        hashed = await hasher.hash("SecurePass123")
+        valid = await hasher.verify("SecurePass123", hashed)
+        invalid = await hasher.verify("WrongPass123", hashed)
+        task.cancel()
+        return valid, invalid, ticks
+
+    try:
+        valid, invalid, ticks = asyncio.run(scenario())
+    finally:
+        hasher.shutdown()
+
+    assert valid and not invalid
+    assert ticks > 5
+    stats = hasher.get_stats()
+    assert stats["completed"] == 3 and stats["in_flight"] == 0
+    assert stats["avg_work_ms"] > 0
+
+
+def test_rejects_beyond_capacity():
+    """
+    Test backpressure
+
+    Expected:
+    - pool_size + queue_size operations accepted, the next gets 429
+    - Slots are freed once operations finish
+    """
+    hasher = PasswordHasher(pool_size=1, queue_size=1, retry_after_seconds=3)
+    release = threading.Event()
+
+    async def scenario():
+        blocked = [asyncio.create_task(hasher._run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        with pytest.raises(HTTPException) as exc_info:
+            await hasher._run(time.sleep, 0)
+        release.set()
+        await asyncio.gather(*blocked)
+        return exc_info.value
+
+    try:
+        error = asyncio.run(scenario())
+    finally:
+        hasher.shutdown()
+
+    assert error.status_code == 429
+    assert error.headers["Retry-After"] == "3"
+    stats = hasher.get_stats()
+    assert stats["rejected"] == 1 and stats["in_flight"] == 0
+    # The queued operation waited for the first one
+    assert stats["max_wait_ms"] >= 40
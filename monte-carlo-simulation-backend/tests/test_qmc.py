@@ -0,0 +1,65 @@
+"""
+Quasi-Monte Carlo Tests
+Test Sobol normals and Brownian-bridge path construction (no database required)
+"""
+
+import numpy as np
+
+from app.services import qmc
+
+
+# ============================================================================
+# SOBOL NORMALS TESTS
+# ============================================================================
+
+def test_sobol_normals_are_reproducible_and_standard():
+    """
+    Test scrambled Sobol normals
+
+    Expected:
+    - Same seed gives identical points, different seed different points
+    - Mean ~0 and standard deviation ~1 (much tighter than pseudo-random)
+    """
+    Z = qmc.sobol_normals(4096, 2, seed=1)
+
+    assert Z.shape == (4096, 2)
+    np.testing.assert_array_equal(Z, qmc.sobol_normals(4096, 2, seed=1))
+    assert not np.array_equal(Z, qmc.sobol_normals(4096, 2, seed=2))
+    assert np.all(np.abs(Z.mean(axis=0)) < 0.005)
+    assert np.all(np.abs(Z.std(axis=0) - 1) < 0.01)
+
+
+def test_replicate_sizes_match_array_split():
+    """
+    Test replicate blocks use the np.array_split convention
+
+    Expected:
+    - Sizes sum to the total and match np.array_split
+    """
+    sizes = qmc.replicate_sizes(10003, 8)
+
+    assert sizes.sum() == 10003
+    assert list(sizes) == [len(block) for block in np.array_split(np.arange(10003), 8)]
+
+
+# ============================================================================
+# BROWNIAN BRIDGE TESTS
+# ============================================================================
+
+def test_brownian_bridge_has_brownian_covariance():
+    """
+    Test bridge construction yields Brownian motion on the grid
+
+    Expected:
+    - W(T) is driven by the first normal only
+    - Var W(t) = t and increments are uncorrelated with variance dt
+    """
+    T, num_steps = 2.0, 13
+    Z = np.random.default_rng(0).standard_normal((40000, num_steps))
+    W = qmc.brownian_bridge(Z, T)
+    times = T * np.arange(1, num_steps + 1) / num_steps
+    increments = np.diff(W, axis=1, prepend=0.0)
+
+    np.testing.assert_allclose(W[:, -1], np.sqrt(T) * Z[:, 0])
+    np.testing.assert_allclose(W.var(axis=0), times, rtol=0.05)
+    np.testing.assert_allclose(np.cov(increments.T), np.eye(num_steps) * T / num_steps, atol=0.01)
@@ -0,0 +1,167 @@
+"""
+Simulation Result Cache Tests
+Test cache keys and the in-process LRU tier (no database required)
+"""
+
+import asyncio
+
+import numpy as np
+
+from app.schemas.simulation import SimulationRequest
+from app.services.monte_carlo import MonteCarloService
+from app.services.result_cache import SimulationResultCache
+
+
+# Test Data
+base_request = {
+    "portfolio": {
+        "assets": [
+            {"ticker": "NSEI Index", "weight": 0.6, "asset_class": "equity"},
+            {"ticker": "GIND10YR Index", "weight": 0.4, "asset_class": "bonds"}
+        ]
+    },
+    "parameters": {
+        "initial_investment": 1000000,
+        "time_horizon_years": 5,
+        "num_simulations": 2000,
+        "seed": 7
+    }
+}
+
+
+def make_cache(max_bytes: int = 1024 * 1024) -> SimulationResultCache:
+    """Build a local-only cache"""
+    return SimulationResultCache(
+        enabled=True,
+        max_bytes=max_bytes,
+        shared_enabled=False,
+        shared_ttl_hours=1
+    )
+
+
+# ============================================================================
+# CACHE KEY TESTS
+# ============================================================================
+
+def test_cache_key_is_canonical():
+    """
+    Test equivalent requests map to the same key
+
+    Expected:
+    - Defaults spelled out explicitly do not change the key
+    - Different seeds give different keys
+    """
+    cache = make_cache()
+    request = SimulationRequest(**base_request)
+    explicit = SimulationRequest(**{
+        "portfolio": base_request["portfolio"],
+        "parameters": {**base_request["parameters"], "monthly_contribution": 0}
+    })
+    other_seed = SimulationRequest(**{
+        "portfolio": base_request["portfolio"],
+        "parameters": {**base_request["parameters"], "seed": 8}
+    })
+
+    assert cache.cache_key(request) == cache.cache_key(explicit)
+    assert cache.cache_key(request) != cache.cache_key(other_seed)
+    assert len(cache.cache_key(request)) == 64
+
+
+def test_cache_key_includes_engine_version(monkeypatch):
+    """
+    Test bumping ENGINE_VERSION invalidates keys
+
+    Expected:
+    - Key changes while the request hash (audit log) does not
+    """
+    cache = make_cache()
+    request = SimulationRequest(**base_request)
+    key = cache.cache_key(request)
+    request_hash = cache.hash_request(request)
+
+    monkeypatch.setattr(MonteCarloService, "ENGINE_VERSION", MonteCarloService.ENGINE_VERSION + 1)
+
+    assert cache.cache_key(request) != key
+    assert cache.hash_request(request) == request_hash
+
+
+def test_unseeded_requests_are_not_cached():
+    """
+    Test requests without a seed bypass the cache
+
+    Expected:
+    - cache_key is None, get/put are no-ops
+    """
+    cache = make_cache()
+    request = SimulationRequest(**{
+        "portfolio": base_request["portfolio"],
+        "parameters": {**base_request["parameters"], "seed": None}
+    })
+    key = cache.cache_key(request)
+
+    asyncio.run(cache.put(key, {"value": 1}))
+
+    assert key is None
+    assert asyncio.run(cache.get(key)) is None
+    assert cache.get_stats()["entries"] == 0
+
+
+# ============================================================================
+# LRU TIER TESTS
+# ============================================================================
+
+def test_lru_hit_and_miss():
+    """
+    Test round trip through the local tier
+
+    Expected:
+    - Miss before put, hit after, counters updated
+    """
+    cache = make_cache()
+
+    assert asyncio.run(cache.get("a" * 64)) is None
+    asyncio.run(cache.put("a" * 64, {"value": 1}))
+
+    assert asyncio.run(cache.get("a" * 64)) == {"value": 1}
+    assert cache.get_stats()["hits"] == 1
+    assert cache.get_stats()["misses"] == 1
+
+
+def test_lru_evicts_by_size():
+    """
+    Test size-based eviction of least recently used entries
+
+    Expected:
+    - Total size stays within max_bytes
+    - Recently read entry survives, oldest unread entry is evicted
+    """
+    payload = {"values": [1.0] * 20}
+    cache = make_cache(max_bytes=250)
+
+    asyncio.run(cache.put("a", payload))
+    asyncio.run(cache.put("b", payload))
+    asyncio.run(cache.get("a"))
+    asyncio.run(cache.put("c", payload))
+
+    stats = cache.get_stats()
+    assert stats["size_bytes"] <= 250
+    assert asyncio.run(cache.get("a")) is not None
+    assert asyncio.run(cache.get("b")) is None
+    assert asyncio.run(cache.get("c")) is not None
+
+
+def test_lru_keeps_arrays_and_counts_their_bytes():
+    """
+    Test results with NumPy array fields in the local tier
+
+    Expected:
+    - Arrays are returned as stored (no JSON round trip)
+    - Entry size counts the array bytes
+    """
+    paths = np.ones((2, 100))
+    cache = make_cache()
+
+    asyncio.run(cache.put("a", {"value": 1, "sample_paths": paths}))
+
+    assert asyncio.run(cache.get("a"))["sample_paths"] is paths
+    assert cache.get_stats()["size_bytes"] == len('{"value":1}') + paths.nbytes
@@ -0,0 +1,121 @@
+"""
+Serialization Tests
+Test JSON and MessagePack encodings of simulation results (no database required)
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from app.schemas.simulation import SimulationRequest
+from app.services.monte_carlo import MonteCarloService
+from app.utils.serialization import (
+    accepts_msgpack,
+    from_jsonable,
+    packb,
+    to_jsonable,
+    unpackb
+)
+
+
+def simulate(**parameters) -> dict:
+    """Simulate a two-asset portfolio with overridden parameters"""
+    return MonteCarloService.simulate(SimulationRequest(**{
+        "portfolio": {
+            "assets": [
+                {"ticker": "NSEI Index", "weight": 0.6, "asset_class": "equity"},
+                {"ticker": "GIND10YR Index", "weight": 0.4, "asset_class": "bonds"}
+            ]
+        },
+        "parameters": {
+            "initial_investment": 1000000,
+            "time_horizon_years": 3,
+            "num_simulations": 2000,
+            "num_sample_paths": 2,
+            "seed": 5,
+            **parameters
+        }
+    }))
+
+
+# ============================================================================
+# TERMINAL DISTRIBUTION TESTS
+# ============================================================================
+
+def test_return_distribution_contains_every_terminal_value():
+    """
+    Test the optional float32 terminal distribution
+
+    Expected:
+    - One float32 value per path, consistent with the reported statistics
+    - Absent unless requested
+    """
+    results = simulate(return_distribution=True)
+    distribution = results["terminal_distribution"]
+
+    assert distribution.dtype == np.float32
+    assert distribution.shape == (results["paths_used"],)
+    assert float(np.median(distribution)) == pytest.approx(
+        results["final_portfolio_value"]["median"], rel=1e-6
+    )
+    assert "terminal_distribution" not in simulate()
+
+
+# ============================================================================
+# ENCODING TESTS
+# ============================================================================
+
+def test_json_form_round_trip():
+    """
+    Test the JSON form of results
+
+    Expected:
+    - JSON-serializable, sample paths as nested lists
+    - Distribution as a base64 float32 buffer
+    - from_jsonable restores the arrays exactly
+    """
+    results = simulate(return_distribution=True)
+
+    jsonable = json.loads(json.dumps(to_jsonable(results)))
+    restored = from_jsonable(jsonable)
+
+    assert jsonable["sample_paths"] == results["sample_paths"].tolist()
+    assert jsonable["terminal_distribution"]["dtype"] == "<f4"
+    assert np.array_equal(restored["sample_paths"], results["sample_paths"])
+    assert np.array_equal(restored["terminal_distribution"], results["terminal_distribution"])
+    assert restored["final_portfolio_value"] == results["final_portfolio_value"]
+
+
+def test_msgpack_round_trip():
+    """
+    Test the MessagePack encoding
+
+    Expected:
+    - Arrays come back with dtype and shape, statistics unchanged
+    - Smaller than the JSON response
+    """
+    results = simulate(return_distribution=True)
+    payload = {"simulation_id": "sim_test", "results": results}
+
+    data = packb(payload)
+    decoded = unpackb(data)["results"]
+
+    assert decoded["sample_paths"].dtype == np.float64
+    assert np.array_equal(decoded["sample_paths"], results["sample_paths"])
+    assert np.array_equal(decoded["terminal_distribution"], results["terminal_distribution"])
+    assert decoded["risk_metrics"] == results["risk_metrics"]
+    assert len(data) < len(json.dumps({**payload, "results": to_jsonable(results)}))
+
+
+def test_accepts_msgpack():
+    """
+    Test Accept header negotiation
+
+    Expected:
+    - MessagePack media types (with parameters) are recognized, others are not
+    """
+    assert accepts_msgpack("application/x-msgpack")
+    assert accepts_msgpack("application/json;q=0.5, application/msgpack")
+    assert not accepts_msgpack("application/json")
+    assert not accepts_msgpack(None)
@@ -0,0 +1,290 @@
+"""
+Simulation Batch Tests
+Test shared draws, batch grouping, result streaming and parameter sweeps
+(no database required)
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from app.config import settings
+from app.schemas.simulation import SimulationRequest, SimulationSweepRequest
+from app.services.monte_carlo import MonteCarloService
+from app.services.result_cache import simulation_result_cache
+from app.services.simulation_batch_service import SimulationBatchService
+from app.services.simulation_executor import simulation_executor
+
+
+def make_request(equity_weight: float = 0.6, **parameters) -> SimulationRequest:
+    """Build a two-asset SimulationRequest with overridden parameters"""
+    return SimulationRequest(**{
+        "portfolio": {
+            "assets": [
+                {"ticker": "NSEI Index", "weight": equity_weight, "asset_class": "equity"},
+                {"ticker": "GIND10YR Index", "weight": round(1 - equity_weight, 2), "asset_class": "bonds"}
+            ]
+        },
+        "parameters": {
+            "initial_investment": 1000000,
+            "time_horizon_years": 2,
+            "num_simulations": 1000,
+            "num_sample_paths": 0,
+            **parameters
+        }
+    })
+
+
+@pytest.fixture
+def thread_executor(monkeypatch):
+    """Run the global simulation executor in threads (no worker processes)"""
+    monkeypatch.setattr(simulation_executor, "pool_size", 0)
+    monkeypatch.setattr(simulation_executor, "_started", False)
+    simulation_result_cache.clear()
+    yield simulation_executor
+    simulation_result_cache.clear()
+
+
+def collect(requests: list) -> list:
+    """Run a batch and collect the streamed items"""
+    async def scenario():
+        return [item async for item in SimulationBatchService.run_batch(requests)]
+    return asyncio.run(scenario())
+
+
+# ============================================================================
+# SHARED DRAWS TESTS
+# ============================================================================
+
+@pytest.mark.parametrize("parameters", [
+    {"engine": "exact"},
+    {"engine": "stepped", "num_sample_paths": 2},
+    {"engine": "stepped", "antithetic": True, "target_relative_error": 0.002},
+    {"engine": "qmc"},
+    {"model": "multi_asset"}
+])
+def test_batch_matches_individual_simulations(parameters):
+    """
+    Test sharing draws between portfolios does not change results
+
+    Expected:
+    - Each result equals the same request simulated on its own
+    """
+    requests = [make_request(weight, seed=11, **parameters) for weight in (0.2, 0.6, 0.9)]
+
+    outcomes = MonteCarloService.simulate_batch(requests)
+
+    for request, (results, error_message) in zip(requests, outcomes):
+        single = MonteCarloService.simulate(request)
+        assert error_message is None
+        assert results['final_portfolio_value'] == single['final_portfolio_value']
+        assert np.array_equal(results['sample_paths'], single['sample_paths'])
+
+
+def test_batch_shares_draws_across_horizons_and_contributions():
+    """
+    Test one pass of step sums serves several horizons and contribution amounts
+
+    Expected:
+    - Each result equals the same request simulated on its own
+    """
+    requests = [
+        make_request(weight, seed=12, engine="stepped", time_step="weekly",
+                     time_horizon_years=years, monthly_contribution=contribution,
+                     num_sample_paths=1)
+        for years in (1, 3)
+        for contribution in (0, 2000)
+        for weight in (0.3, 0.7)
+    ]
+
+    outcomes = MonteCarloService.simulate_batch(requests)
+
+    for request, (results, error_message) in zip(requests, outcomes):
+        single = MonteCarloService.simulate(request)
+        assert error_message is None
+        assert results['final_portfolio_value'] == single['final_portfolio_value']
+        assert np.array_equal(results['sample_paths'], single['sample_paths'])
+
+
+# ============================================================================
+# GROUPING TESTS
+# ============================================================================
+
+def test_unseeded_requests_share_batch_seed():
+    """
+    Test the batch seed policy
+
+    Expected:
+    - Unseeded requests get the batch seed, explicit seeds are kept
+    - Original requests are not modified
+    """
+    requests = [make_request(), make_request(0.3), make_request(seed=5)]
+
+    seeded = SimulationBatchService.assign_seeds(requests, 1234)
+
+    assert [request.parameters.seed for request in seeded] == [1234, 1234, 5]
+    assert requests[0].parameters.seed is None
+
+
+def test_group_requests_by_draw_layout():
+    """
+    Test requests are grouped by the draws they use, split across workers
+
+    Expected:
+    - Same seed and layout share a task (horizons may differ), other seeds do not
+    - A large group is split into one part per worker
+    """
+    requests = [
+        make_request(0.2, seed=1),
+        make_request(0.4, seed=1),
+        make_request(0.6, seed=2),
+        make_request(0.8, seed=1, time_horizon_years=3)
+    ]
+
+    assert SimulationBatchService.group_requests(requests, [0, 1, 2, 3], 1) == [[0, 1, 3], [2]]
+    assert SimulationBatchService.group_requests(requests, [0, 1], 2) == [[0], [1]]
+
+
+# ============================================================================
+# STREAMING TESTS
+# ============================================================================
+
+def test_run_batch_streams_every_request(thread_executor):
+    """
+    Test every request yields one result, then cache hits on repeat
+
+    Expected:
+    - One completed item per index
+    - Seeded requests are cached (MISS, then HIT), unseeded ones bypass
+    """
+    requests = [make_request(0.2, seed=3), make_request(0.8, seed=3), make_request(0.5)]
+
+    first = collect(requests)
+    second = collect(requests)
+
+    assert sorted(item.index for item in first) == [0, 1, 2]
+    assert all(item.status == "completed" for item in first)
+    assert {item.index: item.cache for item in first} == {0: "MISS", 1: "MISS", 2: "BYPASS"}
+    assert {item.index: item.cache for item in second} == {0: "HIT", 1: "HIT", 2: "BYPASS"}
+
+
+def test_run_batch_reports_failures_per_request(thread_executor, monkeypatch):
+    """
+    Test a rejected pool task fails its requests without aborting the batch
+
+    Expected:
+    - Every request yields a failed item with the 429 message
+    """
+    monkeypatch.setattr(thread_executor, "_in_flight", thread_executor.capacity)
+    requests = [make_request(0.2, seed=4), make_request(0.8, seed=5)]
+
+    items = collect(requests)
+
+    assert sorted(item.index for item in items) == [0, 1]
+    assert all(item.status == "failed" for item in items)
+    assert all("capacity" in item.error_message for item in items)
+
+
+# ============================================================================
+# SWEEP TESTS
+# ============================================================================
+
+def make_sweep(**axes) -> SimulationSweepRequest:
+    """Build a sweep over the default two-asset request"""
+    return SimulationSweepRequest(base=make_request(), axes=axes)
+
+
+def test_expand_sweep_grid():
+    """
+    Test grid points, reweighting and the shared engine
+
+    Expected:
+    - Cartesian product, horizons outermost
+    - Other assets rescaled to fill the remaining weight
+    - Every point on the sweep seed, with the engine 'auto' picks for contributions
+    """
+    sweep = make_sweep(
+        time_horizon_years=[1, 2],
+        monthly_contribution=[0, 1000],
+        allocation={"ticker": "NSEI Index", "weights": [0.2, 1.0]}
+    )
+
+    points, requests = SimulationBatchService.expand_sweep(sweep, seed=21)
+
+    assert len(points) == len(requests) == 8
+    assert points[0] == {"time_horizon_years": 1, "monthly_contribution": 0, "allocation_weight": 0.2}
+    assert points[-1] == {"time_horizon_years": 2, "monthly_contribution": 1000, "allocation_weight": 1.0}
+    assert [asset.weight for asset in requests[0].portfolio.assets] == pytest.approx([0.2, 0.8])
+    assert [asset.weight for asset in requests[1].portfolio.assets] == pytest.approx([1.0, 0.0])
+    assert {request.parameters.seed for request in requests} == {21}
+    assert {request.parameters.engine for request in requests} == {"stepped"}
+    assert {request.parameters.time_step for request in requests} == {"monthly"}
+
+
+def test_sweep_validation():
+    """
+    Test sweep request validation
+
+    Expected:
+    - At least one axis, ticker in the base portfolio, at most 200 points
+    """
+    with pytest.raises(ValidationError):
+        make_sweep()
+    with pytest.raises(ValidationError):
+        make_sweep(allocation={"ticker": "GOLD Commodity", "weights": [0.5]})
+    with pytest.raises(ValidationError):
+        make_sweep(time_horizon_years=list(range(1, 21)), monthly_contribution=list(range(11)))
+
+
+def test_run_sweep_uses_common_random_numbers(thread_executor):
+    """
+    Test every sweep point runs on the same shocks
+
+    Expected:
+    - All points completed
+    - With shared shocks, every path gains from a larger contribution, so
+      each percentile increases strictly with the contribution
+    """
+    sweep = make_sweep(monthly_contribution=[0, 100, 200])
+
+    seed, points = asyncio.run(SimulationBatchService.run_sweep(sweep))
+
+    assert all(point.status == "completed" for point in points)
+    assert {point.results['seed'] for point in points} == {seed}
+    percentiles = [point.results['final_portfolio_value']['percentiles'] for point in points]
+    for key in percentiles[0]:
+        assert percentiles[0][key] < percentiles[1][key] < percentiles[2][key]
+
+
+def test_run_sweep_splits_grid_into_chunks(thread_executor, monkeypatch):
+    """
+    Test a sweep is submitted as several bounded pool tasks
+
+    Expected:
+    - 5 points with chunk size 2 run as tasks of 2, 2 and 1 points, each
+      with a timeout for its own points only
+    - Results match the sweep run as a single task (same seed, same draws)
+    """
+    sweep = SimulationSweepRequest(
+        base=make_request(seed=42),
+        axes={"monthly_contribution": [0, 50, 100, 150, 200]}
+    )
+    run_batch = MonteCarloService.run_batch
+    calls = []
+
+    async def recording_run_batch(requests, is_disconnected=None, timeout_seconds=None):
+        calls.append((len(requests), timeout_seconds))
+        return await run_batch(requests, is_disconnected=is_disconnected, timeout_seconds=timeout_seconds)
+
+    monkeypatch.setattr(MonteCarloService, "run_batch", recording_run_batch)
+    monkeypatch.setattr(settings, "SIMULATION_SWEEP_CHUNK_SIZE", 2)
+    _, chunked = asyncio.run(SimulationBatchService.run_sweep(sweep))
+    monkeypatch.setattr(settings, "SIMULATION_SWEEP_CHUNK_SIZE", 10)
+    _, single = asyncio.run(SimulationBatchService.run_sweep(sweep))
+
+    timeout = simulation_executor.timeout_seconds
+    assert calls == [(2, 2 * timeout), (2, 2 * timeout), (1, timeout), (5, 5 * timeout)]
+    for chunked_point, single_point in zip(chunked, single):
+        assert chunked_point.results['final_portfolio_value'] == single_point.results['final_portfolio_value']
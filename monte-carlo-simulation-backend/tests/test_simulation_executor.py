@@ -0,0 +1,318 @@
+"""
+Simulation Executor Tests
+Test backpressure, timeouts and cancellation of the simulation worker pool
+"""
+
+import asyncio
+import math
+import os
+import threading
+import time
+
+import pytest
+from fastapi import HTTPException
+
+from app.services.simulation_executor import SimulationExecutor
+
+
+def _slow_initializer(num_threads, ready_queue=None):
+    """Stand-in for JIT warmup: sleeps, then reports ready"""
+    time.sleep(0.2)
+    if ready_queue is not None:
+        ready_queue.put(os.getpid())
+
+
+def _count_up(n, progress):
+    """Reports 1..n as progress, then returns n"""
+    for i in range(1, n + 1):
+        progress(i)
+    return n
+
+
+def _crash_worker():
+    """Kills the worker process, breaking the pool"""
+    os._exit(1)
+
+
+def make_executor(**overrides) -> SimulationExecutor:
+    """Build an executor without JIT warmup (fast to start)"""
+    options = dict(
+        pool_size=0,
+        queue_size=0,
+        timeout_seconds=5.0,
+        retry_after_seconds=7,
+        initializer=None
+    )
+    options.update(overrides)
+    return SimulationExecutor(**options)
+
+
+# ============================================================================
+# EXECUTION TESTS
+# ============================================================================
+
+def test_run_in_process_pool():
+    """
+    Test work is executed in a worker process
+
+    Expected:
+    - Result of the function is returned
+    - No work is left in flight afterwards
+    """
+    executor = make_executor(pool_size=1)
+    try:
+        result = asyncio.run(executor.run(math.factorial, 10))
+    finally:
+        executor.shutdown()
+
+    assert result == 3628800
+    assert executor.get_stats()["in_flight"] == 0
+
+
+def test_run_in_thread_without_pool():
+    """
+    Test pool_size 0 runs work in a thread
+
+    Expected:
+    - Result of the function is returned
+    """
+    executor = make_executor()
+
+    assert asyncio.run(executor.run(math.factorial, 5)) == 120
+
+
+@pytest.mark.parametrize("pool_size", [0, 1])
+def test_run_delivers_progress_before_result(pool_size):
+    """
+    Test progress reported by the work reaches the caller's callback
+
+    Expected:
+    - Every payload arrives, in order, before run returns
+    """
+    executor = make_executor(pool_size=pool_size)
+    received = []
+
+    async def scenario():
+        result = await executor.run(_count_up, 5, progress=received.append)
+        return result, list(received)
+
+    try:
+        result, before_return = asyncio.run(scenario())
+    finally:
+        executor.shutdown()
+
+    assert result == 5
+    assert before_return == [1, 2, 3, 4, 5]
+
+
+def test_warmup_starts_all_workers():
+    """
+    Test warmup waits for every worker before reporting ready
+
+    Expected:
+    - Not ready before warmup, ready afterwards
+    - pool_size worker processes have been spawned
+    """
+    executor = make_executor(pool_size=2, initializer=_slow_initializer, timeout_seconds=60.0)
+    assert not executor.ready
+
+    async def scenario():
+        await executor.warmup()
+        return {process.pid for process in executor._pool._processes.values()}
+
+    try:
+        pids = asyncio.run(scenario())
+        assert executor.get_stats()["ready"]
+    finally:
+        executor.shutdown()
+
+    assert len(pids) == 2
+    assert not executor.ready
+
+
+def test_start_warmup_runs_in_background():
+    """
+    Test start_warmup returns before the workers are warm
+
+    Expected:
+    - Not ready right after start_warmup (the event loop keeps serving)
+    - Ready once the background warmup has finished
+    """
+    executor = make_executor(pool_size=1, initializer=_slow_initializer, timeout_seconds=60.0)
+
+    async def scenario():
+        executor.start_warmup()
+        ready_at_start = executor.ready
+        await executor._warmup_task
+        return ready_at_start, executor.ready
+
+    try:
+        ready_at_start, ready_after = asyncio.run(scenario())
+    finally:
+        executor.shutdown()
+
+    assert not ready_at_start
+    assert ready_after
+
+
+def test_failed_warmup_is_reported_and_retried():
+    """
+    Test a failed warmup is kept in warmup_error and retried
+
+    Expected:
+    - After the first (failing) attempt, not ready and the error reported
+    - The retry succeeds: ready, error cleared
+    """
+    attempts = []
+
+    def flaky_initializer(num_threads, ready_queue=None):
+        attempts.append(num_threads)
+        if len(attempts) == 1:
+            raise RuntimeError("worker spawn failed")
+
+    executor = make_executor(initializer=flaky_initializer)
+    executor.WARMUP_RETRY_SECONDS = 0.05
+
+    async def scenario():
+        executor.start_warmup()
+        await asyncio.sleep(0.01)
+        stats_after_failure = executor.get_stats()
+        await executor._warmup_task
+        return stats_after_failure
+
+    stats_after_failure = asyncio.run(scenario())
+
+    assert not stats_after_failure["ready"]
+    assert stats_after_failure["warmup_error"] == "worker spawn failed"
+    assert len(attempts) == 2
+    assert executor.ready
+    assert executor.get_stats()["warmup_error"] is None
+
+
+# ============================================================================
+# BACKPRESSURE / TIMEOUT / CANCELLATION TESTS
+# ============================================================================
+
+def test_rejects_when_queue_full():
+    """
+    Test backpressure when capacity is reached
+
+    Expected:
+    - Second concurrent request gets 429 with Retry-After header
+    """
+    executor = make_executor()
+
+    async def scenario():
+        slow = asyncio.create_task(executor.run(time.sleep, 0.3))
+        await asyncio.sleep(0.05)
+        with pytest.raises(HTTPException) as exc_info:
+            await executor.run(time.sleep, 0)
+        await slow
+        return exc_info.value
+
+    error = asyncio.run(scenario())
+
+    assert error.status_code == 429
+    assert error.headers["Retry-After"] == "7"
+
+
+def test_times_out_slow_simulation():
+    """
+    Test per-request timeout
+
+    Expected:
+    - 504 when the work exceeds timeout_seconds
+    """
+    executor = make_executor(timeout_seconds=0.1)
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(executor.run(time.sleep, 0.5))
+
+    assert exc_info.value.status_code == 504
+
+
+def test_cancels_on_client_disconnect():
+    """
+    Test waiting stops once the client disconnects
+
+    Expected:
+    - 499 raised well before the work would have finished
+    """
+    executor = make_executor()
+
+    async def disconnected() -> bool:
+        return True
+
+    start = time.time()
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(executor.run(time.sleep, 2, is_disconnected=disconnected))
+
+    assert exc_info.value.status_code == 499
+    assert time.time() - start < 1.5
+
+
+# ============================================================================
+# WORKER CRASH TESTS
+# ============================================================================
+
+def test_recovers_from_crashed_worker():
+    """
+    Test a worker process dying does not take the executor down
+
+    Expected:
+    - The request whose worker died gets 503 and frees its slot
+    - The broken pool is replaced and warmed again, and stopped off the
+      event loop thread
+    - The next request is served by the new pool
+    """
+    executor = make_executor(pool_size=1)
+    stop_threads = []
+    stop_pool = executor._stop_pool
+
+    def recording_stop_pool(*detached):
+        stop_threads.append(threading.current_thread())
+        stop_pool(*detached)
+
+    executor._stop_pool = recording_stop_pool
+
+    async def scenario():
+        await executor.warmup()
+        broken_pool = executor._pool
+        with pytest.raises(HTTPException) as exc_info:
+            await executor.run(_crash_worker)
+        in_flight = executor.get_stats()["in_flight"]
+        replaced = executor._pool is not broken_pool
+        await executor._warmup_task
+        result = await executor.run(math.factorial, 5)
+        return exc_info.value, in_flight, replaced, result
+
+    try:
+        error, in_flight, replaced, result = asyncio.run(scenario())
+    finally:
+        executor.shutdown()
+
+    assert error.status_code == 503
+    assert in_flight == 0
+    assert replaced
+    assert stop_threads[0] is not threading.main_thread()
+    assert result == 120
+
+
+def test_releases_slot_when_submit_fails():
+    """
+    Test a failing submit does not leak a capacity slot
+
+    Expected:
+    - The submit error propagates and in_flight returns to 0
+    """
+    executor = make_executor()
+
+    def failing_submit(fn, *args):
+        raise RuntimeError("cannot schedule new futures after shutdown")
+
+    executor._submit = failing_submit
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(executor.run(math.factorial, 5))
+
+    assert executor.get_stats()["in_flight"] == 0
@@ -0,0 +1,320 @@
+"""
+Simulation Job Tests
+Test the asynchronous job queue and job responses (no database required)
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from app.models.simulation_job import SimulationJob
+from app.schemas.simulation import SimulationRequest
+from app.services import simulation_job_service
+from app.services.simulation_job_service import SimulationJobQueue, SimulationJobService
+
+
+class StubResult:
+    """Stand-in Result: rowcount for UPDATE, scalars() for SELECT and RETURNING"""
+
+    def __init__(self, rowcount: int = 0, values: list = ()):
+        self.rowcount = rowcount
+        self.values = list(values)
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.values
+
+    def scalar_one_or_none(self):
+        return self.values[0] if self.values else None
+
+
+class StubDatabase:
+    """Stand-in session factory holding simulation_jobs rows (id -> column values)"""
+
+    def __init__(self, jobs: dict = None):
+        self.jobs = {job_id: {"id": job_id, **row} for job_id, row in (jobs or {}).items()}
+        self.sessions_open = 0
+
+    def __call__(self):
+        return StubSession(self)
+
+    def status(self, job_id: str) -> str:
+        return self.jobs[job_id]["status"]
+
+
+class StubSession:
+    """Stand-in AsyncSession (async context manager) evaluating simple job statements"""
+
+    OPERATORS = {
+        "eq": lambda value, other: value == other,
+        "lt": lambda value, other: value is not None and value < other,
+        "gt": lambda value, other: value is not None and value > other
+    }
+
+    def __init__(self, database: StubDatabase):
+        self.database = database
+
+    async def __aenter__(self):
+        self.database.sessions_open += 1
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.database.sessions_open -= 1
+        return False
+
+    def _matching(self, statement) -> list:
+        """Rows matching the AND-ed column comparisons of the WHERE clause"""
+        clauses = getattr(statement.whereclause, "clauses", [statement.whereclause])
+        return [
+            row for row in self.database.jobs.values()
+            if all(
+                self.OPERATORS[clause.operator.__name__](row.get(clause.left.name), clause.right.value)
+                for clause in clauses
+            )
+        ]
+
+    async def execute(self, statement):
+        if statement.is_delete:
+            return StubResult()
+        rows = self._matching(statement)
+        if statement.is_update:
+            values = {column.name: parameter.value for column, parameter in statement._values.items()}
+            for row in rows:
+                row.update(values)
+            returning = [column.name for column in statement._returning]
+            return StubResult(len(rows), [row[name] for row in rows for name in returning])
+        return StubResult(values=[row["id"] for row in rows])
+
+    async def commit(self):
+        pass
+
+
+REQUEST_PAYLOAD = {
+    "portfolio": {
+        "assets": [
+            {"ticker": "NSEI Index", "weight": 0.6, "asset_class": "equity"},
+            {"ticker": "GIND10YR Index", "weight": 0.4, "asset_class": "bonds"}
+        ]
+    },
+    "parameters": {"initial_investment": 1000000, "time_horizon_years": 2, "num_simulations": 1000}
+}
+
+
+def make_queue(database: StubDatabase, **overrides) -> SimulationJobQueue:
+    """Build a job queue on a stand-in database"""
+    options = dict(num_workers=0, max_size=10, session_factory=database)
+    options.update(overrides)
+    return SimulationJobQueue(**options)
+
+
+# ============================================================================
+# JOB QUEUE TESTS
+# ============================================================================
+
+def test_queue_not_running_rejects_jobs():
+    """
+    Test submission before the queue is started
+
+    Expected:
+    - 503 Service Unavailable
+    """
+    queue = SimulationJobQueue(num_workers=1, max_size=1)
+
+    with pytest.raises(HTTPException) as exc_info:
+        queue.reserve_slot()
+
+    assert exc_info.value.status_code == 503
+
+
+def test_full_queue_rejects_jobs():
+    """
+    Test backpressure when the job queue is full
+
+    Expected:
+    - A reserved slot counts before its job is enqueued, so a concurrent
+      submission gets 429 with Retry-After header
+    - A released reservation frees the slot again
+    """
+    queue = make_queue(StubDatabase(), max_size=1)
+
+    async def scenario():
+        queue.start()
+        try:
+            queue.reserve_slot()
+            with pytest.raises(HTTPException) as reserved_error:
+                queue.reserve_slot()
+            queue.release_slot()
+            queue.reserve_slot()
+            queue.enqueue("sim_000000000001")
+            with pytest.raises(HTTPException) as queued_error:
+                queue.reserve_slot()
+            return reserved_error.value, queued_error.value
+        finally:
+            await queue.stop()
+
+    reserved_error, queued_error = asyncio.run(scenario())
+
+    assert reserved_error.status_code == queued_error.status_code == 429
+    assert "Retry-After" in queued_error.headers
+
+
+def test_failed_submission_releases_slot(monkeypatch):
+    """
+    Test a job whose row cannot be committed gives its queue slot back
+
+    Expected:
+    - The commit error propagates
+    - The next submission still finds the slot free
+    """
+    queue = make_queue(StubDatabase(), max_size=1)
+    monkeypatch.setattr(simulation_job_service, "simulation_job_queue", queue)
+
+    class FailingSession:
+        def add(self, job):
+            pass
+
+        async def commit(self):
+            raise RuntimeError("database unavailable")
+
+    class StubApiKey:
+        user_id = 1
+        key = "mk_live_" + "a" * 24
+
+    async def scenario():
+        queue.start()
+        try:
+            with pytest.raises(RuntimeError):
+                await SimulationJobService.create_job(
+                    SimulationRequest(**REQUEST_PAYLOAD), StubApiKey(), FailingSession()
+                )
+            queue.reserve_slot()
+        finally:
+            await queue.stop()
+
+    asyncio.run(scenario())
+
+
+def test_start_recovers_left_over_jobs():
+    """
+    Test jobs of the previous run are picked up on start
+
+    Expected:
+    - Pending jobs are queued again
+    - Running jobs started before the job timeout are marked failed
+    - Recently started running jobs (maybe in another process) and
+      finished jobs are left alone
+    """
+    now = datetime.now(timezone.utc)
+    expires_at = now + timedelta(hours=1)
+    database = StubDatabase({
+        "sim_pending00001": {"status": "pending", "expires_at": expires_at},
+        "sim_pending00002": {"status": "pending", "expires_at": expires_at},
+        "sim_running00001": {"status": "running", "started_at": now - timedelta(days=1)},
+        "sim_running00002": {"status": "running", "started_at": now},
+        "sim_complete0001": {"status": "completed", "started_at": now - timedelta(days=1)}
+    })
+    queue = make_queue(database)
+
+    async def scenario():
+        queue.start()
+        try:
+            await asyncio.sleep(0.05)
+            return [queue._queue.get_nowait() for _ in range(queue._queue.qsize())]
+        finally:
+            await queue.stop()
+
+    queued = asyncio.run(scenario())
+
+    assert queued == ["sim_pending00001", "sim_pending00002"]
+    assert database.status("sim_running00001") == "failed"
+    assert database.jobs["sim_running00001"]["error_message"] == SimulationJobQueue.INTERRUPTED_MESSAGE
+    assert database.status("sim_running00002") == "running"
+    assert database.status("sim_complete0001") == "completed"
+
+
+def test_run_job_holds_no_session_while_simulating():
+    """
+    Test a job is claimed, simulated without a database session, then stored
+
+    Expected:
+    - No session is open during the simulation
+    - The job ends completed with its results
+    - A job queued twice is run once
+    """
+    database = StubDatabase({"sim_pending00001": {"status": "pending", "request_payload": REQUEST_PAYLOAD}})
+    queue = make_queue(database)
+    sessions_during_simulation = []
+
+    async def simulate(request):
+        sessions_during_simulation.append(database.sessions_open)
+        return {"final_portfolio_value": {"mean": 1.0}}
+
+    queue._simulate = simulate
+    asyncio.run(queue._run_job("sim_pending00001"))
+    asyncio.run(queue._run_job("sim_pending00001"))
+
+    job = database.jobs["sim_pending00001"]
+    assert sessions_during_simulation == [0]
+    assert job["status"] == "completed"
+    assert job["results"] == {"final_portfolio_value": {"mean": 1.0}}
+
+
+def test_run_job_keeps_status_of_job_failed_meanwhile():
+    """
+    Test the outcome is not written over a job no longer running
+
+    Expected:
+    - A job marked failed during its simulation stays failed
+    """
+    database = StubDatabase({"sim_pending00001": {"status": "pending", "request_payload": REQUEST_PAYLOAD}})
+    queue = make_queue(database)
+
+    async def simulate(request):
+        database.jobs["sim_pending00001"]["status"] = "failed"
+        return {"final_portfolio_value": {"mean": 1.0}}
+
+    queue._simulate = simulate
+    asyncio.run(queue._run_job("sim_pending00001"))
+
+    assert database.status("sim_pending00001") == "failed"
+    assert "results" not in database.jobs["sim_pending00001"]
+
+
+# ============================================================================
+# JOB RESPONSE TESTS
+# ============================================================================
+
+def test_job_response_for_completed_job():
+    """
+    Test conversion of a completed job to its API response
+
+    Expected:
+    - simulation_id, status and results are carried over
+    - Job is finished and not expired
+    """
+    now = datetime.now(timezone.utc)
+    job = SimulationJob(
+        id="sim_abc123def456",
+        user_id=1,
+        api_key="mk_live_" + "a" * 24,
+        status="completed",
+        request_payload={},
+        results={"final_portfolio_value": {"mean": 1.0}},
+        execution_time_seconds=0.5,
+        created_at=now,
+        started_at=now,
+        completed_at=now,
+        expires_at=now + timedelta(hours=24)
+    )
+
+    response = SimulationJobService.to_response(job)
+
+    assert response.simulation_id == "sim_abc123def456"
+    assert response.status == "completed"
+    assert response.results == {"final_portfolio_value": {"mean": 1.0}}
+    assert job.is_finished
+    assert not job.is_expired
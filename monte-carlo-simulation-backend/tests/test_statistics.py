@@ -0,0 +1,99 @@
+"""
+Statistics Engine Tests
+Test single-pass statistics against NumPy reference values (no database required)
+"""
+
+import numpy as np
+import pytest
+
+from app.services import statistics
+
+
+# ============================================================================
+# SUMMARY STATISTICS TESTS
+# ============================================================================
+
+def test_summarize_matches_numpy_reference():
+    """
+    Test fused statistics equal the separate NumPy computations
+
+    Expected:
+    - Percentiles, moments, CVaR and probabilities match NumPy
+    """
+    values = np.random.default_rng(3).lognormal(np.log(1e6), 0.4, 100000)
+    S0 = 1e6
+
+    stats = statistics.summarize(values, S0)
+
+    for p in statistics.PERCENTILES:
+        assert stats['percentiles'][f"p{p}"] == pytest.approx(np.percentile(values, p), rel=1e-12)
+    assert stats['median'] == pytest.approx(np.median(values), rel=1e-12)
+    assert stats['mean'] == pytest.approx(np.mean(values), rel=1e-12)
+    assert stats['std_deviation'] == pytest.approx(np.std(values), rel=1e-9)
+    assert stats['min'] == values.min()
+    assert stats['max'] == values.max()
+    assert stats['var_95'] == stats['percentiles']['p5']
+    assert stats['cvar_95'] == pytest.approx(values[values <= stats['var_95']].mean(), rel=1e-12)
+    assert stats['cvar_99'] == pytest.approx(values[values <= stats['var_99']].mean(), rel=1e-12)
+    assert stats['probability_of_loss'] == pytest.approx(np.mean(values < S0), abs=1e-12)
+    assert stats['probability_of_positive_return'] == pytest.approx(np.mean(values > S0), abs=1e-12)
+    assert stats['probability_of_doubling'] == pytest.approx(np.mean(values >= 2 * S0), abs=1e-12)
+
+
+def test_summarize_constant_values():
+    """
+    Test degenerate distribution (all paths equal)
+
+    Expected:
+    - Zero standard deviation, CVaR equals the value, no loss or gain
+    """
+    stats = statistics.summarize(np.full(1000, 5.0), 5.0)
+
+    assert stats['std_deviation'] == 0.0
+    assert stats['cvar_99'] == 5.0
+    assert stats['probability_of_loss'] == 0.0
+    assert stats['probability_of_positive_return'] == 0.0
+
+
+# ============================================================================
+# STANDARD ERROR / VARIANCE REDUCTION TESTS
+# ============================================================================
+
+def test_standard_errors_match_iid_formulas():
+    """
+    Test standard errors without variance reduction
+
+    Expected:
+    - Mean: s / sqrt(N); probability: sqrt(p(1 - p) / N)
+    - VaR standard error is positive and small relative to VaR
+    """
+    values = np.random.default_rng(5).lognormal(np.log(1e6), 0.4, 50000)
+    stats = statistics.summarize(values, 1e6)
+    errors = stats['standard_errors']
+    p = stats['probability_of_loss']
+
+    assert errors['mean'] == pytest.approx(np.std(values, ddof=1) / np.sqrt(50000), rel=1e-6)
+    assert errors['probability_of_loss'] == pytest.approx(np.sqrt(p * (1 - p) / 50000), rel=1e-3)
+    assert 0 < errors['var_95'] < 0.01 * stats['var_95']
+
+
+def test_control_variate_reduces_standard_error():
+    """
+    Test control variate adjustment with a correlated control
+
+    Expected:
+    - Standard errors of mean and probability of loss shrink
+    - Mean estimate moves toward the true mean of values
+    """
+    rng = np.random.default_rng(9)
+    Z = rng.standard_normal(20000)
+    controls = np.exp(0.3 * Z)
+    values = 1e6 * controls + 5e4 * rng.standard_normal(20000)
+    control_mean = np.exp(0.045)
+
+    plain = statistics.summarize(values, 1e6)
+    adjusted = statistics.summarize(values, 1e6, controls=controls, control_mean=control_mean)
+
+    assert adjusted['standard_errors']['mean'] < 0.2 * plain['standard_errors']['mean']
+    assert adjusted['standard_errors']['probability_of_loss'] < plain['standard_errors']['probability_of_loss']
+    assert abs(adjusted['mean'] - 1e6 * control_mean) < 4 * adjusted['standard_errors']['mean']
@@ -0,0 +1,127 @@
+"""
+User Status Cache Tests
+Test cached JWT authentication and signed-claims mode (no database required)
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import inspect
+
+from app.middleware.auth_middleware import get_current_user
+from app.models.user import User
+from app.services.user_status_cache import UserStatusCache
+from app.utils.security import create_access_token
+
+
+def make_cache(ttl_seconds: float = 30.0, max_entries: int = 100) -> UserStatusCache:
+    """Build an enabled cache"""
+    return UserStatusCache(enabled=True, ttl_seconds=ttl_seconds, max_entries=max_entries)
+
+
+def make_user(user_id: int = 1, status: str = "active") -> User:
+    """Build a user as loaded from the database"""
+    return User(
+        id=user_id,
+        email=f"user{user_id}@example.com",
+        password_hash="$2b$12$hash",
+        full_name="Test User",
+        status=status,
+        created_at=datetime.now(timezone.utc)
+    )
+
+
+def bearer(user_id: int = 1) -> HTTPAuthorizationCredentials:
+    """Authorization credentials with a valid JWT for a user"""
+    token = create_access_token({"user_id": user_id, "email": f"user{user_id}@example.com"})
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+# ============================================================================
+# CACHE TESTS
+# ============================================================================
+
+def test_cached_user_is_served_until_ttl():
+    """
+    Test hits within the TTL and a miss afterwards
+
+    Expected:
+    - Detached copy without password hash returned on hit
+    - Entry dropped once the TTL has elapsed
+    """
+    cache = make_cache(ttl_seconds=0.05)
+    user = make_user()
+
+    snapshot = cache.put(user)
+
+    assert cache.get(user.id) is snapshot
+    assert snapshot is not user and snapshot.password_hash is None
+    assert snapshot.email == user.email
+    time.sleep(0.1)
+    assert cache.get(user.id) is None
+    assert cache.get_stats() == {"entries": 0, "hits": 1, "misses": 1}
+
+
+def test_orm_update_invalidates(monkeypatch):
+    """
+    Test the invalidation hook on User updates
+
+    Expected:
+    - after_update on a User drops its cache entry, other users stay cached
+    """
+    cache = make_cache()
+    monkeypatch.setattr("app.services.user_status_cache.user_status_cache", cache)
+    suspended, other = make_user(1), make_user(2)
+    cache.put(suspended)
+    cache.put(other)
+
+    mapper = User.__mapper__
+    # What a flush emits after writing the row
+    mapper.dispatch.after_update(mapper, None, inspect(suspended))
+
+    assert cache.get(1) is None
+    assert cache.get(2) is not None
+
+
+# ============================================================================
+# GET CURRENT USER TESTS
+# ============================================================================
+
+def test_get_current_user_uses_cache(monkeypatch):
+    """
+    Test JWT authentication from the cache
+
+    Expected:
+    - Cached active user returned without a database session
+    - Cached suspended user rejected with 403
+    """
+    cache = make_cache()
+    monkeypatch.setattr("app.services.auth_service.user_status_cache", cache)
+    active = cache.put(make_user(1))
+    cache.put(make_user(2, status="suspended"))
+
+    assert asyncio.run(get_current_user(bearer(1), db=None)) is active
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(get_current_user(bearer(2), db=None))
+    assert exc_info.value.status_code == 403
+
+
+def test_signed_claims_mode_skips_lookup(monkeypatch):
+    """
+    Test JWT_TRUST_CLAIMS
+
+    Expected:
+    - User built from the token claims, no cache or database access
+    """
+    cache = make_cache()
+    monkeypatch.setattr("app.services.auth_service.user_status_cache", cache)
+    monkeypatch.setattr("app.middleware.auth_middleware.settings.JWT_TRUST_CLAIMS", True)
+
+    user = asyncio.run(get_current_user(bearer(7), db=None))
+
+    assert (user.id, user.email, user.status) == (7, "user7@example.com", "active")
+    assert cache.get_stats()["misses"] == 0